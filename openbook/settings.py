@@ -109,6 +109,7 @@ INSTALLED_APPS = [
     'imagekit',
     'django_media_fixtures',
     'cacheops',
+    'django_rq',
     'django_extensions',
     'openbook_common',
     'openbook_auth',
@@ -116,6 +117,7 @@ INSTALLED_APPS = [
     'openbook_circles',
     'openbook_connections',
     'openbook_importer',
+    'openbook_exporter',
     'openbook_lists',
     'openbook_follows',
     'openbook_communities',
@@ -124,6 +126,7 @@ INSTALLED_APPS = [
     'openbook_categories',
     'openbook_notifications',
     'openbook_devices',
+    'openbook_uploads',
 ]
 
 MIDDLEWARE = [
@@ -197,9 +200,12 @@ CACHEOPS = {
 RQ_QUEUES = {
     'high': {
         'USE_REDIS_CACHE': 'rq-queues',
+        # Jobs run right away within the tests
+        'ASYNC': not TESTING,
     },
     'low': {
         'USE_REDIS_CACHE': 'rq-queues',
+        'ASYNC': not TESTING,
     },
 }
 
@@ -385,10 +391,16 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 USERNAME_MAX_LENGTH = 30
 USER_MAX_FOLLOWS = int(os.environ.get('USER_MAX_FOLLOWS', '1500'))
 USER_MAX_CONNECTIONS = int(os.environ.get('USER_MAX_CONNECTIONS', '1500'))
+# The most users followed, unfollowed or assigned lists by a single bulk follows request
+BULK_FOLLOWS_MAX_USERS = int(os.environ.get('BULK_FOLLOWS_MAX_USERS', '500'))
 USER_MAX_COMMUNITIES = 200
 POST_MAX_LENGTH = 1120
 POST_COMMENT_MAX_LENGTH = 560
 POST_IMAGE_MAX_SIZE = int(os.environ.get('POST_IMAGE_MAX_SIZE', '10485760'))
+IMAGE_RENDITIONS_WEBP_ENABLED = os.environ.get('IMAGE_RENDITIONS_WEBP_ENABLED', 'False') == 'True'
+MEDIA_GC_BATCH_SIZE = int(os.environ.get('MEDIA_GC_BATCH_SIZE', '1000'))
+# Presigned media urls are cached until this many seconds before their signature expires
+SIGNED_MEDIA_URL_CACHE_MARGIN = int(os.environ.get('SIGNED_MEDIA_URL_CACHE_MARGIN', '600'))
 PASSWORD_MIN_LENGTH = 10
 PASSWORD_MAX_LENGTH = 100
 CIRCLE_MAX_LENGTH = 100
@@ -417,7 +429,54 @@ CATEGORY_TITLE_MAX_LENGTH = 64
 CATEGORY_DESCRIPTION_MAX_LENGTH = 64
 DEVICE_NAME_MAX_LENGTH = 32
 DEVICE_UUID_MAX_LENGTH = 64
+UPLOAD_FILENAME_MAX_LENGTH = 255
+UPLOAD_CHUNK_MAX_SIZE = int(os.environ.get('UPLOAD_CHUNK_MAX_SIZE', '8388608'))
+POST_VIDEO_UPLOAD_MAX_SIZE = int(os.environ.get('POST_VIDEO_UPLOAD_MAX_SIZE', '524288000'))
+IMPORT_ARCHIVE_UPLOAD_MAX_SIZE = int(os.environ.get('IMPORT_ARCHIVE_UPLOAD_MAX_SIZE', '1000000000'))
+# Where the chunks of the resumable uploads are appended, must be shared by every API and RQ worker
+UPLOADS_DIRECTORY = os.environ.get('UPLOADS_DIRECTORY', './uploads')
+# Uploads neither finalized nor used within this many seconds are deleted by the delete_expired_uploads command
+UPLOAD_EXPIRY = int(os.environ.get('UPLOAD_EXPIRY', '86400'))
+IMPORT_BATCH_SIZE = int(os.environ.get('IMPORT_BATCH_SIZE', '100'))
+# Processes checking and downsizing the media of an import, 1 to do it within the job
+IMPORT_MEDIA_MAX_WORKERS = int(os.environ.get('IMPORT_MEDIA_MAX_WORKERS', '4'))
+# Imported images are downsized to the size of their biggest rendition
+IMPORT_IMAGE_MAX_DIMENSION = 2048
+POSTS_BULK_CREATE_BATCH_SIZE = 500
+INVITES_BULK_CREATE_BATCH_SIZE = int(os.environ.get('INVITES_BULK_CREATE_BATCH_SIZE', '1000'))
+# Ids of users whose invites the allocate_invites command updates at once, in a transaction
+INVITES_ALLOCATION_BATCH_SIZE = int(os.environ.get('INVITES_ALLOCATION_BATCH_SIZE', '5000'))
+# Threads uploading the images of posts created in bulk, e.g. by imports
+POST_IMAGES_STORE_MAX_WORKERS = int(os.environ.get('POST_IMAGES_STORE_MAX_WORKERS', '8'))
+IMPORT_ERROR_MAX_LENGTH = 255
+# Imports pending or running without progress for this many seconds are queued again by the resume_imports command
+IMPORT_STALL_TIMEOUT = int(os.environ.get('IMPORT_STALL_TIMEOUT', '900'))
+# Rows of a relation fetched and serialized at once by the data export job
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', '500'))
+# Bytes of a media file copied at once from the storage into an export archive
+EXPORT_MEDIA_CHUNK_SIZE = int(os.environ.get('EXPORT_MEDIA_CHUNK_SIZE', '1048576'))
+# Exports older than this many seconds are deleted along with their archive by the delete_expired_exports command
+EXPORT_EXPIRY = int(os.environ.get('EXPORT_EXPIRY', '604800'))
+# Exports pending or running for this many seconds are queued again by the resume_exports command, and no longer hold
+# back a new export of their creator
+EXPORT_STALL_TIMEOUT = int(os.environ.get('EXPORT_STALL_TIMEOUT', '3600'))
+# Users repaired at once, in a transaction, by the fix_user_missing_related_items command
+USER_REPAIR_BATCH_SIZE = int(os.environ.get('USER_REPAIR_BATCH_SIZE', '1000'))
+# Rows of a table deleted at once by the job deleting a user
+USER_DELETION_BATCH_SIZE = int(os.environ.get('USER_DELETION_BATCH_SIZE', '500'))
+# Users deletions without progress for this many seconds are queued again by the resume_users_deletions command
+USER_DELETION_STALL_TIMEOUT = int(os.environ.get('USER_DELETION_STALL_TIMEOUT', '900'))
 SEARCH_QUERIES_MAX_LENGTH = 120
+BATCH_MAX_REQUESTS = int(os.environ.get('BATCH_MAX_REQUESTS', '10'))
+# sqlite test databases are not shared across threads, batched requests run sequentially there
+BATCH_MAX_WORKERS = 1 if IS_BUILD or TESTING else int(os.environ.get('BATCH_MAX_WORKERS', '4'))
+# Tests roll back their rows without any signal, so reference tables are reloaded on every lookup there
+REFERENCE_CACHE_ENABLED = not TESTING
+# Redis sets of the taken usernames and emails, answering the lookups of free names without querying the database.
+# Tests roll back their rows without any signal, so the sets would outlive them.
+TAKEN_NAMES_INDEX_ENABLED = not TESTING and os.environ.get('TAKEN_NAMES_INDEX_ENABLED', 'True') == 'True'
+# Names added at once to the taken names indexes by the build_taken_names_indexes command
+TAKEN_NAMES_INDEX_BATCH_SIZE = int(os.environ.get('TAKEN_NAMES_INDEX_BATCH_SIZE', '5000'))
 FEATURE_VIDEO_POSTS_ENABLED = os.environ.get('FEATURE_VIDEO_POSTS_ENABLED', 'True') == 'True'
 FEATURE_IMPORTER_ENABLED = os.environ.get('FEATURE_IMPORTER_ENABLED', 'True') == 'True'
 
@@ -428,6 +487,13 @@ AWS_SES_REGION = os.environ.get('AWS_SES_REGION')
 AWS_ACCESS_KEY_ID = os.environ.get('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY')
 SERVICE_EMAIL_ADDRESS = os.environ.get('SERVICE_EMAIL_ADDRESS')
+INVITE_EMAILS_BATCH_SIZE = int(os.environ.get('INVITE_EMAILS_BATCH_SIZE', '100'))
+# Threads sending the invite emails, each over its own email backend connection
+INVITE_EMAILS_MAX_WORKERS = int(os.environ.get('INVITE_EMAILS_MAX_WORKERS', '8'))
+# Emails per second across all the threads, the SES maximum send rate of the account
+INVITE_EMAILS_MAX_RATE = float(os.environ.get('INVITE_EMAILS_MAX_RATE', '14'))
+# Seconds each send takes with the openbook_invitations.mail_backends.StandInEmailBackend
+EMAIL_STAND_IN_LATENCY = 0
 EMAIL_HOST = os.environ.get('EMAIL_HOST')
 
 # AWS Storage config
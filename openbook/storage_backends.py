@@ -1,7 +1,35 @@
 from botocore.config import Config
 from django.conf import settings
+from django.core.cache import cache
 from storages.backends.s3boto3 import S3Boto3Storage
 
+# The most keys S3 accepts in a single DeleteObjects request
+S3_DELETE_OBJECTS_MAX_KEYS = 1000
+
+
+class S3BatchDeleteMixin:
+    def delete_many(self, names):
+        """
+        Deletes the given files with as few DeleteObjects requests as possible, returns the names which failed
+        """
+        names = list(names)
+        failed_names = []
+
+        for start in range(0, len(names), S3_DELETE_OBJECTS_MAX_KEYS):
+            names_by_key = {
+                self._encode_name(self._normalize_name(self._clean_name(name))): name
+                for name in names[start:start + S3_DELETE_OBJECTS_MAX_KEYS]
+            }
+
+            response = self.bucket.delete_objects(Delete={
+                'Objects': [{'Key': key} for key in names_by_key.keys()],
+                'Quiet': True
+            })
+
+            failed_names.extend([names_by_key[error['Key']] for error in response.get('Errors', [])])
+
+        return failed_names
+
 
 class S3StaticStorage(S3Boto3Storage):
     location = settings.AWS_STATIC_LOCATION
@@ -13,7 +41,51 @@ class S3StaticStorage(S3Boto3Storage):
         super().__init__(*args, **kwargs)
 
 
-class S3PublicMediaStorage(S3Boto3Storage):
+class S3BatchUrlsMixin:
+    def urls(self, names):
+        """
+        The urls of the given files as a {name: url} dict
+        """
+        return {name: self.url(name) for name in names}
+
+
+class S3SignedUrlsCacheMixin:
+    """
+    Caches the presigned urls in Redis until SIGNED_MEDIA_URL_CACHE_MARGIN seconds before their signature expires,
+    so every worker hands out the same url instead of signing a new one per field per request
+    """
+
+    def url(self, name, parameters=None, expire=None):
+        if parameters or expire is not None:
+            return super().url(name, parameters=parameters, expire=expire)
+
+        return self.urls([name])[name]
+
+    def urls(self, names):
+        names = set(names)
+        cache_keys = {self._make_signed_url_cache_key(name): name for name in names}
+
+        cached_urls = cache.get_many(cache_keys.keys())
+
+        urls = {cache_keys[cache_key]: url for cache_key, url in cached_urls.items()}
+        signed_urls = {}
+
+        for cache_key, name in cache_keys.items():
+            if name not in urls:
+                url = urls[name] = super().url(name)
+                signed_urls[cache_key] = url
+
+        if signed_urls:
+            cache.set_many(signed_urls,
+                           timeout=max(self.querystring_expire - settings.SIGNED_MEDIA_URL_CACHE_MARGIN, 0))
+
+        return urls
+
+    def _make_signed_url_cache_key(self, name):
+        return 'signed_media_url:%s' % self._normalize_name(self._clean_name(name))
+
+
+class S3PublicMediaStorage(S3BatchUrlsMixin, S3BatchDeleteMixin, S3Boto3Storage):
     location = settings.AWS_PUBLIC_MEDIA_LOCATION
     file_overwrite = False
 
@@ -24,7 +96,7 @@ class S3PublicMediaStorage(S3Boto3Storage):
         super().__init__(*args, **kwargs)
 
 
-class S3PrivateMediaStorage(S3Boto3Storage):
+class S3PrivateMediaStorage(S3SignedUrlsCacheMixin, S3BatchDeleteMixin, S3Boto3Storage):
     location = settings.AWS_PRIVATE_MEDIA_LOCATION
     default_acl = 'private'
     file_overwrite = False
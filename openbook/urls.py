@@ -29,8 +29,8 @@ from openbook_auth.views.following.views import Followings, SearchFollowings
 from openbook_auth.views.linked_users.views import LinkedUsers, SearchLinkedUsers
 from openbook_auth.views.users.views import SearchUsers, GetUser, BlockUser, UnblockUser
 from openbook_categories.views import Categories
-from openbook_circles.views import Circles, CircleItem, CircleNameCheck
-from openbook_common.views import Time, Health, EmojiGroups
+from openbook_circles.views import Circles, CircleItem, CircleNameCheck, CircleUsers
+from openbook_common.views import Time, Health, EmojiGroups, Batch
 from openbook_communities.views.communities.views import Communities, TrendingCommunities, CommunityNameCheck, \
     FavoriteCommunities, SearchCommunities, JoinedCommunities, AdministratedCommunities, ModeratedCommunities, \
     SearchJoinedCommunities
@@ -48,14 +48,17 @@ from openbook_connections.views import ConnectWithUser, Connections, DisconnectF
     ConfirmConnection
 from openbook_invitations.views import UserInvite, UserInvites, SearchUserInvites, SendUserInviteEmail
 from openbook_devices.views import Devices, DeviceItem
-from openbook_follows.views import Follows, FollowUser, UnfollowUser, UpdateFollowUser
-from openbook_lists.views import Lists, ListItem, ListNameCheck
+from openbook_follows.views import Follows, FollowUser, UnfollowUser, UpdateFollowUser, BulkFollowUsers, \
+    BulkUnfollowUsers, BulkUpdateFollowUsers
+from openbook_lists.views import Lists, ListItem, ListNameCheck, ListUsers
 from openbook_notifications.views import Notifications, NotificationItem, ReadNotifications, ReadNotification
 from openbook_posts.views.post.views import PostComments, PostCommentItem, PostItem, PostReactions, PostReactionItem, \
     PostReactionsEmojiCount, PostReactionEmojiGroups, MutePost, UnmutePost, PostCommentsDisable, PostCommentsEnable, \
     PostOpen, PostClose
 from openbook_posts.views.posts.views import Posts, TrendingPosts
-from openbook_importer.views import ImportItem
+from openbook_importer.views import ImportItem, ImportProgress
+from openbook_exporter.views import Exports, ExportItem
+from openbook_uploads.views import Uploads, UploadItem, FinalizeUpload
 
 auth_auth_patterns = [
     path('register/', Register.as_view(), name='register-user'),
@@ -218,16 +221,26 @@ connections_patterns = [
     path('update/', UpdateConnection.as_view(), name='update-connection'),
 ]
 
+circle_patterns = [
+    path('', CircleItem.as_view(), name='circle'),
+    path('users/', CircleUsers.as_view(), name='circle-users'),
+]
+
 circles_patterns = [
     path('', Circles.as_view(), name='circles'),
     path('name-check/', CircleNameCheck.as_view(), name='circle-name-check'),
-    path('<int:circle_id>/', CircleItem.as_view(), name='circle'),
+    path('<int:circle_id>/', include(circle_patterns)),
+]
+
+list_patterns = [
+    path('', ListItem.as_view(), name='list'),
+    path('users/', ListUsers.as_view(), name='list-users'),
 ]
 
 lists_patterns = [
     path('', Lists.as_view(), name='lists'),
     path('name-check/', ListNameCheck.as_view(), name='list-name-check'),
-    path('<int:list_id>/', ListItem.as_view(), name='list'),
+    path('<int:list_id>/', include(list_patterns)),
 ]
 
 follows_patterns = [
@@ -235,10 +248,19 @@ follows_patterns = [
     path('follow/', FollowUser.as_view(), name='follow-user'),
     path('unfollow/', UnfollowUser.as_view(), name='unfollow-user'),
     path('update/', UpdateFollowUser.as_view(), name='update-follow'),
+    path('bulk/follow/', BulkFollowUsers.as_view(), name='bulk-follow-users'),
+    path('bulk/unfollow/', BulkUnfollowUsers.as_view(), name='bulk-unfollow-users'),
+    path('bulk/update/', BulkUpdateFollowUsers.as_view(), name='bulk-update-follows'),
 ]
 
 importer_patterns = [
-    path('upload/', ImportItem.as_view(), name='uploads')
+    path('upload/', ImportItem.as_view(), name='uploads'),
+    path('<uuid:import_uuid>/', ImportProgress.as_view(), name='import-progress'),
+]
+
+exports_patterns = [
+    path('', Exports.as_view(), name='exports'),
+    path('<uuid:export_uuid>/', ExportItem.as_view(), name='export'),
 ]
 
 categories_patterns = [
@@ -261,6 +283,16 @@ devices_patterns = [
     path('<str:device_uuid>/', DeviceItem.as_view(), name='device'),
 ]
 
+upload_patterns = [
+    path('', UploadItem.as_view(), name='resumable-upload'),
+    path('finalize/', FinalizeUpload.as_view(), name='finalize-resumable-upload'),
+]
+
+uploads_patterns = [
+    path('', Uploads.as_view(), name='resumable-uploads'),
+    path('<uuid:upload_uuid>/', include(upload_patterns)),
+]
+
 invites_patterns = [
     path('', UserInvites.as_view(), name='invites'),
     path('search/', SearchUserInvites.as_view(), name='search-invites'),
@@ -280,8 +312,11 @@ api_patterns = [
     path('notifications/', include(notifications_patterns)),
     path('devices/', include(devices_patterns)),
     path('invites/', include(invites_patterns)),
+    path('uploads/', include(uploads_patterns)),
+    path('exports/', include(exports_patterns)),
     url('time/', Time.as_view(), name='time'),
     url('emojis/groups/', EmojiGroups.as_view(), name='emoji-groups'),
+    path('batch/', Batch.as_view(), name='batch'),
 ]
 
 if settings.FEATURE_IMPORTER_ENABLED:
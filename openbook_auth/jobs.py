@@ -0,0 +1,17 @@
+from django_rq import job
+
+from openbook_common.utils.model_loaders import get_user_deletion_model
+
+
+@job('low')
+def delete_user(user_deletion_id):
+    """
+    Deletes a deactivated user a chunk of rows at a time, resuming from its progress when re-run
+    """
+    UserDeletion = get_user_deletion_model()
+    user_deletion = UserDeletion.objects.filter(pk=user_deletion_id).select_related('user').first()
+
+    if not user_deletion:
+        return
+
+    user_deletion.process()
@@ -0,0 +1,20 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from openbook_common.utils.taken_names import build_taken_names_indexes
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Builds the Redis indexes of the taken usernames and emails, which answer the lookups of free names ' \
+           'without querying the database once built. Safe to run while the API serves requests.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='The names added to the indexes at once')
+
+    def handle(self, *args, **options):
+        build_taken_names_indexes(batch_size=options['batch_size'])
+
+        logger.info('Built the taken names indexes')
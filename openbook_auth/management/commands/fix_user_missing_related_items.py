@@ -1,11 +1,9 @@
-from django.core.management.base import BaseCommand
 import logging
-import re
-import unicodedata
+import time
+
+from django.core.management.base import BaseCommand
 
-from openbook_auth.models import User, bootstrap_user_circles, bootstrap_user_notifications_settings, \
-    bootstrap_user_profile, bootstrap_user_auth_token
-from openbook_common.utils.model_loaders import get_user_model
+from openbook_auth.repairs import repair_users
 
 logger = logging.getLogger(__name__)
 
@@ -13,49 +11,24 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = 'Fixes missing relationships in the user model'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='The ids of users repaired at once, in a transaction')
+        parser.add_argument('--workers', type=int, default=1, help='The processes repairing disjoint ranges of ids')
+        parser.add_argument('--from-id', type=int, help='The id to resume from, as reported by the progress')
+
     def handle(self, *args, **options):
-        self._fix_missing_circles()
-        self._fix_missing_notifications_settings()
-        self._fix_missing_profile()
-        self._fix_missing_auth_token()
-
-    def _fix_missing_circles(self):
-        users = User.objects.filter(connections_circle__isnull=True).all()
-        users_count = users.count()
-        logger.info('Found %d users with missing circles. Attempting fix.' % users_count)
-
-        for user in users:
-            logger.info('Fixing circles of user with id %d and username %s' % (user.pk, user.username))
-            for connection in user.connections.all():
-                connection.delete()
-
-            for circle in user.circles.all():
-                circle.delete()
-            bootstrap_user_circles(user=user)
-
-    def _fix_missing_notifications_settings(self):
-        users = User.objects.filter(notifications_settings__isnull=True).all()
-        users_count = users.count()
-        logger.info('Found %d users with missing notifications_settings. Attempting fix.' % users_count)
-
-        for user in users:
-            logger.info('Fixing notifications_settings of user with id %d and username %s' % (user.pk, user.username))
-            bootstrap_user_notifications_settings(user=user)
-
-    def _fix_missing_profile(self):
-        users = User.objects.filter(profile__isnull=True).all()
-        users_count = users.count()
-        logger.info('Found %d users with missing profiles.' % users_count)
-
-        for user in users:
-            logger.info('Fixing profile of user with id %d and username %s' % (user.pk, user.username))
-            bootstrap_user_profile(user=user, is_of_legal_age=True, avatar=None, name='Openbook')
-
-    def _fix_missing_auth_token(self):
-        users = User.objects.filter(auth_token__isnull=True).all()
-        users_count = users.count()
-        logger.info('Found %d users with missing auth_tokens.' % users_count)
-
-        for user in users:
-            logger.info('Fixing auth_token of user with id %d and username %s' % (user.pk, user.username))
-            bootstrap_user_auth_token(user=user)
+        started = time.perf_counter()
+
+        def log_progress(last_id, scanned_ids_count, counts):
+            elapsed = time.perf_counter() - started
+            logger.info('Repaired the users up to id %d in %.1fs, %.1f ids/s: %s' % (
+                last_id, elapsed, scanned_ids_count / elapsed, self._format_counts(counts)))
+
+        counts = repair_users(first_id=options['from_id'], batch_size=options['batch_size'],
+                              max_workers=options['workers'], on_progress=log_progress)
+
+        self.stdout.write(self.style.SUCCESS('Repaired %s' % self._format_counts(counts)))
+
+    def _format_counts(self, counts):
+        return ', '.join('%d %s' % (counts[repair], repair) for repair in
+                         ('circles', 'notifications_settings', 'profiles', 'auth_tokens'))
@@ -0,0 +1,23 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from openbook_auth.jobs import delete_user
+from openbook_common.utils.model_loaders import get_user_deletion_model
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Queues again the users deletions which made no progress for USER_DELETION_STALL_TIMEOUT, e.g. after a ' \
+           'worker crash'
+
+    def handle(self, *args, **options):
+        UserDeletion = get_user_deletion_model()
+
+        stalled_users_deletions_ids = list(UserDeletion.get_stalled_deletions().values_list('pk', flat=True))
+
+        for user_deletion_id in stalled_users_deletions_ids:
+            delete_user.delay(user_deletion_id)
+
+        logger.info('Queued %d stalled users deletions' % len(stalled_users_deletions_ids))
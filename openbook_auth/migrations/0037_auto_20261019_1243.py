@@ -0,0 +1,25 @@
+# Generated by Django 2.2 on 2026-10-19 10:43
+
+from django.db import migrations
+import openbook_auth.helpers
+import openbook_common.utils.image_renditions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openbook_auth', '0036_auto_20190502_1804'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userprofile',
+            name='avatar',
+            field=openbook_common.utils.image_renditions.RenditionedImageField(null=True, upload_to=openbook_auth.helpers.upload_to_user_avatar_directory, verbose_name='avatar'),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='cover',
+            field=openbook_common.utils.image_renditions.RenditionedImageField(null=True, upload_to=openbook_auth.helpers.upload_to_user_cover_directory, verbose_name='cover'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 2.2 on 2026-10-19 11:47
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openbook_auth', '0037_auto_20261019_1243'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDeletion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('P', 'Pending'), ('R', 'Running')], default='P', max_length=1)),
+                ('step', models.CharField(blank=True, max_length=64, null=True, verbose_name='step')),
+                ('deleted_rows', models.PositiveIntegerField(default=0, verbose_name='deleted rows')),
+                ('created', models.DateTimeField(editable=False)),
+                ('updated', models.DateTimeField(db_index=True, editable=False)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='deletion', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -3,16 +3,16 @@ from datetime import datetime, timedelta
 import re
 import jwt
 import uuid
+from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.auth.validators import UnicodeUsernameValidator, ASCIIUsernameValidator
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
-from django.utils import six
+from django.utils import six, timezone
 from django.template.loader import render_to_string
 from django.utils.translation import ugettext_lazy as _
 from django.conf import settings
-from imagekit.models import ProcessedImageField
 from pilkit.processors import ResizeToFill, ResizeToFit
 from rest_framework.authtoken.models import Token
 from rest_framework.exceptions import ValidationError, NotFound, PermissionDenied, AuthenticationFailed
@@ -23,12 +23,21 @@ from openbook.settings import USERNAME_MAX_LENGTH
 from openbook_auth.helpers import upload_to_user_cover_directory, upload_to_user_avatar_directory
 from openbook_common.models import Badge
 from openbook_common.utils.helpers import delete_file_field
+from openbook_common.utils.media_garbage import bury_media_keys
+from openbook_common.utils.image_renditions import RenditionedImageField, ImageRenditionSpec
 from openbook_common.utils.model_loaders import get_connection_model, get_circle_model, get_follow_model, \
     get_post_model, get_list_model, get_post_comment_model, get_post_reaction_model, \
-    get_emoji_group_model, get_user_invite_model, get_community_model, get_community_invite_model, get_tag_model, \
+    get_user_invite_model, get_community_model, get_community_invite_model, get_tag_model, \
     get_post_comment_notification_model, get_follow_notification_model, get_connection_confirmed_notification_model, \
     get_connection_request_notification_model, get_post_reaction_notification_model, get_device_model, \
-    get_post_mute_model, get_community_invite_notification_model, get_user_block_model, get_emoji_model
+    get_post_mute_model, get_community_invite_notification_model, get_user_block_model, get_emoji_model, \
+    get_community_membership_model, get_upload_model, get_import_model, get_notification_model, \
+    get_post_image_model, get_post_video_model, get_user_deletion_model, get_export_model
+from openbook_common.utils.reference_cache import emojis_reference_cache, emoji_groups_reference_cache
+from openbook_common.utils.resource_versions import bump_resources_versions, make_user_resource, \
+    bump_users_resources_versions, bump_communities_resources_versions
+from openbook_common.utils.taken_names import may_username_be_taken, may_email_be_taken, add_taken_usernames, \
+    add_taken_emails, release_taken_username, release_taken_email
 from openbook_common.validators import name_characters_validator
 from openbook_notifications.push_notifications import senders
 
@@ -72,6 +81,13 @@ class User(AbstractUser):
         verbose_name = _('user')
         verbose_name_plural = _('users')
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super(User, cls).from_db(db, field_names, values)
+        # Compared on save so the taken names indexes are only updated when the names change
+        user._saved_taken_names = (user.__dict__.get('username'), user.__dict__.get('email'))
+        return user
+
     @classmethod
     def create_user(cls, username, email=None, password=None, name=None, avatar=None, is_of_legal_age=None,
                     are_guidelines_accepted=None,
@@ -99,6 +115,9 @@ class User(AbstractUser):
 
     @classmethod
     def is_username_taken(cls, username):
+        if not may_username_be_taken(username):
+            return False
+
         UserInvite = get_user_invite_model()
         user_invites = UserInvite.objects.filter(username=username, created_user=None)
         users = cls.objects.filter(username=username)
@@ -108,6 +127,9 @@ class User(AbstractUser):
 
     @classmethod
     def is_email_taken(cls, email):
+        if not may_email_be_taken(email):
+            return False
+
         try:
             cls.objects.get(email=email)
             return True
@@ -226,7 +248,25 @@ class User(AbstractUser):
 
     def delete_with_password(self, password):
         self._check_password_matches(password=password)
-        self.delete()
+        self._deactivate_for_deletion()
+
+    def _deactivate_for_deletion(self):
+        """
+        Signs the user out for good and leaves the deletion of the rows of the user to a background job, which
+        deletes them a chunk at a time instead of in one big cascade
+        """
+        # Imported here as the jobs import the models
+        from openbook_auth.jobs import delete_user
+
+        self.is_active = False
+        self.save()
+
+        Token.objects.filter(user_id=self.pk).delete()
+
+        UserDeletion = get_user_deletion_model()
+        user_deletion = UserDeletion.create_user_deletion(user=self)
+
+        transaction.on_commit(lambda: delete_user.delay(user_deletion.pk))
 
     def save(self, *args, **kwargs):
         self.full_clean(exclude=['invite_count'])
@@ -262,6 +302,8 @@ class User(AbstractUser):
 
     def update_username(self, username):
         self._check_username_not_taken(username)
+        # Requests to the old username must not get a 304 anymore
+        bump_resources_versions([make_user_resource(self.username)])
         self.username = username
         self.save()
 
@@ -802,36 +844,8 @@ class User(AbstractUser):
             circle_to_update.color = color
 
         if isinstance(usernames, list):
-            # TODO This is a goddamn expensive operation. Improve.
-            new_circle_users = []
-
-            circle_users = circle_to_update.users
-            circle_users_by_username = {}
-
-            for circle_user in circle_users:
-                circle_user_username = circle_user.username
-                circle_users_by_username[circle_user_username] = circle_user
-
-            for username in usernames:
-                user = User.objects.get(username=username)
-                user_exists_in_circle = username in circle_users_by_username
-                if user_exists_in_circle:
-                    # The username added might not be same person we had before
-                    new_circle_users.append(circle_users_by_username[username])
-                else:
-                    new_circle_users.append(user)
-
-            circle_users_to_remove = filter(lambda circle_user: circle_user not in new_circle_users, circle_users)
-
-            for user_to_remove in circle_users_to_remove:
-                self.remove_circle_with_id_from_connection_with_user_with_id(user_to_remove.pk, circle_to_update.pk)
-
-            for new_circle_user in new_circle_users:
-                if not self.is_connected_with_user_with_id_in_circle_with_id(new_circle_user.pk, circle_to_update.pk):
-                    if self.is_connected_with_user_with_id(new_circle_user.pk):
-                        self.add_circle_with_id_to_connection_with_user_with_id(new_circle_user.pk, circle_to_update.pk)
-                    else:
-                        self.connect_with_user_with_id(new_circle_user.pk, circles_ids=[circle_to_update.pk])
+            self._update_circle_with_id_users_with_usernames(circle_id=circle_id, usernames=usernames)
+            circle_to_update.refresh_from_db(fields=['users_count'])
 
         circle_to_update.save()
         return circle_to_update
@@ -854,6 +868,16 @@ class User(AbstractUser):
         self._check_can_get_circle_with_id(circle_id)
         return self.circles.get(id=circle_id)
 
+    def get_users_for_circle_with_id(self, circle_id, max_id=None):
+        self._check_can_get_circle_with_id(circle_id)
+
+        circle_users_query = Q(targeted_connections__user_id=self.pk, targeted_connections__circles__id=circle_id)
+
+        if max_id:
+            circle_users_query.add(Q(id__lt=max_id), Q.AND)
+
+        return User.objects.filter(circle_users_query).select_related('profile')
+
     def favorite_community_with_name(self, community_name):
         self._check_can_favorite_community_with_name(community_name=community_name)
 
@@ -1212,36 +1236,7 @@ class User(AbstractUser):
             list_to_update.emoji_id = emoji_id
 
         if isinstance(usernames, list):
-            # TODO This is a goddamn expensive operation. Improve.
-            new_list_users = []
-
-            list_users = list_to_update.users
-            list_users_by_username = {}
-
-            for list_user in list_users:
-                list_user_username = list_user.username
-                list_users_by_username[list_user_username] = list_user
-
-            for username in usernames:
-                user = User.objects.get(username=username)
-                user_exists_in_list = username in list_users_by_username
-                if user_exists_in_list:
-                    # The username added might not be same person we had before
-                    new_list_users.append(list_users_by_username[username])
-                else:
-                    new_list_users.append(user)
-
-            list_users_to_remove = filter(lambda list_user: list_user not in new_list_users, list_users)
-
-            for user_to_remove in list_users_to_remove:
-                self.remove_list_with_id_from_follow_for_user_with_id(user_to_remove.pk, list_to_update.pk)
-
-            for new_list_user in new_list_users:
-                if not self.is_following_user_with_id_in_list_with_id(new_list_user.pk, list_to_update.pk):
-                    if self.is_following_user_with_id(new_list_user.pk):
-                        self.add_list_with_id_to_follow_for_user_with_id(new_list_user.pk, list_to_update.pk)
-                    else:
-                        self.follow_user_with_id(new_list_user.pk, lists_ids=[list_to_update.pk])
+            self._update_list_with_id_users_with_usernames(list_id=list_id, usernames=usernames)
 
         list_to_update.save()
         return list_to_update
@@ -1250,6 +1245,16 @@ class User(AbstractUser):
         self._check_can_get_list_with_id(list_id)
         return self.lists.get(id=list_id)
 
+    def get_users_for_list_with_id(self, list_id, max_id=None):
+        self._check_can_get_list_with_id(list_id)
+
+        list_users_query = Q(followers__user_id=self.pk, followers__lists__id=list_id)
+
+        if max_id:
+            list_users_query.add(Q(id__lt=max_id), Q.AND)
+
+        return User.objects.filter(list_users_query).select_related('profile')
+
     def search_users_with_query(self, query):
         # In the future, the user might have blocked users which should not be displayed
         users_query = Q(username__icontains=query)
@@ -1370,6 +1375,12 @@ class User(AbstractUser):
         return self.create_encircled_post(text=text, image=image, video=video, circles_ids=[world_circle_id],
                                           created=created)
 
+    def bulk_create_public_posts(self, posts_data, stored_images_names=None):
+        world_circle_id = self._get_world_circle_id()
+        Post = get_post_model()
+        return Post.bulk_create_posts(creator=self, circles_ids=[world_circle_id], posts_data=posts_data,
+                                      stored_images_names=stored_images_names)
+
     def create_encircled_post(self, circles_ids, text=None, image=None, video=None, created=None):
         self._check_can_post_to_circles_with_ids(circles_ids=circles_ids)
         Post = get_post_model()
@@ -1520,7 +1531,8 @@ class User(AbstractUser):
         if not circles_ids and not lists_ids:
             return self._get_timeline_posts_with_no_filters(max_id=max_id, min_id=min_id, count=count)
 
-        return self._get_timeline_posts_with_filters(max_id=max_id, circles_ids=circles_ids, lists_ids=lists_ids)
+        return self._get_timeline_posts_with_filters(max_id=max_id, min_id=min_id, circles_ids=circles_ids,
+                                                     lists_ids=lists_ids)
 
     def _get_timeline_posts_with_filters(self, max_id=None, min_id=None, circles_ids=None, lists_ids=None):
         world_circle_id = self._get_world_circle_id()
@@ -1574,7 +1586,7 @@ class User(AbstractUser):
 
         posts_select_related = ('creator', 'creator__profile', 'community', 'image')
 
-        posts_prefetch_related = ('circles', 'creator__profile__badges')
+        posts_prefetch_related = ('circles', 'creator__profile__badges', 'image__image_renditions')
 
         posts_only = ('text', 'id', 'uuid', 'created', 'image__width', 'image__height', 'image__image',
                       'creator__username', 'creator__id', 'creator__profile__name', 'creator__profile__avatar',
@@ -1587,6 +1599,8 @@ class User(AbstractUser):
 
         if max_id:
             own_posts_query.add(Q(id__lt=max_id), Q.AND)
+        elif min_id:
+            own_posts_query.add(Q(id__gt=min_id), Q.AND)
 
         own_posts_queryset = self.posts.select_related(*posts_select_related).prefetch_related(
             *posts_prefetch_related).only(*posts_only).filter(own_posts_query)
@@ -1598,6 +1612,8 @@ class User(AbstractUser):
 
         if max_id:
             community_posts_query.add(Q(id__lt=max_id), Q.AND)
+        elif min_id:
+            community_posts_query.add(Q(id__gt=min_id), Q.AND)
 
         community_posts_queryset = Post.objects.select_related(*posts_select_related).prefetch_related(
             *posts_prefetch_related).only(*posts_only).filter(community_posts_query)
@@ -1610,6 +1626,8 @@ class User(AbstractUser):
 
         if max_id:
             followed_users_query.add(Q(id__lt=max_id), Q.AND)
+        elif min_id:
+            followed_users_query.add(Q(id__gt=min_id), Q.AND)
 
         followed_users_query.add(
             Q(circles__id=world_circle_id) | Q(circles__connections__target_connection__circles__isnull=False,
@@ -1645,6 +1663,10 @@ class User(AbstractUser):
 
         return follow
 
+    def follow_users_with_usernames(self, usernames, lists_ids=None):
+        users_ids = self._get_users_ids_with_usernames(usernames)
+        return self._follow_users_with_ids(users_ids=users_ids, lists_ids=lists_ids)
+
     def unfollow_user(self, user):
         return self.unfollow_user_with_id(user.pk)
 
@@ -1654,6 +1676,15 @@ class User(AbstractUser):
         self._delete_follow_notification(followed_user_id=user_id)
         follow.delete()
 
+    def unfollow_users_with_usernames(self, usernames):
+        users_ids = self._get_users_ids_with_usernames(usernames)
+        self._check_is_following_users_with_ids(users_ids)
+
+        FollowNotification = get_follow_notification_model()
+        FollowNotification.delete_follow_notifications(follower_id=self.pk, owners_ids=users_ids)
+
+        self.follows.filter(followed_user_id__in=users_ids).delete()
+
     def update_follow_for_user(self, user, lists_ids=None):
         return self.update_follow_for_user_with_id(user.pk, lists_ids=lists_ids)
 
@@ -1673,6 +1704,20 @@ class User(AbstractUser):
 
         return follow
 
+    def update_follows_for_users_with_usernames(self, usernames, lists_ids=None):
+        users_ids = self._get_users_ids_with_usernames(usernames)
+        self._check_is_following_users_with_ids(users_ids)
+
+        if not lists_ids:
+            lists_ids = self._get_default_follow_lists()
+
+        self._check_follow_lists_ids(lists_ids)
+
+        Follow = get_follow_model()
+        Follow.update_follows_lists(user_id=self.pk, followed_users_ids=users_ids, lists_ids=lists_ids)
+
+        return self.follows.filter(followed_user_id__in=users_ids).select_related('followed_user')
+
     def remove_list_with_id_from_follow_for_user_with_id(self, user_id, list_id):
         self._check_is_following_user_with_id(user_id)
         self._check_is_following_user_with_id_in_list_with_id(user_id, list_id)
@@ -1836,6 +1881,72 @@ class User(AbstractUser):
     def delete_devices(self):
         self.devices.all().delete()
 
+    def has_upload_with_uuid(self, upload_uuid):
+        return self.uploads.filter(uuid=upload_uuid).exists()
+
+    def create_upload(self, type, filename, size):
+        Upload = get_upload_model()
+        return Upload.create_upload(creator=self, type=type, filename=filename, size=size)
+
+    def get_upload_with_uuid(self, upload_uuid):
+        self._check_has_upload_with_uuid(upload_uuid=upload_uuid)
+        return self.uploads.get(uuid=upload_uuid)
+
+    def append_chunk_to_upload_with_uuid(self, upload_uuid, offset, chunk_file, chunk_size):
+        self._check_has_upload_with_uuid(upload_uuid=upload_uuid)
+        # Locked so concurrent chunks of the same upload are appended one after the other
+        upload = self.uploads.select_for_update().get(uuid=upload_uuid)
+        upload.append_chunk(offset=offset, chunk_file=chunk_file, chunk_size=chunk_size)
+        return upload
+
+    def finalize_upload_with_uuid(self, upload_uuid):
+        self._check_has_upload_with_uuid(upload_uuid=upload_uuid)
+        upload = self.uploads.select_for_update().get(uuid=upload_uuid)
+        upload.finalize()
+        return upload
+
+    def get_finalized_upload_with_uuid(self, upload_uuid, type):
+        self._check_can_use_upload_with_uuid(upload_uuid=upload_uuid, type=type)
+        return self.uploads.get(uuid=upload_uuid)
+
+    def delete_upload_with_uuid(self, upload_uuid):
+        self._check_has_upload_with_uuid(upload_uuid=upload_uuid)
+        self.uploads.filter(uuid=upload_uuid).delete()
+
+    def has_import_with_uuid(self, import_uuid):
+        return self.imports.filter(uuid=import_uuid).exists()
+
+    def create_import(self, archive=None, upload_uuid=None):
+        Upload = get_upload_model()
+        Import = get_import_model()
+
+        if upload_uuid:
+            self._check_can_import_upload_with_uuid(upload_uuid=upload_uuid)
+            upload = self.uploads.get(uuid=upload_uuid)
+        else:
+            upload = Upload.create_upload_from_file(creator=self, type=Upload.IMPORT_ARCHIVE, file=archive)
+
+        return Import.create_import(creator=self, upload=upload)
+
+    def get_import_with_uuid(self, import_uuid):
+        self._check_has_import_with_uuid(import_uuid=import_uuid)
+        return self.imports.get(uuid=import_uuid)
+
+    def has_export_with_uuid(self, export_uuid):
+        return self.exports.filter(uuid=export_uuid).exists()
+
+    def create_export(self):
+        self._check_can_create_export()
+        Export = get_export_model()
+        return Export.create_export(creator=self)
+
+    def get_exports(self):
+        return self.exports.order_by('-created')
+
+    def get_export_with_uuid(self, export_uuid):
+        self._check_has_export_with_uuid(export_uuid=export_uuid)
+        return self.exports.get(uuid=export_uuid)
+
     def mute_post_with_id(self, post_id):
         Post = get_post_model()
         post = Post.objects.get(pk=post_id)
@@ -2121,6 +2232,156 @@ class User(AbstractUser):
         Circle = get_circle_model()
         return Circle.get_world_circle().pk
 
+    def _update_circle_with_id_users_with_usernames(self, circle_id, usernames):
+        """
+        Diffs the given users against the connections in the circle and applies the difference at once, so the
+        number of queries doesn't grow with the size of the circle. The versions are bumped on saving the circle.
+        """
+        users_ids = self._get_users_ids_with_usernames(usernames)
+
+        ConnectionCircle = get_circle_model().connections.through
+
+        circle_connections_ids_by_user_id = {
+            target_user_id: connection_id for connection_id, target_user_id in
+            ConnectionCircle.objects.filter(circle_id=circle_id).values_list('connection_id',
+                                                                             'connection__target_user_id')
+        }
+
+        removed_connections_ids = [connection_id for target_user_id, connection_id in
+                                   circle_connections_ids_by_user_id.items() if target_user_id not in users_ids]
+
+        if removed_connections_ids:
+            ConnectionCircle.objects.filter(circle_id=circle_id, connection_id__in=removed_connections_ids).delete()
+
+        added_users_ids = users_ids - circle_connections_ids_by_user_id.keys()
+
+        if added_users_ids:
+            connections_ids_by_user_id = dict(
+                self.connections.filter(target_user_id__in=added_users_ids).values_list('target_user_id', 'id'))
+
+            ConnectionCircle.objects.bulk_create([ConnectionCircle(connection_id=connection_id, circle_id=circle_id)
+                                                  for connection_id in connections_ids_by_user_id.values()])
+
+            users_to_connect_ids = added_users_ids - connections_ids_by_user_id.keys()
+
+            if users_to_connect_ids:
+                self._connect_with_users_with_ids(users_ids=users_to_connect_ids, circles_ids=[circle_id])
+
+        if removed_connections_ids or added_users_ids:
+            Circle = get_circle_model()
+            Circle.update_users_counts(circles_query=Q(pk=circle_id))
+
+    def _connect_with_users_with_ids(self, users_ids, circles_ids):
+        """
+        Does what connect_with_user_with_id does for each of the users, with a constant number of queries
+        """
+        users_ids = set(users_ids)
+        self._check_can_connect_with_users_with_ids(users_ids)
+
+        if self.connections_circle_id not in circles_ids:
+            circles_ids = circles_ids + [self.connections_circle_id]
+
+        self._check_connection_circles_ids(circles_ids)
+
+        Connection = get_connection_model()
+        connections = Connection.bulk_create_connections(user_id=self.pk, target_users_ids=users_ids,
+                                                         circles_ids=circles_ids)
+
+        # Automatically follow the users
+        users_to_follow_ids = users_ids - set(
+            self.follows.filter(followed_user_id__in=users_ids).values_list('followed_user_id', flat=True))
+
+        if users_to_follow_ids:
+            self._follow_users_with_ids(users_ids=users_to_follow_ids)
+
+        ConnectionRequestNotification = get_connection_request_notification_model()
+        ConnectionRequestNotification.bulk_create_connection_request_notifications(connection_requester_id=self.pk,
+                                                                                   owners_ids=users_ids)
+
+        users = User.objects.filter(pk__in=users_ids).select_related('notifications_settings').prefetch_related(
+            'devices')
+
+        for user in users:
+            senders.send_connection_request_push_notification(connection_requester=self,
+                                                              connection_requested_for=user)
+
+        return connections
+
+    def _follow_users_with_ids(self, users_ids, lists_ids=None):
+        """
+        Does what follow_user_with_id does for each of the users, with a constant number of queries
+        """
+        users_ids = set(users_ids)
+        self._check_can_follow_users_with_ids(users_ids)
+
+        if not lists_ids:
+            lists_ids = self._get_default_follow_lists()
+
+        self._check_follow_lists_ids(lists_ids)
+
+        Follow = get_follow_model()
+        Follow.bulk_create_follows(user_id=self.pk, followed_users_ids=users_ids, lists_ids=lists_ids)
+
+        # Imported here as the jobs import the models
+        from openbook_notifications.jobs import send_follow_notifications
+
+        following_user_id = self.pk
+        followed_users_ids = list(users_ids)
+
+        # The notifications of all the follows are created and pushed by a single job
+        transaction.on_commit(lambda: send_follow_notifications.delay(following_user_id=following_user_id,
+                                                                      followed_users_ids=followed_users_ids))
+
+        return self.follows.filter(followed_user_id__in=users_ids).select_related('followed_user')
+
+    def _get_users_ids_with_usernames(self, usernames):
+        users_ids = set(User.objects.filter(username__in=usernames).values_list('id', flat=True))
+
+        if len(users_ids) != len(set(usernames)):
+            raise NotFound(
+                _('No user with the provided username exists.'),
+            )
+
+        return users_ids
+
+    def _update_list_with_id_users_with_usernames(self, list_id, usernames):
+        """
+        Diffs the given users against the follows in the list and applies the difference at once, so the number
+        of queries doesn't grow with the size of the list. The list owner versions are bumped on saving the list.
+        """
+        users_ids = self._get_users_ids_with_usernames(usernames)
+
+        ListFollow = get_list_model().follows.through
+
+        list_follows_ids_by_user_id = {
+            followed_user_id: follow_id for follow_id, followed_user_id in
+            ListFollow.objects.filter(list_id=list_id).values_list('follow_id', 'follow__followed_user_id')
+        }
+
+        removed_users_ids = list_follows_ids_by_user_id.keys() - users_ids
+
+        if removed_users_ids:
+            ListFollow.objects.filter(list_id=list_id, follow_id__in=[list_follows_ids_by_user_id[user_id] for
+                                                                      user_id in removed_users_ids]).delete()
+
+        added_users_ids = users_ids - list_follows_ids_by_user_id.keys()
+
+        if added_users_ids:
+            follows_ids_by_user_id = dict(
+                self.follows.filter(followed_user_id__in=added_users_ids).values_list('followed_user_id', 'id'))
+
+            ListFollow.objects.bulk_create([ListFollow(follow_id=follow_id, list_id=list_id)
+                                            for follow_id in follows_ids_by_user_id.values()])
+
+            users_to_follow_ids = added_users_ids - follows_ids_by_user_id.keys()
+
+            if users_to_follow_ids:
+                self._follow_users_with_ids(users_ids=users_to_follow_ids, lists_ids=[list_id])
+
+        # As the m2m_changed receiver would have for the users added to or removed from the list
+        if removed_users_ids or added_users_ids:
+            bump_users_resources_versions(removed_users_ids | added_users_ids)
+
     def _get_default_connection_circles(self):
         """
         If no circles were given on a connection request or confirm,
@@ -2335,18 +2596,20 @@ class User(AbstractUser):
         self._check_can_see_post(post=post)
 
     def _check_can_react_with_emoji_id_and_emoji_group_id(self, emoji_id, emoji_group_id):
-        EmojiGroup = get_emoji_group_model()
-        try:
-            emoji_group = EmojiGroup.objects.get(pk=emoji_group_id, is_reaction_group=True)
-            if not emoji_group.has_emoji_with_id(emoji_id):
-                raise ValidationError(
-                    _('Emoji does not belong to given emoji group.'),
-                )
-        except EmojiGroup.DoesNotExist:
+        emoji_group = emoji_groups_reference_cache.get(id=emoji_group_id)
+
+        if not emoji_group or not emoji_group.is_reaction_group:
             raise ValidationError(
                 _('Emoji group does not exist or is not a reaction group.'),
             )
 
+        emoji = emojis_reference_cache.get(id=emoji_id)
+
+        if not emoji or emoji.group_id != emoji_group.pk:
+            raise ValidationError(
+                _('Emoji does not belong to given emoji group.'),
+            )
+
     def _check_can_react_to_post(self, post):
         self._check_can_see_post(post=post)
 
@@ -2590,6 +2853,12 @@ class User(AbstractUser):
                 _('Not following user in list.'),
             )
 
+    def _check_is_following_users_with_ids(self, users_ids):
+        if self.follows.filter(followed_user_id__in=users_ids).count() != len(users_ids):
+            raise ValidationError(
+                _('Not following user.'),
+            )
+
     def _check_is_following_user_with_id(self, user_id):
         if not self.is_following_user_with_id(user_id):
             raise ValidationError(
@@ -2607,6 +2876,42 @@ class User(AbstractUser):
         self._check_is_not_connected_with_user_with_id(user_id=user_id)
         self._check_has_not_reached_max_connections()
 
+    def _check_can_connect_with_users_with_ids(self, users_ids):
+        if self.pk in users_ids:
+            raise ValidationError(
+                _('A user cannot connect with itself.'),
+            )
+
+        self._check_is_not_blocked_with_users_with_ids(users_ids=users_ids)
+
+        if self.connections.filter(target_user_id__in=users_ids).exists():
+            raise ValidationError(
+                _('Already connected with user.'),
+            )
+
+        if self.count_connections() + len(users_ids) > settings.USER_MAX_CONNECTIONS:
+            raise ValidationError(
+                _('Maximum number of connections reached.'),
+            )
+
+    def _check_can_follow_users_with_ids(self, users_ids):
+        if self.pk in users_ids:
+            raise ValidationError(
+                _('A user cannot follow itself.'),
+            )
+
+        self._check_is_not_blocked_with_users_with_ids(users_ids=users_ids)
+
+        if self.follows.filter(followed_user_id__in=users_ids).exists():
+            raise ValidationError(
+                _('Already following user.'),
+            )
+
+        if self.count_following() + len(users_ids) > settings.USER_MAX_FOLLOWS:
+            raise ValidationError(
+                _('Maximum number of follows reached.'),
+            )
+
     def _check_is_not_connected_with_user_with_id(self, user_id):
         if self.is_connected_with_user_with_id(user_id):
             raise ValidationError(
@@ -3031,6 +3336,52 @@ class User(AbstractUser):
                 _('Device not found'),
             )
 
+    def _check_has_upload_with_uuid(self, upload_uuid):
+        if not self.has_upload_with_uuid(upload_uuid=upload_uuid):
+            raise NotFound(
+                _('Upload not found'),
+            )
+
+    def _check_can_use_upload_with_uuid(self, upload_uuid, type):
+        self._check_has_upload_with_uuid(upload_uuid=upload_uuid)
+
+        if not self.uploads.filter(uuid=upload_uuid, type=type, is_finalized=True).exists():
+            raise ValidationError(
+                _('The upload is not a finalized upload of the right type.'),
+            )
+
+    def _check_has_import_with_uuid(self, import_uuid):
+        if not self.has_import_with_uuid(import_uuid=import_uuid):
+            raise NotFound(
+                _('Import not found'),
+            )
+
+    def _check_has_export_with_uuid(self, export_uuid):
+        if not self.has_export_with_uuid(export_uuid=export_uuid):
+            raise NotFound(
+                _('Export not found'),
+            )
+
+    def _check_can_create_export(self):
+        Export = get_export_model()
+
+        exports_in_progress = self.exports.filter(status__in=[Export.STATUS_PENDING, Export.STATUS_RUNNING]).exclude(
+            pk__in=Export.get_stalled_exports().values('pk'))
+
+        if exports_in_progress.exists():
+            raise ValidationError(
+                _('An export of your data is already in progress.'),
+            )
+
+    def _check_can_import_upload_with_uuid(self, upload_uuid):
+        Upload = get_upload_model()
+        self._check_can_use_upload_with_uuid(upload_uuid=upload_uuid, type=Upload.IMPORT_ARCHIVE)
+
+        if self.imports.filter(upload__uuid=upload_uuid).exists():
+            raise ValidationError(
+                _('The upload is already being imported.'),
+            )
+
     def _check_can_mute_post(self, post):
         if self.has_muted_post_with_id(post_id=post.pk):
             raise ValidationError(
@@ -3087,6 +3438,11 @@ class User(AbstractUser):
         if self.is_blocked_with_user_with_id(user_id=user_id):
             raise PermissionDenied(_('This account is blocked.'))
 
+    def _check_is_not_blocked_with_users_with_ids(self, users_ids):
+        UserBlock = get_user_block_model()
+        if UserBlock.users_are_blocked_with_user(users_ids=users_ids, user_id=self.pk):
+            raise PermissionDenied(_('This account is blocked.'))
+
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='bootstrap_auth_token')
 def create_auth_token(sender, instance=None, created=False, **kwargs):
@@ -3113,12 +3469,21 @@ class UserProfile(models.Model):
     location = models.CharField(_('location'), max_length=settings.PROFILE_LOCATION_MAX_LENGTH, blank=False, null=True)
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
     is_of_legal_age = models.BooleanField(default=False)
-    avatar = ProcessedImageField(verbose_name=_('avatar'), blank=False, null=True, format='JPEG',
-                                 options={'quality': 50}, processors=[ResizeToFill(500, 500)],
-                                 upload_to=upload_to_user_avatar_directory)
-    cover = ProcessedImageField(verbose_name=_('cover'), blank=False, null=True, format='JPEG', options={'quality': 50},
-                                upload_to=upload_to_user_cover_directory,
-                                processors=[ResizeToFit(width=1024, upscale=False)])
+    avatar = RenditionedImageField(verbose_name=_('avatar'), blank=False, null=True,
+                                   upload_to=upload_to_user_avatar_directory,
+                                   renditions=[
+                                       ImageRenditionSpec(name='thumbnail', processors=[ResizeToFill(100, 100)]),
+                                       ImageRenditionSpec(name='full', processors=[ResizeToFill(500, 500)]),
+                                   ], primary_rendition='full')
+    cover = RenditionedImageField(verbose_name=_('cover'), blank=False, null=True,
+                                  upload_to=upload_to_user_cover_directory,
+                                  renditions=[
+                                      ImageRenditionSpec(name='feed',
+                                                         processors=[ResizeToFit(width=1024, upscale=False)]),
+                                      ImageRenditionSpec(name='full',
+                                                         processors=[ResizeToFit(width=2048, upscale=False)]),
+                                  ], primary_rendition='feed')
+    image_renditions = GenericRelation('openbook_common.ImageRendition')
     bio = models.CharField(_('bio'), max_length=settings.PROFILE_BIO_MAX_LENGTH, blank=False, null=True)
     url = models.URLField(_('url'), blank=False, null=True)
     followers_count_visible = models.BooleanField(_('followers count visible'), blank=False, null=False, default=False)
@@ -3197,6 +3562,170 @@ class UserBlock(models.Model):
         return cls.objects.filter(Q(blocked_user_id=user_a_id, blocker_id=user_b_id) | Q(blocked_user_id=user_b_id,
                                                                                          blocker_id=user_a_id)).exists()
 
+    @classmethod
+    def users_are_blocked_with_user(cls, users_ids, user_id):
+        return cls.objects.filter(Q(blocked_user_id__in=users_ids, blocker_id=user_id) |
+                                  Q(blocked_user_id=user_id, blocker_id__in=users_ids)).exists()
+
+
+class UserDeletion(models.Model):
+    """
+    The deletion of a deactivated user, processed by a background job a chunk of rows at a time. The record goes
+    along with the user once it is deleted.
+    """
+    STATUS_PENDING = 'P'
+    STATUS_RUNNING = 'R'
+
+    STATUSES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+    )
+
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='deletion')
+    status = models.CharField(max_length=1, choices=STATUSES, default=STATUS_PENDING, null=False, blank=False)
+    step = models.CharField(_('step'), max_length=64, null=True, blank=True)
+    deleted_rows = models.PositiveIntegerField(_('deleted rows'), null=False, default=0)
+    created = models.DateTimeField(editable=False)
+    updated = models.DateTimeField(editable=False, db_index=True)
+
+    @classmethod
+    def create_user_deletion(cls, user):
+        return cls.objects.create(user=user)
+
+    @classmethod
+    def get_stalled_deletions(cls):
+        """
+        The deletions whose job was lost, e.g. along with a crashed worker
+        """
+        stalled_before = timezone.now() - timedelta(seconds=settings.USER_DELETION_STALL_TIMEOUT)
+        return cls.objects.filter(updated__lt=stalled_before)
+
+    def process(self):
+        """
+        Deletes the rows of the user table by table from the step it stopped at, so a job re-run after a crash
+        resumes where the previous one stopped, and the user last
+        """
+        with transaction.atomic():
+            UserDeletion.objects.select_for_update().filter(pk=self.pk).first()
+            self.status = self.STATUS_RUNNING
+            self.save()
+
+        steps = self._get_steps()
+        steps_names = [step_name for step_name, query_set in steps]
+        first_step = steps_names.index(self.step) if self.step in steps_names else 0
+
+        for step_name, query_set in steps[first_step:]:
+            if self.step != step_name:
+                self.step = step_name
+                self.save()
+
+            while self._delete_chunk(query_set=query_set):
+                pass
+
+        with transaction.atomic():
+            profile = UserProfile.objects.filter(user_id=self.user_id).first()
+
+            if profile:
+                delete_file_field(profile.avatar)
+                delete_file_field(profile.cover)
+
+            self.user.delete()
+
+    def save(self, *args, **kwargs):
+        now = timezone.now()
+        if not self.id:
+            self.created = now
+        self.updated = now
+        return super(UserDeletion, self).save(*args, **kwargs)
+
+    def _get_steps(self):
+        """
+        The rows of the user in the order they are deleted, the rows pointing at the posts of the user go first so
+        deleting a chunk of posts does not cascade to an unbounded number of rows
+        """
+        user_id = self.user_id
+        Notification = get_notification_model()
+        FollowNotification = get_follow_notification_model()
+        ConnectionRequestNotification = get_connection_request_notification_model()
+        ConnectionConfirmedNotification = get_connection_confirmed_notification_model()
+        Device = get_device_model()
+        PostReaction = get_post_reaction_model()
+        PostComment = get_post_comment_model()
+        PostMute = get_post_mute_model()
+        Post = get_post_model()
+        Follow = get_follow_model()
+        Connection = get_connection_model()
+        CommunityInvite = get_community_invite_model()
+        CommunityMembership = get_community_membership_model()
+        Community = get_community_model()
+        UserBlock = get_user_block_model()
+        List = get_list_model()
+        Circle = get_circle_model()
+        Upload = get_upload_model()
+        Import = get_import_model()
+        Export = get_export_model()
+
+        return (
+            ('notifications', Notification.objects.filter(owner_id=user_id)),
+            ('follow_notifications', FollowNotification.objects.filter(follower_id=user_id)),
+            ('connection_request_notifications',
+             ConnectionRequestNotification.objects.filter(connection_requester_id=user_id)),
+            ('connection_confirmed_notifications',
+             ConnectionConfirmedNotification.objects.filter(connection_confirmator_id=user_id)),
+            ('devices', Device.objects.filter(owner_id=user_id)),
+            ('posts_reactions', PostReaction.objects.filter(Q(reactor_id=user_id) | Q(post__creator_id=user_id))),
+            ('posts_comments', PostComment.objects.filter(Q(commenter_id=user_id) | Q(post__creator_id=user_id))),
+            ('posts_mutes', PostMute.objects.filter(Q(muter_id=user_id) | Q(post__creator_id=user_id))),
+            ('posts', Post.objects.filter(creator_id=user_id)),
+            ('communities_posts', Post.objects.filter(community__creator_id=user_id)),
+            ('communities_invites',
+             CommunityInvite.objects.filter(Q(creator_id=user_id) | Q(invited_user_id=user_id))),
+            ('communities_memberships', CommunityMembership.objects.filter(user_id=user_id)),
+            ('communities', Community.objects.filter(creator_id=user_id)),
+            ('follows', Follow.objects.filter(Q(user_id=user_id) | Q(followed_user_id=user_id))),
+            ('connections', Connection.objects.filter(Q(user_id=user_id) | Q(target_user_id=user_id))),
+            ('users_blocks', UserBlock.objects.filter(Q(blocker_id=user_id) | Q(blocked_user_id=user_id))),
+            ('lists', List.objects.filter(creator_id=user_id)),
+            ('circles', Circle.objects.filter(creator_id=user_id)),
+            ('uploads', Upload.objects.filter(creator_id=user_id)),
+            ('imports', Import.objects.filter(creator_id=user_id)),
+            ('exports', Export.objects.filter(creator_id=user_id)),
+        )
+
+    def _delete_chunk(self, query_set):
+        """
+        Deletes the USER_DELETION_BATCH_SIZE rows of lowest ids left along with the progress, returns whether there
+        were any. Deleted through the query set so the rows cascade and fire their signals as usual.
+        """
+        with transaction.atomic():
+            UserDeletion.objects.select_for_update().filter(pk=self.pk).first()
+
+            chunk_ids = list(query_set.order_by('pk').values_list('pk', flat=True)[:settings.USER_DELETION_BATCH_SIZE])
+
+            if not chunk_ids:
+                return False
+
+            Model = query_set.model
+
+            if Model is get_post_model():
+                self._bury_posts_media(posts_ids=chunk_ids)
+
+            deleted_rows, deleted_rows_by_model = Model.objects.filter(pk__in=chunk_ids).delete()
+
+            self.deleted_rows += deleted_rows
+            self.save()
+
+        return True
+
+    def _bury_posts_media(self, posts_ids):
+        """
+        Leaves the images and videos of the posts to the media garbage collection, which deletes them off the
+        storage. Their renditions are buried as they cascade.
+        """
+        for Model, field_name in ((get_post_image_model(), 'image'), (get_post_video_model(), 'video')):
+            keys = Model.objects.filter(post_id__in=posts_ids).values_list(field_name, flat=True)
+            bury_media_keys(field=Model._meta.get_field(field_name), keys=list(keys))
+
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='bootstrap_notifications_settings')
 def create_user_notifications_settings(sender, instance=None, created=False, **kwargs):
@@ -3207,6 +3736,71 @@ def create_user_notifications_settings(sender, instance=None, created=False, **k
         bootstrap_user_notifications_settings(instance)
 
 
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL, dispatch_uid='bump_user_versions')
+def bump_user_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the user
+    """
+    bump_resources_versions([make_user_resource(instance.username)])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='add_user_taken_names')
+def add_user_taken_names(sender, instance=None, created=False, **kwargs):
+    """"
+    Add the username and email of the user to the taken names indexes when new or changed, releasing the former ones
+    """
+    saved_username, saved_email = getattr(instance, '_saved_taken_names', (None, None))
+
+    if created or instance.username != saved_username:
+        release_taken_username(saved_username)
+        add_taken_usernames([instance.username])
+
+    if created or instance.email != saved_email:
+        release_taken_email(saved_email)
+        add_taken_emails([instance.email])
+
+    instance._saved_taken_names = (instance.username, instance.email)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid='release_user_taken_names')
+def release_user_taken_names(sender, instance=None, **kwargs):
+    """"
+    Release the username and email of the deleted user from the taken names indexes
+    """
+    release_taken_username(instance.username)
+    release_taken_email(instance.email)
+
+
+@receiver([post_save, post_delete], sender=UserProfile, dispatch_uid='bump_user_profile_versions')
+def bump_user_profile_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the user and of the communities listing the user as staff
+    """
+    bump_users_resources_versions([instance.user_id])
+
+    CommunityMembership = get_community_membership_model()
+    staff_communities_ids = CommunityMembership.objects.filter(
+        Q(is_administrator=True) | Q(is_moderator=True), user_id=instance.user_id).values('community_id')
+    bump_communities_resources_versions(staff_communities_ids)
+
+
+@receiver(m2m_changed, sender=UserProfile.badges.through, dispatch_uid='bump_user_profile_badges_versions')
+def bump_user_profile_badges_versions(sender, instance=None, action=None, reverse=False, **kwargs):
+    """"
+    Invalidate the ETags of the users whose badges changed
+    """
+    if not reverse and action in ('post_add', 'post_remove', 'post_clear'):
+        bump_users_resources_versions([instance.user_id])
+
+
+@receiver([post_save, post_delete], sender=UserBlock, dispatch_uid='bump_user_block_versions')
+def bump_user_block_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of both blocked users
+    """
+    bump_users_resources_versions([instance.blocker_id, instance.blocked_user_id])
+
+
 def bootstrap_user_circles(user):
     Circle = get_circle_model()
     Circle.bootstrap_circles_for_user(user)
@@ -0,0 +1,147 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+from rest_framework.authtoken.models import Token
+
+from openbook_auth.models import UserNotificationsSettings, UserProfile
+from openbook_common.utils.model_loaders import get_user_model, get_circle_model, get_connection_model
+from openbook_common.utils.resource_versions import bump_users_resources_versions
+
+
+def repair_users(first_id=None, batch_size=None, max_workers=1, on_progress=None):
+    """
+    Bootstraps the missing related items of the users a range of batch_size ids at a time, the ranges being repaired
+    by max_workers processes when more than 1. Reports the progress after each range to
+    on_progress(last_id, scanned_ids_count, counts), in the order of the ranges, so a run stopped midway can be
+    resumed past the last reported id with first_id. Returns the repaired counts.
+    """
+    User = get_user_model()
+
+    batch_size = batch_size or settings.USER_REPAIR_BATCH_SIZE
+
+    users = User.objects.all()
+
+    if first_id:
+        users = users.filter(pk__gte=first_id)
+
+    ids = users.order_by('pk').values_list('pk', flat=True)
+    min_id = ids.first()
+    max_id = ids.last()
+
+    counts = Counter()
+
+    if min_id is None:
+        return counts
+
+    ranges = [(start_id, min(start_id + batch_size, max_id + 1)) for start_id in range(min_id, max_id + 1, batch_size)]
+
+    if max_workers > 1:
+        # The processes must not share the connections of this one
+        connections.close_all()
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        ranges_counts = executor.map(_repair_users_range, *zip(*ranges))
+    else:
+        executor = None
+        ranges_counts = (_repair_users_range(start_id, end_id) for start_id, end_id in ranges)
+
+    try:
+        for (start_id, end_id), range_counts in zip(ranges, ranges_counts):
+            counts.update(range_counts)
+
+            if on_progress:
+                on_progress(end_id - 1, end_id - min_id, counts)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    return counts
+
+
+def _repair_users_range(start_id, end_id):
+    """
+    Repairs the users whose id is within [start_id, end_id) in a transaction of its own, returns the repaired counts
+    """
+    User = get_user_model()
+    users = User.objects.filter(pk__gte=start_id, pk__lt=end_id)
+
+    with transaction.atomic():
+        repaired_users_ids = {
+            'circles': _repair_missing_circles(users=users),
+            'notifications_settings': _repair_missing_notifications_settings(users=users),
+            'profiles': _repair_missing_profiles(users=users),
+            'auth_tokens': _repair_missing_auth_tokens(users=users),
+        }
+
+        # The bulk queries don't send the signals invalidating the ETags of the users
+        bump_users_resources_versions(set().union(*repaired_users_ids.values()))
+
+    return Counter({repair: len(users_ids) for repair, users_ids in repaired_users_ids.items()})
+
+
+def _repair_missing_circles(users):
+    """
+    The users without connections circle lose their connections and circles, then get a new connections circle
+    """
+    User = get_user_model()
+    Circle = get_circle_model()
+    Connection = get_connection_model()
+
+    users_ids = list(users.filter(connections_circle__isnull=True).values_list('pk', flat=True))
+
+    if not users_ids:
+        return users_ids
+
+    Connection.objects.filter(user_id__in=users_ids).delete()
+    Circle.objects.filter(creator_id__in=users_ids).delete()
+
+    created = timezone.now()
+    Circle.objects.bulk_create([
+        Circle(name=_('Connections'), color='#FFFFFF', creator_id=user_id, created=created) for user_id in users_ids
+    ])
+
+    # bulk_create doesn't set the primary keys on MySQL, the circles are the only ones of their creators by now
+    circles_ids = Circle.objects.filter(creator_id__in=users_ids).values_list('creator_id', 'pk')
+
+    User.objects.bulk_update([User(pk=user_id, connections_circle_id=circle_id) for user_id, circle_id in circles_ids],
+                             fields=['connections_circle'])
+
+    return users_ids
+
+
+def _repair_missing_notifications_settings(users):
+    users_ids = list(users.filter(notifications_settings__isnull=True).values_list('pk', flat=True))
+
+    UserNotificationsSettings.objects.bulk_create([
+        UserNotificationsSettings(user_id=user_id) for user_id in users_ids
+    ])
+
+    return users_ids
+
+
+def _repair_missing_profiles(users):
+    users_ids = list(users.filter(profile__isnull=True).values_list('pk', flat=True))
+
+    UserProfile.objects.bulk_create([
+        UserProfile(user_id=user_id, name='Openbook', is_of_legal_age=True) for user_id in users_ids
+    ])
+
+    return users_ids
+
+
+def _repair_missing_auth_tokens(users):
+    users_ids = list(users.filter(auth_token__isnull=True).values_list('pk', flat=True))
+
+    tokens = []
+
+    for user_id in users_ids:
+        token = Token(user_id=user_id)
+        token.key = token.generate_key()
+        tokens.append(token)
+
+    Token.objects.bulk_create(tokens)
+
+    return users_ids
@@ -0,0 +1,64 @@
+from django.test import TestCase
+from rest_framework.authtoken.models import Token
+
+from openbook_auth.models import User, UserProfile, UserNotificationsSettings
+from openbook_auth.repairs import repair_users
+from openbook_common.tests.helpers import make_user
+
+
+class RepairUsersTests(TestCase):
+    """
+    Users repair
+    """
+
+    fixtures = [
+        'openbook_circles/fixtures/circles.json'
+    ]
+
+    def test_repairs_missing_related_items(self):
+        """
+        should bootstrap the missing profiles, notifications settings, auth tokens and connections circles
+        """
+        users = [make_user() for i in range(0, 5)]
+        users_ids = [user.pk for user in users]
+
+        UserProfile.objects.filter(user_id__in=users_ids[:2]).delete()
+        UserNotificationsSettings.objects.filter(user_id__in=users_ids[1:3]).delete()
+        Token.objects.filter(user_id__in=users_ids[2:4]).delete()
+
+        users[4].connect_with_user_with_id(users[3].pk)
+        User.objects.filter(pk=users[4].pk).update(connections_circle=None)
+
+        counts = repair_users(batch_size=2)
+
+        self.assertEqual(counts['profiles'], 2)
+        self.assertEqual(counts['notifications_settings'], 2)
+        self.assertEqual(counts['auth_tokens'], 2)
+        self.assertEqual(counts['circles'], 1)
+
+        for user in users:
+            user.refresh_from_db()
+
+            self.assertTrue(UserProfile.objects.filter(user=user).exists())
+            self.assertTrue(UserNotificationsSettings.objects.filter(user=user).exists())
+            self.assertTrue(Token.objects.filter(user=user).exists())
+            self.assertEqual(user.connections_circle.creator_id, user.pk)
+
+        self.assertFalse(users[4].connections.exists())
+
+    def test_resumes_from_id(self):
+        """
+        should only repair the users from the given id and report the progress of every range
+        """
+        users = [make_user() for i in range(0, 4)]
+
+        UserProfile.objects.filter(user_id__in=[user.pk for user in users]).delete()
+
+        progress = []
+
+        counts = repair_users(first_id=users[2].pk, batch_size=1,
+                              on_progress=lambda last_id, scanned_ids_count, counts: progress.append(last_id))
+
+        self.assertEqual(counts['profiles'], 2)
+        self.assertFalse(UserProfile.objects.filter(user_id__in=[users[0].pk, users[1].pk]).exists())
+        self.assertEqual(progress, [users[2].pk, users[3].pk])
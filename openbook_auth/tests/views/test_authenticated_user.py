@@ -1,18 +1,25 @@
 from unittest import mock
 
 from urllib.parse import urlsplit
+from django.core.files import File
 from django.urls import reverse
 from faker import Faker
 from rest_framework import status
 from rest_framework.test import APITestCase
-from openbook_auth.models import User
+from rest_framework.authtoken.models import Token
+
+from openbook_auth.jobs import delete_user
+from openbook_auth.models import User, UserDeletion
 
 import logging
 import json
 
 from openbook_auth.views.authenticated_user.views import AuthenticatedUserSettings
+from openbook_common.models import MediaTombstone
 from openbook_common.tests.helpers import make_user, make_authentication_headers_for_user, make_user_bio, \
-    make_user_location, make_user_avatar, make_user_cover
+    make_user_location, make_user_avatar, make_user_cover, make_fake_post_text, make_fake_post_comment_text, \
+    make_post_image
+from openbook_posts.models import Post, PostComment
 
 fake = Faker()
 
@@ -467,7 +474,8 @@ class AuthenticatedUserDeleteTests(APITestCase):
 
     def test_can_delete_user_with_password(self):
         """
-        should be able to delete the authenticated user with his password and return 200
+        should be able to delete the authenticated user with his password, deactivating it until the deletion job
+        runs, and return 200
         """
         user = make_user()
         headers = make_authentication_headers_for_user(user)
@@ -488,6 +496,94 @@ class AuthenticatedUserDeleteTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+        user.refresh_from_db()
+
+        self.assertFalse(user.is_active)
+        self.assertFalse(Token.objects.filter(user=user).exists())
+        self.assertTrue(UserDeletion.objects.filter(user=user).exists())
+
+        delete_user(user.deletion.pk)
+
+        self.assertFalse(User.objects.filter(pk=user.pk).exists())
+
+    def test_cant_use_token_of_deleted_user(self):
+        """
+        should not be able to authenticate with the token of a user pending deletion and return 401
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        user_password = fake.password()
+
+        user.set_password(user_password)
+
+        user.save()
+
+        self.client.post(self._get_url(), {'password': user_password}, **headers)
+
+        response = self.client.get(reverse('authenticated-user'), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deletion_deletes_rows_in_chunks(self):
+        """
+        should delete the posts, the comments on them, the follows and the connections of the user a chunk at a time
+        and bury the media of the posts
+        """
+        user = make_user()
+        other_user = make_user()
+
+        posts = [user.create_public_post(text=make_fake_post_text()) for i in range(0, 3)]
+        image_post = user.create_public_post(image=File(make_post_image()))
+        image_name = image_post.image.image.name
+
+        for post in posts:
+            other_user.comment_post_with_id(post_id=post.pk, text=make_fake_post_comment_text())
+
+        user.follow_user_with_id(other_user.pk)
+        other_user.follow_user_with_id(user.pk)
+        user.connect_with_user_with_id(other_user.pk)
+
+        user.set_password('password')
+        user.save()
+        user.delete_with_password(password='password')
+
+        with self.settings(USER_DELETION_BATCH_SIZE=2):
+            delete_user(user.deletion.pk)
+
+        self.assertFalse(User.objects.filter(pk=user.pk).exists())
+        self.assertFalse(Post.objects.filter(pk__in=[post.pk for post in posts] + [image_post.pk]).exists())
+        self.assertFalse(PostComment.objects.filter(commenter=other_user).exists())
+        self.assertFalse(other_user.follows.exists())
+        self.assertFalse(other_user.connections.exists())
+        self.assertTrue(MediaTombstone.objects.filter(key=image_name).exists())
+
+    def test_deletion_resumes_from_its_step(self):
+        """
+        should resume a deletion from the step it stopped at
+        """
+        user = make_user()
+        user.create_public_post(text=make_fake_post_text())
+
+        user.set_password('password')
+        user.save()
+        user.delete_with_password(password='password')
+
+        user_deletion = user.deletion
+        user_deletion.step = 'follows'
+        user_deletion.save()
+
+        delete_chunk = UserDeletion._delete_chunk
+        deleted_models = []
+
+        def record_delete_chunk(self, query_set):
+            deleted_models.append(query_set.model)
+            return delete_chunk(self, query_set=query_set)
+
+        with mock.patch.object(UserDeletion, '_delete_chunk', autospec=True, side_effect=record_delete_chunk):
+            delete_user(user_deletion.pk)
+
+        self.assertNotIn(Post, deleted_models)
         self.assertFalse(User.objects.filter(pk=user.pk).exists())
 
     def test_cant_delete_user_with_wrong_password(self):
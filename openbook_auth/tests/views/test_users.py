@@ -175,6 +175,51 @@ class GetUserAPITests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_retrieve_unchanged_user_returns_not_modified(self):
+        """
+        should return 304 when retrieving a user with the ETag of an unchanged previous response
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        user_to_retrieve = make_user()
+
+        url = self._get_url(user_to_retrieve)
+
+        response = self.client.get(url, **headers)
+        etag = response['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_retrieve_followed_user_returns_modified(self):
+        """
+        should return 200 when retrieving a user with the ETag of a response previous to following it
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        user_to_retrieve = make_user()
+
+        url = self._get_url(user_to_retrieve)
+
+        response = self.client.get(url, **headers)
+        etag = response['ETag']
+
+        user.follow_user_with_id(user_id=user_to_retrieve.pk)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+        parsed_response = json.loads(response.content)
+
+        self.assertTrue(parsed_response['is_following'])
+
     def _get_url(self, user):
         return reverse('get-user', kwargs={
             'user_username': user.username
@@ -9,6 +9,8 @@ from openbook_auth.validators import username_characters_validator, \
 from django.contrib.auth.password_validation import validate_password
 
 from openbook_common.models import Badge
+from openbook_common.serializers import SparseFieldsetsSerializerMixin
+from openbook_common.serializers_fields.image import ImageRenditionsField
 from openbook_common.serializers_fields.request import FriendlyUrlField, RestrictedImageFileSizeField
 from openbook_common.serializers_fields.user import FollowersCountField, \
     FollowingCountField, PostsCountField, \
@@ -29,6 +31,8 @@ class GetAuthenticatedUserProfileBadgeSerializer(serializers.ModelSerializer):
 class GetAuthenticatedUserProfileSerializer(serializers.ModelSerializer):
     avatar = serializers.ImageField(max_length=None, use_url=True, allow_null=True, required=False)
     badges = GetAuthenticatedUserProfileBadgeSerializer(many=True)
+    avatar_renditions = ImageRenditionsField(image_field_name='avatar')
+    cover_renditions = ImageRenditionsField(image_field_name='cover')
 
     class Meta:
         model = UserProfile
@@ -36,17 +40,19 @@ class GetAuthenticatedUserProfileSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'avatar',
+            'avatar_renditions',
             'bio',
             'url',
             'location',
             'cover',
+            'cover_renditions',
             'is_of_legal_age',
             'followers_count_visible',
             'badges'
         )
 
 
-class GetAuthenticatedUserSerializer(serializers.ModelSerializer):
+class GetAuthenticatedUserSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     profile = GetAuthenticatedUserProfileSerializer(many=False)
     posts_count = PostsCountField()
     unread_notifications_count = UnreadNotificationsCountField()
@@ -5,12 +5,16 @@ from openbook_auth.models import User, UserProfile
 from openbook_common.models import Badge
 from openbook_common.serializers_fields.user import \
     IsFollowingField, IsConnectedField
+from openbook_common.serializers_fields.request import CursorField
 
 
 class GetFollowersSerializer(serializers.Serializer):
     max_id = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
     count = serializers.IntegerField(
         required=False,
         max_value=20
@@ -5,6 +5,8 @@ from rest_framework.views import APIView
 
 from openbook_auth.views.followers.serializers import GetFollowersSerializer, FollowersUserSerializer, \
     SearchFollowersSerializer
+from openbook_common.responses import CursorPaginatedResponse
+from openbook_common.utils.pagination import paginate_queryset
 
 
 class Followers(APIView):
@@ -19,14 +21,14 @@ class Followers(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
 
         user = request.user
-        users = user.get_followers(max_id=max_id).order_by(
-            '-id')[:count]
+        page = paginate_queryset(user.get_followers(max_id=max_id), count=count, cursor=cursor)
 
-        users_serializer = FollowersUserSerializer(users, many=True, context={'request': request})
+        users_serializer = FollowersUserSerializer(page.items, many=True, context={'request': request})
 
-        return Response(users_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(users_serializer.data, page=page)
 
 
 class SearchFollowers(APIView):
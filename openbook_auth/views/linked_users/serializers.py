@@ -5,6 +5,7 @@ from openbook_auth.models import User, UserProfile
 from openbook_common.models import Badge
 from openbook_common.serializers_fields.user import \
     IsFollowingField, IsConnectedField, CommunitiesInvitesField, CommunitiesMembershipsField
+from openbook_common.serializers_fields.request import CursorField
 from openbook_communities.models import CommunityMembership, CommunityInvite
 from openbook_communities.serializers_fields import CommunityMembershipsField
 from openbook_communities.validators import community_name_exists, community_name_characters_validator
@@ -14,6 +15,9 @@ class GetLinkedUsersSerializer(serializers.Serializer):
     max_id = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
     count = serializers.IntegerField(
         required=False,
         max_value=10
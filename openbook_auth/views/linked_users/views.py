@@ -5,6 +5,8 @@ from rest_framework.views import APIView
 
 from openbook_auth.views.linked_users.serializers import GetLinkedUsersSerializer, \
     SearchLinkedUsersSerializer, LinkedUsersUserSerializer
+from openbook_common.responses import CursorPaginatedResponse
+from openbook_common.utils.pagination import paginate_queryset
 
 
 class LinkedUsers(APIView):
@@ -19,17 +21,17 @@ class LinkedUsers(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
         with_community = data.get('with_community')
 
         user = request.user
-        users = user.get_linked_users(max_id=max_id).order_by(
-            '-id')[:count]
+        page = paginate_queryset(user.get_linked_users(max_id=max_id), count=count, cursor=cursor)
 
-        users_serializer = LinkedUsersUserSerializer(users, many=True, context={'request': request,
-                                                                                'communities_names': [
-                                                                                    with_community]})
+        users_serializer = LinkedUsersUserSerializer(page.items, many=True, context={'request': request,
+                                                                                     'communities_names': [
+                                                                                         with_community]})
 
-        return Response(users_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(users_serializer.data, page=page)
 
 
 class SearchLinkedUsers(APIView):
@@ -5,6 +5,8 @@ from openbook_auth.models import UserProfile, User
 from openbook_auth.validators import username_characters_validator, user_username_exists
 from openbook_circles.models import Circle
 from openbook_common.models import Badge, Emoji
+from openbook_common.serializers import SparseFieldsetsSerializerMixin
+from openbook_common.serializers_fields.image import ImageRenditionsField
 from openbook_common.serializers_fields.user import FollowersCountField, FollowingCountField, PostsCountField, \
     IsFollowingField, IsConnectedField, IsFullyConnectedField, ConnectedCirclesField, FollowListsField, \
     IsPendingConnectionConfirmation, IsBlockedField
@@ -51,14 +53,18 @@ class GetUserSerializer(serializers.Serializer):
 
 class GetUserUserProfileSerializer(serializers.ModelSerializer):
     badges = GetUserUserProfileBadgeSerializer(many=True)
+    avatar_renditions = ImageRenditionsField(image_field_name='avatar')
+    cover_renditions = ImageRenditionsField(image_field_name='cover')
 
     class Meta:
         model = UserProfile
         fields = (
             'name',
             'avatar',
+            'avatar_renditions',
             'location',
             'cover',
+            'cover_renditions',
             'bio',
             'url',
             'badges'
@@ -98,7 +104,7 @@ class GetUserUserListSerializer(serializers.ModelSerializer):
         )
 
 
-class GetUserUserSerializer(serializers.ModelSerializer):
+class GetUserUserSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     profile = GetUserUserProfileSerializer(many=False)
     followers_count = FollowersCountField()
     following_count = FollowingCountField()
@@ -175,7 +181,7 @@ class SearchUsersUserProfileSerializer(serializers.ModelSerializer):
         )
 
 
-class SearchUsersUserSerializer(serializers.ModelSerializer):
+class SearchUsersUserSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     profile = SearchUsersUserProfileSerializer(many=False)
     is_following = IsFollowingField()
     is_connected = IsConnectedField()
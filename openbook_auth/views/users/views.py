@@ -8,6 +8,7 @@ from openbook_auth.views.authenticated_user.serializers import GetAuthenticatedU
 from openbook_auth.views.users.serializers import SearchUsersSerializer, SearchUsersUserSerializer, GetUserSerializer, \
     GetUserUserSerializer, GetBlockedUserSerializer
 from openbook_common.responses import ApiMessageResponse
+from openbook_common.utils.resource_versions import versioned_etag, make_user_resource, EMOJI_GROUPS_RESOURCE
 from django.utils.translation import ugettext_lazy as _
 
 
@@ -33,9 +34,15 @@ class SearchUsers(APIView):
         return Response(users_serializer.data, status=status.HTTP_200_OK)
 
 
+def get_user_resources(request, user_username):
+    # The response depends on the relationships of the authenticated user with the retrieved one
+    return [make_user_resource(request.user.username), make_user_resource(user_username), EMOJI_GROUPS_RESOURCE]
+
+
 class GetUser(APIView):
     permission_classes = (IsAuthenticated,)
 
+    @versioned_etag(get_user_resources)
     def get(self, request, user_username):
         request_data = request.data.copy()
         request_data['username'] = user_username
@@ -1,11 +1,16 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
 from django.utils import timezone
 
 # Create your models here.
 from openbook_auth.models import User
 from django.utils.translation import ugettext_lazy as _
 
+from openbook_common.utils.reference_cache import categories_reference_cache
+from openbook_common.utils.resource_versions import bump_resources_versions, CATEGORIES_RESOURCE, \
+    bump_communities_resources_versions, make_community_resource
 from openbook_common.validators import hex_color_validator
 from openbook_communities.models import Community
 
@@ -39,3 +44,33 @@ class Category(models.Model):
 
     def __str__(self):
         return 'Category: ' + self.name
+
+
+@receiver([post_save, post_delete], sender=Category, dispatch_uid='bump_category_versions')
+def bump_categories_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the categories
+    """
+    bump_resources_versions([CATEGORIES_RESOURCE])
+
+
+@receiver([post_save, post_delete], sender=Category, dispatch_uid='invalidate_category_reference_cache')
+def invalidate_category_reference_cache(sender, instance=None, **kwargs):
+    """"
+    Invalidate the in-process copies of the categories
+    """
+    categories_reference_cache.invalidate()
+
+
+@receiver(m2m_changed, sender=Category.communities.through, dispatch_uid='bump_category_communities_versions')
+def bump_category_communities_versions(sender, instance=None, action=None, reverse=False, pk_set=None, **kwargs):
+    """"
+    Invalidate the ETags of the communities whose categories changed
+    """
+    if reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            bump_resources_versions([make_community_resource(instance.name)])
+    elif action == 'pre_clear':
+        bump_communities_resources_versions(instance.communities.values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        bump_communities_resources_versions(pk_set)
@@ -3,12 +3,11 @@ from django.utils.translation import gettext_lazy as _
 # Create your tests here.
 from rest_framework.exceptions import ValidationError
 
-from openbook_common.utils.model_loaders import get_category_model
+from openbook_common.utils.reference_cache import categories_reference_cache
 
 
 def category_name_exists(category_name):
-    Category = get_category_model()
-    if not Category.objects.filter(name=category_name).exists():
+    if not categories_reference_cache.get(name=category_name):
         raise ValidationError(
             _('No category with the provided name exists.'),
         )
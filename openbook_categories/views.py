@@ -7,15 +7,16 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from openbook_categories.serializers import GetCategoriesCategorySerializer
-from openbook_common.utils.model_loaders import get_category_model
+from openbook_common.utils.reference_cache import categories_reference_cache
+from openbook_common.utils.resource_versions import versioned_etag, CATEGORIES_RESOURCE
 
 
 class Categories(APIView):
     permission_classes = (IsAuthenticated,)
 
+    @versioned_etag(lambda request: [CATEGORIES_RESOURCE])
     def get(self, request):
-        Category = get_category_model()
-        categories = Category.objects.all().order_by('order')
+        categories = categories_reference_cache.all()
         response_serializer = GetCategoriesCategorySerializer(categories, many=True,
                                                               context={"request": request})
 
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def forwards_func(apps, schema_editor):
+    # We get the model from the versioned app registry;
+    # if we directly import it, it'll be the wrong version
+    Circle = apps.get_model('openbook_circles', 'Circle')
+    ConnectionCircle = apps.get_model('openbook_circles', 'ConnectionCircle')
+    db_alias = schema_editor.connection.alias
+
+    circle_users_count = ConnectionCircle.objects.using(db_alias).filter(circle_id=OuterRef('pk')).order_by().values(
+        'circle_id').annotate(count=Count('pk')).values('count')
+
+    Circle.objects.using(db_alias).update(users_count=Coalesce(Subquery(circle_users_count), Value(0)))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('openbook_circles', '0013_auto_20190414_2017'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='circle',
+            name='users_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='users count'),
+        ),
+        migrations.RunPython(forwards_func, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,9 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
 
 # Create your models here.
 from django.utils import timezone
@@ -7,6 +11,8 @@ from django.utils import timezone
 from openbook.settings import CIRCLE_MAX_LENGTH, COLOR_ATTR_MAX_LENGTH
 from openbook_auth.models import User
 from openbook_common.utils.model_loaders import get_connection_model
+from openbook_common.utils.resource_versions import bump_resources_versions, bump_users_resources_versions, \
+    make_user_circles_resource
 from openbook_connections.models import Connection
 from openbook_posts.models import Post
 from openbook_common.validators import hex_color_validator
@@ -31,6 +37,7 @@ class Circle(models.Model):
                              validators=[hex_color_validator])
     posts = models.ManyToManyField(Post, related_name='circles', db_index=True)
     connections = models.ManyToManyField(Connection, related_name='circles', db_index=True, through=ConnectionCircle)
+    users_count = models.PositiveIntegerField(_('users count'), default=0, editable=False)
     created = models.DateTimeField(editable=False)
 
     class Meta:
@@ -75,16 +82,74 @@ class Circle(models.Model):
 
         return users
 
-    @property
-    def users_count(self):
-        return Connection.objects.filter(
-            circles__id=self.id).count()
+    @classmethod
+    def update_users_counts(cls, circles_query):
+        """
+        Recounts the connections of the matching circles in a single UPDATE, to be called whenever their
+        ConnectionCircle rows are inserted or deleted
+        """
+        circle_users_count = ConnectionCircle.objects.filter(circle_id=OuterRef('pk')).order_by().values(
+            'circle_id').annotate(count=Count('pk')).values('count')
+
+        cls.objects.filter(circles_query).update(users_count=Coalesce(Subquery(circle_users_count), Value(0)))
 
     def save(self, *args, **kwargs):
         ''' On save, update timestamps '''
         if not self.id:
             self.created = timezone.now()
+        elif kwargs.get('update_fields') is None:
+            # Only update_users_counts writes the count, a circle fetched before its connections changed would
+            # write back a stale one
+            kwargs['update_fields'] = [field.name for field in self._meta.concrete_fields if
+                                       not field.primary_key and field.name != 'users_count']
         return super(Circle, self).save(*args, **kwargs)
 
     def __str__(self):
         return self.name
+
+
+@receiver([post_save, post_delete], sender=Circle, dispatch_uid='bump_circle_versions')
+def bump_circle_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the circle creator
+    """
+    if instance.creator_id:
+        bump_users_resources_versions([instance.creator_id])
+        bump_resources_versions([make_user_circles_resource(instance.creator_id)])
+
+
+@receiver(m2m_changed, sender=ConnectionCircle, dispatch_uid='bump_connection_circle_versions')
+def bump_connection_circle_versions(sender, instance=None, action=None, reverse=False, **kwargs):
+    """"
+    Invalidate the ETags of the owner of the circles whose connections changed
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    user_id = instance.user_id if reverse else instance.creator_id
+
+    bump_users_resources_versions([user_id])
+    bump_resources_versions([make_user_circles_resource(user_id)])
+
+
+@receiver(m2m_changed, sender=ConnectionCircle, dispatch_uid='update_connection_circles_users_counts')
+def update_connection_circles_users_counts(sender, instance=None, action=None, reverse=False, **kwargs):
+    """"
+    Recount the users of the circles whose connections changed
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        # The connection circles aren't known after a clear, all the circles of its owner are recounted
+        Circle.update_users_counts(circles_query=Q(creator_id=instance.user_id))
+    else:
+        Circle.update_users_counts(circles_query=Q(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Connection, dispatch_uid='update_deleted_connection_circles_users_counts')
+def update_deleted_connection_circles_users_counts(sender, instance=None, **kwargs):
+    """"
+    Recount the users of the circles of the owner of a deleted connection
+    """
+    Circle.update_users_counts(circles_query=Q(creator_id=instance.user_id))
@@ -3,9 +3,10 @@ from rest_framework import serializers
 
 from openbook.settings import CIRCLE_MAX_LENGTH, COLOR_ATTR_MAX_LENGTH
 from openbook_auth.models import UserProfile, User
-from openbook_auth.validators import username_characters_validator, user_username_exists
+from openbook_auth.validators import username_characters_validator
 from openbook_circles.models import Circle
 from openbook_circles.validators import circle_id_exists
+from openbook_common.serializers_fields.request import CursorField
 from openbook_common.serializers_fields.user import IsFullyConnectedField
 from openbook_common.validators import hex_color_validator
 
@@ -25,13 +26,14 @@ class UpdateCircleSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=CIRCLE_MAX_LENGTH, required=False, allow_blank=False)
     color = serializers.CharField(max_length=COLOR_ATTR_MAX_LENGTH, required=False, allow_blank=False,
                                   validators=[hex_color_validator])
+    # The usernames are checked to exist all at once when updating the circle
     usernames = serializers.ListSerializer(
         required=False,
         allow_empty=True,
         child=serializers.CharField(max_length=settings.USERNAME_MAX_LENGTH,
                                     allow_blank=False,
                                     required=False,
-                                    validators=[username_characters_validator, user_username_exists])
+                                    validators=[username_characters_validator])
     )
 
 
@@ -73,18 +75,29 @@ class GetCirclesCircleSerializer(serializers.ModelSerializer):
 
 
 class GetCircleCircleSerializer(serializers.ModelSerializer):
-    users = CircleUserSerializer(many=True)
-
     class Meta:
         model = Circle
         fields = (
             'id',
             'name',
             'color',
-            'users',
             'users_count'
         )
 
 
+class GetCircleUsersSerializer(serializers.Serializer):
+    circle_id = serializers.IntegerField(required=True, validators=[circle_id_exists])
+    max_id = serializers.IntegerField(
+        required=False,
+    )
+    cursor = CursorField(
+        required=False,
+    )
+    count = serializers.IntegerField(
+        required=False,
+        max_value=20
+    )
+
+
 class CircleNameCheckSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=CIRCLE_MAX_LENGTH, required=True, allow_blank=False, validators=[])
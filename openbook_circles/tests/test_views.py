@@ -1,4 +1,6 @@
 # Create your tests here.
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -11,6 +13,7 @@ import logging
 import json
 
 from openbook_circles.models import Circle
+from openbook_notifications.models import Notification
 from openbook_common.tests.helpers import make_user, make_authentication_headers_for_user, make_fake_circle_name
 
 logger = logging.getLogger(__name__)
@@ -88,6 +91,34 @@ class CircleItemAPITests(APITestCase):
         'openbook_circles/fixtures/circles.json'
     ]
 
+    def test_retrieve_own_circle_users_count(self):
+        """
+        should retrieve the stored users count of an own circle without its users and return 200
+        """
+        user = make_user()
+
+        circle = mixer.blend(Circle, creator=user)
+        circle_id = circle.pk
+
+        users_to_connect_with = [make_user() for i in range(3)]
+
+        for user_to_connect_with in users_to_connect_with:
+            user.connect_with_user_with_id(user_to_connect_with.pk, circles_ids=[circle_id])
+
+        user.disconnect_from_user_with_id(users_to_connect_with[0].pk)
+        user.remove_circle_with_id_from_connection_with_user_with_id(users_to_connect_with[1].pk, circle_id)
+
+        url = self._get_url(circle_id)
+        headers = make_authentication_headers_for_user(user)
+        response = self.client.get(url, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_circle = json.loads(response.content)
+
+        self.assertEqual(response_circle['users_count'], 1)
+        self.assertNotIn('users', response_circle)
+
     def test_delete_own_circle(self):
         """
         should be able to delete an own circle and return 200
@@ -254,6 +285,105 @@ class CircleItemAPITests(APITestCase):
 
         self.assertEqual(len(circle.users), 0)
 
+    def test_can_update_own_circle_users_with_set_difference(self):
+        """
+        should be able to add connected and not connected users and remove users from an own circle and return 200
+        """
+        user = make_user()
+
+        circle = mixer.blend(Circle, creator=user)
+        circle_id = circle.pk
+
+        user_to_keep = make_user()
+        user.connect_with_user_with_id(user_to_keep.pk, circles_ids=[circle_id])
+
+        user_to_remove = make_user()
+        user.connect_with_user_with_id(user_to_remove.pk, circles_ids=[circle_id])
+
+        connected_user_to_add = make_user()
+        user.connect_with_user_with_id(connected_user_to_add.pk)
+
+        user_to_connect_with = make_user()
+
+        data = {
+            'usernames': ','.join([user_to_keep.username, connected_user_to_add.username,
+                                   user_to_connect_with.username])
+        }
+
+        url = self._get_url(circle_id)
+        headers = make_authentication_headers_for_user(user)
+        response = self.client.patch(url, data, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        for circle_user in [user_to_keep, connected_user_to_add, user_to_connect_with]:
+            self.assertTrue(user.is_connected_with_user_with_id_in_circle_with_id(circle_user.pk, circle_id))
+
+        self.assertFalse(user.is_connected_with_user_with_id_in_circle_with_id(user_to_remove.pk, circle_id))
+        self.assertTrue(user.is_connected_with_user_with_id(user_to_remove.pk))
+        self.assertEqual(json.loads(response.content)['users_count'], 3)
+
+        self.assertTrue(user.is_connected_with_user_with_id_in_circle_with_id(user_to_connect_with.pk,
+                                                                              user.connections_circle_id))
+        self.assertTrue(user_to_connect_with.is_connected_with_user_with_id(user.pk))
+        self.assertTrue(user.is_following_user_with_id(user_to_connect_with.pk))
+        self.assertTrue(user_to_connect_with.notifications.filter(
+            notification_type=Notification.CONNECTION_REQUEST).exists())
+
+    def test_update_own_circle_users_queries_dont_grow_with_users(self):
+        """
+        should update the users of an own circle with the same number of queries however many users change
+        """
+        user = make_user()
+
+        def get_update_queries_count(users_count):
+            circle = mixer.blend(Circle, creator=user)
+            users_to_remove = [make_user() for i in range(users_count)]
+            connected_users_to_add = [make_user() for i in range(users_count)]
+            users_to_connect_with = [make_user() for i in range(users_count)]
+
+            for user_to_remove in users_to_remove:
+                user.connect_with_user_with_id(user_to_remove.pk, circles_ids=[circle.pk])
+
+            for connected_user_to_add in connected_users_to_add:
+                user.connect_with_user_with_id(connected_user_to_add.pk)
+
+            usernames = [circle_user.username for circle_user in connected_users_to_add + users_to_connect_with]
+
+            with CaptureQueriesContext(connection) as context:
+                user.update_circle_with_id(circle.pk, usernames=usernames)
+
+            self.assertEqual(len(circle.users), users_count * 2)
+
+            return len(context.captured_queries)
+
+        get_update_queries_count(users_count=1)
+
+        self.assertEqual(get_update_queries_count(users_count=2), get_update_queries_count(users_count=10))
+
+    def test_cannot_update_own_circle_with_non_existing_username(self):
+        """
+        should not be able to update an own circle with a username nobody has and return 404
+        """
+        user = make_user()
+
+        circle = mixer.blend(Circle, creator=user)
+        circle_id = circle.pk
+
+        user_in_circle = make_user()
+        user.connect_with_user_with_id(user_in_circle.pk, circles_ids=[circle_id])
+
+        data = {
+            'usernames': ','.join([user_in_circle.username, 'nonexistingusername'])
+        }
+
+        url = self._get_url(circle_id)
+        headers = make_authentication_headers_for_user(user)
+        response = self.client.patch(url, data, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(user.is_connected_with_user_with_id_in_circle_with_id(user_in_circle.pk, circle_id))
+
     def test_cannot_update_other_user_circle(self):
         """
         should not be able to update the circle of another user and return 400
@@ -339,6 +469,70 @@ class CircleItemAPITests(APITestCase):
         })
 
 
+class CircleUsersAPITests(APITestCase):
+    """
+    CircleUsersAPI
+    """
+
+    fixtures = [
+        'openbook_circles/fixtures/circles.json'
+    ]
+
+    def test_can_retrieve_own_circle_users_a_page_at_a_time(self):
+        """
+        should be able to retrieve the users of an own circle a page at a time and return 200
+        """
+        user = make_user()
+
+        circle = mixer.blend(Circle, creator=user)
+        circle_id = circle.pk
+
+        circle_users_ids = []
+
+        for i in range(5):
+            user_to_connect_with = make_user()
+            user.connect_with_user_with_id(user_to_connect_with.pk, circles_ids=[circle_id])
+            circle_users_ids.append(user_to_connect_with.pk)
+
+        user.connect_with_user_with_id(make_user().pk)
+
+        url = self._get_url(circle_id)
+        headers = make_authentication_headers_for_user(user)
+        response = self.client.get(url, {'count': 3}, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        first_page = json.loads(response.content)
+
+        self.assertEqual(len(first_page), 3)
+
+        response = self.client.get(url, {'count': 3, 'max_id': first_page[-1]['id']}, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        second_page = json.loads(response.content)
+
+        self.assertEqual(sorted([circle_user['id'] for circle_user in first_page + second_page]), circle_users_ids)
+
+    def test_cannot_retrieve_other_user_circle_users(self):
+        """
+        should not be able to retrieve the users of the circle of another user and return 400
+        """
+        user = make_user()
+        circle = mixer.blend(Circle, creator=make_user())
+
+        url = self._get_url(circle.pk)
+        headers = make_authentication_headers_for_user(user)
+        response = self.client.get(url, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def _get_url(self, circle_id):
+        return reverse('circle-users', kwargs={
+            'circle_id': circle_id
+        })
+
+
 class CircleNameCheckAPITests(APITestCase):
     """
     CircleNameCheckAPI
@@ -7,9 +7,12 @@ from rest_framework.views import APIView
 from django.utils.translation import gettext as _
 
 from openbook_circles.serializers import CreateCircleSerializer, GetCirclesCircleSerializer, DeleteCircleSerializer, \
-    UpdateCircleSerializer, CircleNameCheckSerializer, GetCircleCircleSerializer
-from openbook_common.responses import ApiMessageResponse
+    UpdateCircleSerializer, CircleNameCheckSerializer, GetCircleCircleSerializer, GetCircleUsersSerializer, \
+    CircleUserSerializer
+from openbook_common.responses import ApiMessageResponse, CursorPaginatedResponse
 from openbook_common.utils.helpers import normalise_request_data, nomalize_usernames_in_request_data
+from openbook_common.utils.pagination import paginate_queryset
+from openbook_common.utils.resource_versions import versioned_etag, make_user_circles_resource
 
 
 class Circles(APIView):
@@ -30,6 +33,7 @@ class Circles(APIView):
 
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @versioned_etag(lambda request: [make_user_circles_resource(request.user.pk)])
     def get(self, request):
         user = request.user
         circles = user.circles.order_by('-id')
@@ -84,6 +88,32 @@ class CircleItem(APIView):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
+class CircleUsers(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, circle_id):
+        query_params = request.query_params.dict()
+        query_params['circle_id'] = circle_id
+
+        serializer = GetCircleUsersSerializer(data=query_params)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+
+        count = data.get('count', 10)
+        max_id = data.get('max_id')
+        cursor = data.get('cursor')
+
+        user = request.user
+
+        users = user.get_users_for_circle_with_id(circle_id=circle_id, max_id=max_id)
+        page = paginate_queryset(users, count=count, cursor=cursor)
+
+        response_serializer = CircleUserSerializer(page.items, many=True, context={"request": request})
+
+        return CursorPaginatedResponse(response_serializer.data, page=page)
+
+
 class CircleNameCheck(APIView):
     """
     The API to check if a circleName is both valid and not taken.
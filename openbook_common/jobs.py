@@ -0,0 +1,41 @@
+import logging
+
+from django.apps import apps
+from django_rq import job
+
+from openbook_common.utils.image_renditions import make_image_renditions, swap_image_renditions
+from openbook_common.utils.media_garbage import delete_buried_media
+
+logger = logging.getLogger(__name__)
+
+
+@job('high')
+def process_image_renditions(model_label, instance_id, field_name, source_name):
+    """
+    Makes the renditions of a freshly uploaded image and swaps them in
+    """
+    Model = apps.get_model(model_label)
+    instance = Model.objects.filter(pk=instance_id).first()
+
+    if not instance or getattr(instance, field_name).name != source_name:
+        # Deleted or replaced since, the job of the replacement takes over
+        return
+
+    field = Model._meta.get_field(field_name)
+    renditions = make_image_renditions(field_file=getattr(instance, field_name), specs=field.get_renditions_specs())
+
+    if not swap_image_renditions(instance=instance, field_name=field_name, source_name=source_name,
+                                 renditions=renditions):
+        logger.info('Discarding the stale renditions of %s %s %s' % (model_label, instance_id, field_name))
+        storage = field.storage
+        for spec, key, width, height in renditions:
+            storage.delete(key)
+
+
+@job('low')
+def collect_media_garbage():
+    """
+    Deletes the files left behind by the deleted posts, avatars and covers
+    """
+    deleted_count = delete_buried_media()
+    logger.info('Deleted %d buried media files' % deleted_count)
@@ -0,0 +1,179 @@
+import json
+import math
+import platform
+import time
+from contextlib import ExitStack
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from openbook_auth.models import User
+from openbook_communities.models import Community
+from openbook_posts.models import Post
+
+
+def percentile(sorted_values, percent):
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(percent / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class Command(BaseCommand):
+    help = 'Times the hot API endpoints and reports latency percentiles and query counts as JSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', type=str,
+                            help='Username to benchmark as. Defaults to the user following the most users.')
+        parser.add_argument('--iterations', type=int, default=50, help='Timed requests per endpoint')
+        parser.add_argument('--warmup', type=int, default=5, help='Untimed requests per endpoint before timing')
+        parser.add_argument('--endpoints', type=str,
+                            help='Comma separated names of the endpoints to benchmark. Defaults to all of them.')
+        parser.add_argument('--output', type=str, default='benchmark.json', help='Path of the JSON report')
+        parser.add_argument('--compare', type=str, help='Path of a previous JSON report to compare against')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1')
+
+        user = self._get_benchmark_user(username=options.get('username'))
+
+        client = Client(HTTP_AUTHORIZATION='Token %s' % user.auth_token.key)
+
+        endpoints = self._get_endpoints(user=user)
+
+        if options.get('endpoints'):
+            names = [name.strip() for name in options['endpoints'].split(',')]
+            unknown_names = set(names) - set(endpoints.keys())
+            if unknown_names:
+                raise CommandError('Unknown endpoints %s' % ', '.join(sorted(unknown_names)))
+            endpoints = {name: endpoints[name] for name in names}
+
+        results = {}
+
+        for name, url in endpoints.items():
+            if url is None:
+                self.stderr.write('Skipping %s, there is no data to benchmark it with' % name)
+                continue
+
+            results[name] = self._benchmark_endpoint(client=client, url=url, iterations=options['iterations'],
+                                                     warmup=options['warmup'])
+            self.stdout.write('%s: p50 %.1fms p95 %.1fms p99 %.1fms, %s queries' % (
+                name, results[name]['p50_ms'], results[name]['p95_ms'], results[name]['p99_ms'],
+                results[name]['queries']['max']))
+
+        report = {
+            'created': timezone.now().isoformat(),
+            'username': user.username,
+            'iterations': options['iterations'],
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'databases': {alias: connections[alias].vendor for alias in connections},
+            'endpoints': results,
+        }
+
+        with open(options['output'], 'w') as output_file:
+            json.dump(report, output_file, indent=2, sort_keys=True)
+
+        self.stdout.write(self.style.SUCCESS('Report written to %s' % options['output']))
+
+        if options.get('compare'):
+            self._compare_reports(current=report, previous_path=options['compare'])
+
+    def _get_benchmark_user(self, username=None):
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError('No user found with username %s' % username)
+
+        user = User.objects.annotate(Count('follows')).order_by('-follows__count', 'id').first()
+
+        if not user:
+            raise CommandError('There are no users to benchmark with, run generate_social_graph first')
+
+        return user
+
+    def _get_endpoints(self, user):
+        most_commented_post = Post.objects.filter(creator=user).annotate(Count('comments')).order_by(
+            '-comments__count').first()
+
+        biggest_community = Community.objects.filter(memberships__user=user).annotate(
+            memberships_count=Count('memberships')).order_by('-memberships_count').first()
+
+        return {
+            'posts': reverse('posts'),
+            'trending-posts': reverse('trending-posts'),
+            'post-comments': reverse('post-comments', kwargs={
+                'post_uuid': most_commented_post.uuid}) if most_commented_post else None,
+            'notifications': reverse('notifications'),
+            'community-members': reverse('community-members', kwargs={
+                'community_name': biggest_community.name}) if biggest_community else None,
+            'search-users': '%s?query=%s' % (reverse('search-users'), user.username[:3]),
+        }
+
+    def _benchmark_endpoint(self, client, url, iterations, warmup):
+        for i in range(warmup):
+            client.get(url)
+
+        timings = []
+        queries_counts = []
+        statuses = set()
+
+        for i in range(iterations):
+            with ExitStack() as stack:
+                queries_contexts = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in
+                                    connections]
+                start = time.perf_counter()
+                response = client.get(url)
+                elapsed = time.perf_counter() - start
+
+            timings.append(elapsed * 1000)
+            queries_counts.append(sum(len(context) for context in queries_contexts))
+            statuses.add(response.status_code)
+
+        timings.sort()
+
+        return {
+            'url': url,
+            'statuses': sorted(statuses),
+            'p50_ms': percentile(timings, 50),
+            'p95_ms': percentile(timings, 95),
+            'p99_ms': percentile(timings, 99),
+            'mean_ms': sum(timings) / len(timings),
+            'queries': {
+                'min': min(queries_counts),
+                'max': max(queries_counts),
+                'mean': sum(queries_counts) / len(queries_counts),
+            }
+        }
+
+    def _compare_reports(self, current, previous_path):
+        with open(previous_path) as previous_file:
+            previous = json.load(previous_file)
+
+        for name, result in current['endpoints'].items():
+            previous_result = previous.get('endpoints', {}).get(name)
+            if not previous_result:
+                continue
+
+            self.stdout.write('%s: p50 %+.1f%% p95 %+.1f%% p99 %+.1f%%, queries %+d' % (
+                name,
+                self._percent_change(previous_result['p50_ms'], result['p50_ms']),
+                self._percent_change(previous_result['p95_ms'], result['p95_ms']),
+                self._percent_change(previous_result['p99_ms'], result['p99_ms']),
+                result['queries']['max'] - previous_result['queries']['max']))
+
+    def _percent_change(self, previous, current):
+        if not previous:
+            return 0.0
+        return (current - previous) / previous * 100
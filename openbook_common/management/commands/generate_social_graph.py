@@ -0,0 +1,411 @@
+import bisect
+import itertools
+import logging
+import random
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from faker import Faker
+from rest_framework.authtoken.models import Token
+
+from openbook_auth.models import User, UserProfile, UserNotificationsSettings
+from openbook_circles.models import Circle, ConnectionCircle
+from openbook_common.models import Emoji
+from openbook_common.utils.taken_names import add_taken_usernames, add_taken_emails
+from openbook_communities.models import Community, CommunityMembership
+from openbook_connections.models import Connection
+from openbook_follows.models import Follow
+from openbook_lists.models import List
+from openbook_notifications.models import Notification, FollowNotification, PostCommentNotification, \
+    PostReactionNotification
+from openbook_posts.models import Post, PostComment, PostReaction
+
+logger = logging.getLogger(__name__)
+
+fake = Faker()
+
+
+class ZipfSampler:
+    """
+    Samples indexes in [0, size) where index i is picked with a probability proportional to 1 / (i + 1) ** exponent.
+    The low indexes are the "celebrities" of the generated graph.
+    """
+
+    def __init__(self, size, exponent, rng):
+        self.rng = rng
+        self.cum_weights = list(itertools.accumulate(1.0 / ((rank + 1) ** exponent) for rank in range(size)))
+        self.total = self.cum_weights[-1]
+
+    def sample(self):
+        return bisect.bisect_left(self.cum_weights, self.rng.random() * self.total)
+
+    def sample_distinct(self, amount, exclude=None):
+        amount = min(amount, len(self.cum_weights) - (1 if exclude is not None else 0))
+        picked = set()
+        attempts = 0
+        while len(picked) < amount and attempts < amount * 20:
+            index = self.sample()
+            attempts += 1
+            if index != exclude:
+                picked.add(index)
+        return picked
+
+
+class Command(BaseCommand):
+    help = 'Generates a synthetic social graph to reproduce production scale load'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='Amount of users to generate')
+        parser.add_argument('--communities', type=int, default=50, help='Amount of communities to generate')
+        parser.add_argument('--max-follows', type=int, default=200, help='Maximum follows per user')
+        parser.add_argument('--max-connections', type=int, default=50, help='Maximum connections per user')
+        parser.add_argument('--max-memberships', type=int, default=20,
+                            help='Maximum community memberships per user')
+        parser.add_argument('--posts-per-user', type=int, default=20, help='Average amount of posts per user')
+        parser.add_argument('--comments-per-post', type=int, default=3, help='Average amount of comments per post')
+        parser.add_argument('--reactions-per-post', type=int, default=5, help='Average amount of reactions per post')
+        parser.add_argument('--zipf-exponent', type=float, default=1.1,
+                            help='Exponent of the Zipf distribution used to pick popular users and communities')
+        parser.add_argument('--days', type=int, default=30, help='Amount of days over which content is spread')
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows per bulk insert')
+        parser.add_argument('--prefix', type=str, default=None,
+                            help='Prefix of the generated usernames and community names. Random if not given.')
+        parser.add_argument('--password', type=str, default='password',
+                            help='Password set on all the generated users')
+        parser.add_argument('--seed', type=int, default=None, help='Seed for reproducible graphs')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        fake.seed_instance(options['seed'])
+
+        self.batch_size = options['batch_size']
+        self.prefix = options['prefix'] or 'sg%s_' % uuid.uuid4().hex[:6]
+        self.days = options['days']
+        self.now = timezone.now()
+        self.zipf_exponent = options['zipf_exponent']
+
+        users_amount = options['users']
+        communities_amount = min(options['communities'], users_amount)
+
+        if users_amount < 2:
+            raise CommandError('At least 2 users are required to generate a graph')
+
+        if not Circle.objects.filter(pk=settings.WORLD_CIRCLE_ID).exists():
+            raise CommandError('The world circle does not exist, load the circles fixture first')
+
+        logger.info('Generating social graph with prefix %s' % self.prefix)
+
+        with transaction.atomic():
+            users_ids = self._generate_users(amount=users_amount, password=options['password'])
+            circles = self._generate_circles(users_ids=users_ids)
+            lists = self._generate_lists(users_ids=users_ids)
+            follows = self._generate_follows(users_ids=users_ids, lists=lists, max_follows=options['max_follows'])
+            self._generate_connections(users_ids=users_ids, circles=circles,
+                                       max_connections=options['max_connections'])
+            memberships = self._generate_communities(users_ids=users_ids, amount=communities_amount,
+                                                     max_memberships=options['max_memberships'])
+
+        with transaction.atomic():
+            posts = self._generate_posts(users_ids=users_ids, circles=circles, memberships=memberships,
+                                         posts_per_user=options['posts_per_user'])
+            comments = self._generate_comments(users_ids=users_ids, posts=posts,
+                                               comments_per_post=options['comments_per_post'])
+            reactions = self._generate_reactions(users_ids=users_ids, posts=posts,
+                                                 reactions_per_post=options['reactions_per_post'])
+            self._generate_notifications(follows=follows, comments=comments, reactions=reactions)
+
+        self.stdout.write(self.style.SUCCESS(
+            'Generated %d users with prefix %s. Log in with any of them using the password "%s"' % (
+                len(users_ids), self.prefix, options['password'])))
+
+    def _random_created(self):
+        return self.now - timedelta(seconds=self.rng.randint(0, self.days * 24 * 60 * 60))
+
+    def _bulk_create(self, model, objects):
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        logger.info('Inserted %d %s rows' % (len(objects), model.__name__))
+
+    def _generate_users(self, amount, password):
+        hashed_password = make_password(password)
+
+        users = [User(username='%s%d' % (self.prefix, index), email='%s%d@example.com' % (self.prefix, index),
+                      password=hashed_password, is_email_verified=True, are_guidelines_accepted=True,
+                      date_joined=self._random_created())
+                 for index in range(amount)]
+        self._bulk_create(User, users)
+        add_taken_usernames([user.username for user in users])
+        add_taken_emails([user.email for user in users])
+
+        # bulk_create does not set primary keys on all backends, nor does it fire the post_save bootstrapping
+        users_ids = list(User.objects.filter(username__startswith=self.prefix).order_by('id').values_list('id',
+                                                                                                          flat=True))
+
+        self._bulk_create(UserProfile, [
+            UserProfile(user_id=user_id, name=fake.name()[:settings.PROFILE_NAME_MAX_LENGTH], is_of_legal_age=True,
+                        bio=fake.sentence()[:settings.PROFILE_BIO_MAX_LENGTH]) for user_id in users_ids])
+        self._bulk_create(UserNotificationsSettings, [UserNotificationsSettings(user_id=user_id) for user_id in users_ids])
+        self._bulk_create(Token, [Token(user_id=user_id, key=Token().generate_key()) for user_id in users_ids])
+
+        return users_ids
+
+    def _generate_circles(self, users_ids):
+        """
+        Creates the connections circle plus two custom circles per user.
+        Returns a dict of user_id to the list of its circles ids, the connections circle being the first one.
+        """
+        circles_names = ('Connections', 'Friends', 'Family')
+        circles = [Circle(creator_id=user_id, name=name, color=fake.hex_color(), created=self._random_created())
+                   for user_id in users_ids for name in circles_names]
+        self._bulk_create(Circle, circles)
+
+        users_circles = {user_id: [] for user_id in users_ids}
+        connections_circles = {}
+
+        for circle_id, creator_id, name in Circle.objects.filter(creator_id__in=users_ids).order_by('id').values_list(
+                'id', 'creator_id', 'name'):
+            if name == 'Connections':
+                connections_circles[creator_id] = circle_id
+                users_circles[creator_id].insert(0, circle_id)
+            else:
+                users_circles[creator_id].append(circle_id)
+
+        users = [User(pk=user_id, connections_circle_id=circle_id) for user_id, circle_id in
+                 connections_circles.items()]
+        User.objects.bulk_update(users, ['connections_circle_id'], batch_size=self.batch_size)
+
+        return users_circles
+
+    def _generate_lists(self, users_ids):
+        emojis_ids = list(Emoji.objects.values_list('id', flat=True))
+        lists_names = ('Close friends', 'Work', 'News')
+
+        lists = [List(creator_id=user_id, name=name, created=self._random_created(),
+                      emoji_id=self.rng.choice(emojis_ids) if emojis_ids else None)
+                 for user_id in users_ids for name in lists_names]
+        self._bulk_create(List, lists)
+
+        users_lists = {user_id: [] for user_id in users_ids}
+        for list_id, creator_id in List.objects.filter(creator_id__in=users_ids).values_list('id', 'creator_id'):
+            users_lists[creator_id].append(list_id)
+
+        return users_lists
+
+    def _generate_follows(self, users_ids, lists, max_follows):
+        sampler = ZipfSampler(size=len(users_ids), exponent=self.zipf_exponent, rng=self.rng)
+
+        follows = []
+        for index, user_id in enumerate(users_ids):
+            follows_amount = self.rng.randint(0, max_follows)
+            for followed_index in sampler.sample_distinct(follows_amount, exclude=index):
+                follows.append(Follow(user_id=user_id, followed_user_id=users_ids[followed_index]))
+        self._bulk_create(Follow, follows)
+
+        follows = list(Follow.objects.filter(user_id__in=users_ids).values_list('id', 'user_id', 'followed_user_id'))
+
+        ListFollow = List.follows.through
+        lists_follows = []
+        for follow_id, user_id, followed_user_id in follows:
+            if self.rng.random() < 0.5:
+                lists_follows.append(ListFollow(list_id=self.rng.choice(lists[user_id]), follow_id=follow_id))
+        self._bulk_create(ListFollow, lists_follows)
+
+        return follows
+
+    def _generate_connections(self, users_ids, circles, max_connections):
+        sampler = ZipfSampler(size=len(users_ids), exponent=self.zipf_exponent, rng=self.rng)
+
+        pairs = set()
+        for index, user_id in enumerate(users_ids):
+            connections_amount = self.rng.randint(0, max_connections)
+            for target_index in sampler.sample_distinct(connections_amount, exclude=index):
+                pair = (user_id, users_ids[target_index])
+                if (pair[1], pair[0]) not in pairs:
+                    pairs.add(pair)
+
+        connections = []
+        for user_id, target_user_id in pairs:
+            connections.append(Connection(user_id=user_id, target_user_id=target_user_id))
+            connections.append(Connection(user_id=target_user_id, target_user_id=user_id))
+        self._bulk_create(Connection, connections)
+
+        connections_ids = {(user_id, target_user_id): connection_id for connection_id, user_id, target_user_id in
+                           Connection.objects.filter(user_id__in=users_ids).values_list('id', 'user_id',
+                                                                                          'target_user_id')}
+
+        connections = []
+        connections_circles = []
+        for (user_id, target_user_id), connection_id in connections_ids.items():
+            connections.append(
+                Connection(pk=connection_id, target_connection_id=connections_ids[(target_user_id, user_id)]))
+
+            user_circles = circles[user_id]
+            connections_circles.append(ConnectionCircle(connection_id=connection_id, circle_id=user_circles[0]))
+            if self.rng.random() < 0.3:
+                connections_circles.append(
+                    ConnectionCircle(connection_id=connection_id, circle_id=self.rng.choice(user_circles[1:])))
+
+        Connection.objects.bulk_update(connections, ['target_connection_id'], batch_size=self.batch_size)
+        self._bulk_create(ConnectionCircle, connections_circles)
+        Circle.update_users_counts(circles_query=Q())
+
+    def _generate_communities(self, users_ids, amount, max_memberships):
+        """
+        Creates the communities and their memberships.
+        Returns a dict of user_id to the list of the ids of the communities the user is member of.
+        """
+        creators_ids = self.rng.sample(users_ids, amount)
+
+        communities = [
+            Community(creator_id=creator_id, name='%s%d' % (self.prefix, index), title=fake.catch_phrase()[:settings.COMMUNITY_TITLE_MAX_LENGTH],
+                      description=fake.sentence(), color=fake.hex_color(), created=self._random_created(),
+                      type=Community.COMMUNITY_TYPE_PRIVATE if self.rng.random() < 0.1 else
+                      Community.COMMUNITY_TYPE_PUBLIC)
+            for index, creator_id in enumerate(creators_ids)]
+        self._bulk_create(Community, communities)
+
+        communities = list(
+            Community.objects.filter(name__startswith=self.prefix).order_by('id').values_list('id', 'creator_id'))
+
+        users_memberships = {user_id: set() for user_id in users_ids}
+        memberships = []
+
+        for community_id, creator_id in communities:
+            users_memberships[creator_id].add(community_id)
+            memberships.append(CommunityMembership(user_id=creator_id, community_id=community_id,
+                                                   is_administrator=True, created=self._random_created()))
+
+        sampler = ZipfSampler(size=len(communities), exponent=self.zipf_exponent, rng=self.rng)
+
+        for user_id in users_ids:
+            for community_index in sampler.sample_distinct(self.rng.randint(0, max_memberships)):
+                community_id = communities[community_index][0]
+                if community_id in users_memberships[user_id]:
+                    continue
+                users_memberships[user_id].add(community_id)
+                memberships.append(CommunityMembership(user_id=user_id, community_id=community_id,
+                                                       is_moderator=self.rng.random() < 0.01,
+                                                       created=self._random_created()))
+
+        self._bulk_create(CommunityMembership, memberships)
+
+        return {user_id: list(communities_ids) for user_id, communities_ids in users_memberships.items()}
+
+    def _generate_posts(self, users_ids, circles, memberships, posts_per_user):
+        """
+        Returns a list of (post_id, creator_id, community_id) tuples.
+        """
+        posts = []
+        posts_circles = {}
+
+        for user_id in users_ids:
+            for i in range(self.rng.randint(0, posts_per_user * 2)):
+                post_uuid = uuid.uuid4()
+                community_id = None
+
+                if memberships[user_id] and self.rng.random() < 0.3:
+                    community_id = self.rng.choice(memberships[user_id])
+                elif self.rng.random() < 0.7:
+                    posts_circles[post_uuid] = settings.WORLD_CIRCLE_ID
+                else:
+                    posts_circles[post_uuid] = self.rng.choice(circles[user_id])
+
+                posts.append(Post(uuid=post_uuid, creator_id=user_id, community_id=community_id,
+                                  text=fake.text(max_nb_chars=min(280, settings.POST_MAX_LENGTH)),
+                                  created=self._random_created()))
+
+        self._bulk_create(Post, posts)
+
+        PostCircle = Post.circles.through
+        posts_rows = []
+        posts_circles_rows = []
+
+        for post_id, post_uuid, creator_id, community_id in Post.objects.filter(creator_id__in=users_ids).values_list(
+                'id', 'uuid', 'creator_id', 'community_id'):
+            posts_rows.append((post_id, creator_id, community_id))
+            circle_id = posts_circles.get(post_uuid)
+            if circle_id:
+                posts_circles_rows.append(PostCircle(post_id=post_id, circle_id=circle_id))
+
+        self._bulk_create(PostCircle, posts_circles_rows)
+
+        return posts_rows
+
+    def _generate_comments(self, users_ids, posts, comments_per_post):
+        """
+        Returns a list of (post_comment_id, commenter_id, post_creator_id) tuples.
+        """
+        sampler = ZipfSampler(size=len(users_ids), exponent=self.zipf_exponent, rng=self.rng)
+
+        comments = []
+        for post_id, creator_id, community_id in posts:
+            for i in range(self.rng.randint(0, comments_per_post * 2)):
+                comments.append(PostComment(post_id=post_id, commenter_id=users_ids[sampler.sample()],
+                                            text=fake.sentence()[:settings.POST_COMMENT_MAX_LENGTH],
+                                            created=self._random_created()))
+        self._bulk_create(PostComment, comments)
+
+        return list(PostComment.objects.filter(post__creator_id__in=users_ids).values_list('id', 'commenter_id',
+                                                                                              'post__creator_id'))
+
+    def _generate_reactions(self, users_ids, posts, reactions_per_post):
+        """
+        Returns a list of (post_reaction_id, reactor_id, post_creator_id) tuples.
+        """
+        emojis_ids = list(Emoji.objects.filter(group__is_reaction_group=True).values_list('id', flat=True))
+
+        if not emojis_ids:
+            self.stderr.write('No reaction emojis found, skipping reactions. Load the emoji fixtures to generate them.')
+            return []
+
+        sampler = ZipfSampler(size=len(users_ids), exponent=self.zipf_exponent, rng=self.rng)
+
+        reactions = []
+        for post_id, creator_id, community_id in posts:
+            for reactor_index in sampler.sample_distinct(self.rng.randint(0, reactions_per_post * 2)):
+                reactions.append(PostReaction(post_id=post_id, reactor_id=users_ids[reactor_index],
+                                              emoji_id=self.rng.choice(emojis_ids), created=self._random_created()))
+        self._bulk_create(PostReaction, reactions)
+
+        return list(PostReaction.objects.filter(post__creator_id__in=users_ids).values_list('id', 'reactor_id',
+                                                                                               'post__creator_id'))
+
+    def _generate_notifications(self, follows, comments, reactions):
+        follow_notifications = [(FollowNotification(follower_id=user_id), followed_user_id) for
+                                follow_id, user_id, followed_user_id in follows]
+
+        post_comment_notifications = [(PostCommentNotification(post_comment_id=post_comment_id), post_creator_id) for
+                                      post_comment_id, commenter_id, post_creator_id in comments if
+                                      commenter_id != post_creator_id]
+
+        post_reaction_notifications = [(PostReactionNotification(post_reaction_id=post_reaction_id), post_creator_id)
+                                       for post_reaction_id, reactor_id, post_creator_id in reactions if
+                                       reactor_id != post_creator_id]
+
+        self._bulk_create_notifications(FollowNotification, Notification.FOLLOW, follow_notifications)
+        self._bulk_create_notifications(PostCommentNotification, Notification.POST_COMMENT,
+                                        post_comment_notifications)
+        self._bulk_create_notifications(PostReactionNotification, Notification.POST_REACTION,
+                                        post_reaction_notifications)
+
+    def _bulk_create_notifications(self, model, notification_type, notifications_with_owners):
+        if not notifications_with_owners:
+            return
+
+        # The ids of the created rows are recovered from the id range, as the table might not be empty
+        last_id = model.objects.order_by('-id').values_list('id', flat=True).first() or 0
+        self._bulk_create(model, [notification for notification, owner_id in notifications_with_owners])
+        created_ids = list(model.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True))
+
+        content_type = ContentType.objects.get_for_model(model)
+
+        self._bulk_create(Notification, [
+            Notification(owner_id=owner_id, notification_type=notification_type, content_type=content_type,
+                         object_id=object_id, created=self._random_created(), read=self.rng.random() < 0.5)
+            for object_id, (notification, owner_id) in zip(created_ids, notifications_with_owners)])
@@ -0,0 +1,33 @@
+# Generated by Django 2.2 on 2026-10-19 10:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('openbook_common', '0012_auto_20190202_1320'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageRendition',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('field_name', models.CharField(max_length=64, verbose_name='field name')),
+                ('source', models.CharField(max_length=255, verbose_name='source')),
+                ('name', models.CharField(max_length=32, verbose_name='name')),
+                ('key', models.CharField(max_length=255, verbose_name='key')),
+                ('width', models.PositiveIntegerField(verbose_name='width')),
+                ('height', models.PositiveIntegerField(verbose_name='height')),
+                ('created', models.DateTimeField(editable=False)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.ContentType')),
+            ],
+            options={
+                'unique_together': {('content_type', 'object_id', 'field_name', 'name')},
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 2.2 on 2026-10-19 10:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openbook_common', '0013_imagerendition'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaTombstone',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field', models.CharField(max_length=128, verbose_name='field')),
+                ('key', models.CharField(max_length=255, verbose_name='key')),
+                ('created', models.DateTimeField(db_index=True, editable=False)),
+            ],
+        ),
+    ]
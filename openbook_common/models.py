@@ -1,11 +1,19 @@
 # Create your models here.
 # Create your models here.
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 # Create your views here.
 from openbook.settings import COLOR_ATTR_MAX_LENGTH
+from openbook_common.utils.media_garbage import bury_media_keys
+from openbook_common.utils.reference_cache import emojis_reference_cache, emoji_groups_reference_cache, \
+    badges_reference_cache
+from openbook_common.utils.resource_versions import bump_resources_versions, EMOJI_GROUPS_RESOURCE
 from openbook_common.validators import hex_color_validator
 
 
@@ -59,3 +67,85 @@ class Badge(models.Model):
         if not self.id:
             self.created = timezone.now()
         return super(Badge, self).save(*args, **kwargs)
+
+
+class ImageRendition(models.Model):
+    # Generic relation types
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey()
+    field_name = models.CharField(_('field name'), max_length=64, blank=False, null=False)
+    # The name of the field file the rendition was made for, renditions of a replaced file are stale
+    source = models.CharField(_('source'), max_length=255, blank=False, null=False)
+    name = models.CharField(_('name'), max_length=32, blank=False, null=False)
+    key = models.CharField(_('key'), max_length=255, blank=False, null=False)
+    width = models.PositiveIntegerField(_('width'), null=False)
+    height = models.PositiveIntegerField(_('height'), null=False)
+    created = models.DateTimeField(editable=False)
+
+    class Meta:
+        unique_together = (('content_type', 'object_id', 'field_name', 'name'),)
+
+    def save(self, *args, **kwargs):
+        if not self.id:
+            self.created = timezone.now()
+        return super(ImageRendition, self).save(*args, **kwargs)
+
+    def get_field(self):
+        return self.content_type.model_class()._meta.get_field(self.field_name)
+
+    def get_storage(self):
+        return self.get_field().storage
+
+    def get_url(self):
+        return self.get_storage().url(self.key)
+
+
+class MediaTombstone(models.Model):
+    """
+    A stored file left to be deleted by the media garbage collection job
+    """
+    # The model field the file was stored with as app_label.Model.field, which tells the storage it lives in
+    field = models.CharField(_('field'), max_length=128, blank=False, null=False)
+    key = models.CharField(_('key'), max_length=255, blank=False, null=False)
+    created = models.DateTimeField(editable=False, db_index=True)
+
+    def save(self, *args, **kwargs):
+        if not self.id:
+            self.created = timezone.now()
+        return super(MediaTombstone, self).save(*args, **kwargs)
+
+
+@receiver([post_save, post_delete], sender=EmojiGroup, dispatch_uid='bump_emoji_group_versions')
+@receiver([post_save, post_delete], sender=Emoji, dispatch_uid='bump_emoji_versions')
+def bump_emoji_groups_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the emoji groups
+    """
+    bump_resources_versions([EMOJI_GROUPS_RESOURCE])
+
+
+@receiver([post_save, post_delete], sender=EmojiGroup, dispatch_uid='invalidate_emoji_group_reference_caches')
+@receiver([post_save, post_delete], sender=Emoji, dispatch_uid='invalidate_emoji_reference_caches')
+def invalidate_emoji_reference_caches(sender, instance=None, **kwargs):
+    """"
+    Invalidate the in-process copies of the emojis and emoji groups
+    """
+    emojis_reference_cache.invalidate()
+    emoji_groups_reference_cache.invalidate()
+
+
+@receiver([post_save, post_delete], sender=Badge, dispatch_uid='invalidate_badge_reference_cache')
+def invalidate_badge_reference_cache(sender, instance=None, **kwargs):
+    """"
+    Invalidate the in-process copies of the badges
+    """
+    badges_reference_cache.invalidate()
+
+
+@receiver(post_delete, sender=ImageRendition, dispatch_uid='delete_image_rendition_file')
+def delete_image_rendition_file(sender, instance=None, **kwargs):
+    """"
+    Delete the rendition file once its row is gone for good
+    """
+    bury_media_keys(field=instance.get_field(), keys=[instance.key])
@@ -9,3 +9,21 @@ class ApiMessageResponse(Response):
 
     def __init__(self, message, status=status.HTTP_200_OK, template_name=None, headers=None, content_type=None):
         super().__init__({'message': message}, status, template_name, headers, content_type)
+
+
+class CursorPaginatedResponse(Response):
+    """
+    A Response for a CursorPage, with the cursors of the sibling pages in the headers
+    so the body stays a plain list
+    """
+
+    def __init__(self, data, page, status=status.HTTP_200_OK, template_name=None, headers=None, content_type=None):
+        headers = headers or {}
+
+        if page.next_cursor:
+            headers['X-Next-Cursor'] = page.next_cursor
+
+        if page.previous_cursor:
+            headers['X-Previous-Cursor'] = page.previous_cursor
+
+        super().__init__(data, status, template_name, headers, content_type)
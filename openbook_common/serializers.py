@@ -1,8 +1,54 @@
+from django.conf import settings
 from rest_framework import serializers
 
 from openbook_common.models import Emoji, EmojiGroup
 
 
+class SparseFieldsetsSerializerMixin:
+    """
+    Lets clients pick the fields of the top level serializer with the fields and exclude query params,
+    e.g. ?exclude=reactions_emoji_counts,comments_count
+
+    Pruned fields are never bound, so the queries of their to_representation never run.
+    """
+    always_included_fields = ('id',)
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        request = self.context.get('request')
+
+        if not request or not self._is_top_level_serializer():
+            return fields
+
+        query_params = getattr(request, 'query_params', request.GET)
+
+        only_fields = self._parse_fields_param(query_params.get('fields'))
+        excluded_fields = self._parse_fields_param(query_params.get('exclude'))
+
+        for field_name in list(fields.keys()):
+            if field_name in self.always_included_fields:
+                continue
+
+            if (only_fields and field_name not in only_fields) or field_name in excluded_fields:
+                fields.pop(field_name)
+
+        return fields
+
+    def _is_top_level_serializer(self):
+        parent = self.parent
+
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+
+        return parent is None
+
+    def _parse_fields_param(self, value):
+        if not value:
+            return set()
+        return {field_name.strip() for field_name in value.split(',') if field_name.strip()}
+
+
 class EmojiSerializer(serializers.ModelSerializer):
     class Meta:
         model = Emoji
@@ -20,7 +66,8 @@ class EmojiGroupSerializer(serializers.ModelSerializer):
     emojis = serializers.SerializerMethodField()
 
     def get_emojis(self, obj):
-        emojis = obj.emojis.all().order_by('order')
+        # Sorted in python so the emojis prefetched by the reference cache are reused
+        emojis = sorted(obj.emojis.all(), key=lambda emoji: (emoji.order, emoji.pk))
 
         request = self.context['request']
         return EmojiSerializer(emojis, many=True, context={'request': request}).data
@@ -36,3 +83,21 @@ class EmojiGroupSerializer(serializers.ModelSerializer):
             'order',
             'emojis',
         )
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    url = serializers.CharField(max_length=2000, required=True, allow_blank=False)
+    method = serializers.ChoiceField(choices=['GET'], required=False, default='GET')
+
+    def validate_url(self, url):
+        if not url.startswith('/api/'):
+            raise serializers.ValidationError('Only API urls can be batched.')
+        return url
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = serializers.ListField(
+        child=BatchRequestSerializer(),
+        min_length=1,
+        max_length=settings.BATCH_MAX_REQUESTS
+    )
@@ -0,0 +1,63 @@
+from rest_framework.fields import Field, FileField
+
+
+def get_media_url(context, storage, name):
+    """
+    The url of the file from the media_urls of the serializer context when given, from the storage otherwise
+    """
+    url = context.get('media_urls', {}).get(name) or storage.url(name)
+
+    request = context.get('request')
+
+    if request is not None:
+        return request.build_absolute_uri(url)
+
+    return url
+
+
+class MediaUrlField(FileField):
+    """
+    A read only FileField using the media_urls of the serializer context, see get_posts_media_urls
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super(MediaUrlField, self).__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return None
+
+        return get_media_url(context=self.context, storage=value.storage, name=value.name)
+
+
+class ImageRenditionsField(Field):
+    """
+    The renditions of the given image field as {name: {url, width, height}}, empty until they have been processed
+    """
+
+    def __init__(self, image_field_name, **kwargs):
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        self.image_field_name = image_field_name
+        super(ImageRenditionsField, self).__init__(**kwargs)
+
+    def to_representation(self, instance):
+        field_file = getattr(instance, self.image_field_name)
+
+        serialized_renditions = {}
+
+        if not field_file:
+            return serialized_renditions
+
+        for rendition in instance.image_renditions.all():
+            if rendition.field_name != self.image_field_name or rendition.source != field_file.name:
+                continue
+
+            serialized_renditions[rendition.name] = {
+                'url': get_media_url(context=self.context, storage=field_file.storage, name=rendition.key),
+                'width': rendition.width,
+                'height': rendition.height,
+            }
+
+        return serialized_renditions
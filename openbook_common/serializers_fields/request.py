@@ -1,9 +1,11 @@
 from rest_framework.exceptions import ValidationError
-from rest_framework.fields import URLField, FileField
+from rest_framework.fields import URLField, FileField, CharField
 from django.template.defaultfilters import filesizeformat
 from django.utils.translation import ugettext_lazy as _
 from django.forms import ImageField as DjangoImageField
 
+from openbook_common.utils.pagination import Cursor
+
 
 class FriendlyUrlField(URLField):
     def to_internal_value(self, data):
@@ -62,3 +64,13 @@ class RestrictedImageFileSizeField(RestrictedFileSizeField):
         django_field = self._DjangoImageField()
         django_field.error_messages = self.error_messages
         return django_field.clean(file_object)
+
+
+class CursorField(CharField):
+    """
+    An opaque pagination cursor, validated into a Cursor
+    """
+
+    def to_internal_value(self, data):
+        data = super().to_internal_value(data)
+        return Cursor.decode(data)
@@ -0,0 +1,53 @@
+from django.core.files import File
+from django.test import TestCase
+
+from openbook_common.models import MediaTombstone
+from openbook_common.tests.helpers import make_user, make_post_image
+from openbook_common.utils.media_garbage import delete_buried_media, bury_media_keys
+
+
+class MediaGarbageTests(TestCase):
+    """
+    Media garbage collection
+    """
+
+    def test_deleting_post_buries_its_image(self):
+        """
+        should leave the image of a deleted post in place until the media garbage is collected
+        """
+        user = make_user()
+        post = user.create_public_post(image=File(make_post_image()))
+
+        image_field_file = post.image.image
+        image_storage = image_field_file.storage
+        image_name = image_field_file.name
+
+        user.delete_post_with_id(post.pk)
+
+        self.assertTrue(image_storage.exists(image_name))
+        self.assertTrue(MediaTombstone.objects.filter(field='openbook_posts.PostImage.image', key=image_name).exists())
+
+        deleted_count = delete_buried_media()
+
+        self.assertEqual(deleted_count, 1)
+        self.assertFalse(image_storage.exists(image_name))
+        self.assertFalse(MediaTombstone.objects.exists())
+
+    def test_collects_in_batches(self):
+        """
+        should delete every buried file whatever the batch size
+        """
+        user = make_user()
+        posts = [user.create_public_post(image=File(make_post_image())) for i in range(3)]
+
+        image_field = posts[0].image._meta.get_field('image')
+        images_names = [post.image.image.name for post in posts]
+
+        bury_media_keys(field=image_field, keys=images_names)
+
+        deleted_count = delete_buried_media(batch_size=2)
+
+        self.assertEqual(deleted_count, 3)
+        for image_name in images_names:
+            self.assertFalse(image_field.storage.exists(image_name))
+        self.assertFalse(MediaTombstone.objects.exists())
@@ -0,0 +1,91 @@
+import time
+
+from django.test import TestCase, override_settings
+
+from openbook_common.tests.helpers import make_emoji_group, make_emoji, make_category
+from openbook_common.utils.reference_cache import emoji_groups_reference_cache, emojis_reference_cache, \
+    categories_reference_cache, get_reference_cache_version
+
+
+@override_settings(REFERENCE_CACHE_ENABLED=True)
+class ReferenceCacheTests(TestCase):
+    """
+    ReferenceCache
+    """
+
+    def setUp(self):
+        emoji_groups_reference_cache.invalidate()
+        emojis_reference_cache.invalidate()
+        categories_reference_cache.invalidate()
+
+    def test_lookups_dont_query_once_loaded(self):
+        """
+        should only query the table on the first lookup
+        """
+        emoji_group = make_emoji_group(is_reaction_group=True)
+        emoji = make_emoji(group=emoji_group)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(emojis_reference_cache.get(id=emoji.pk).keyword, emoji.keyword)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(emojis_reference_cache.get(id=emoji.pk).pk, emoji.pk)
+            self.assertEqual(emojis_reference_cache.get(keyword=emoji.keyword).pk, emoji.pk)
+            self.assertIsNone(emojis_reference_cache.get(id=emoji.pk + 1))
+
+    def test_saving_invalidates_the_cache(self):
+        """
+        should see the rows saved after the cache was loaded
+        """
+        category = make_category()
+
+        self.assertEqual([cached.pk for cached in categories_reference_cache.all()], [category.pk])
+
+        other_category = make_category()
+
+        self.assertEqual(categories_reference_cache.get(name=other_category.name).pk, other_category.pk)
+
+    def test_emoji_groups_come_with_their_emojis(self):
+        """
+        should load the emoji groups along with their emojis
+        """
+        emoji_group = make_emoji_group(is_reaction_group=True)
+        emoji = make_emoji(group=emoji_group)
+
+        emoji_groups_reference_cache.get(id=emoji_group.pk)
+
+        with self.assertNumQueries(0):
+            cached_emoji_group = emoji_groups_reference_cache.get(id=emoji_group.pk)
+            self.assertEqual([cached_emoji.pk for cached_emoji in cached_emoji_group.emojis.all()], [emoji.pk])
+
+    def test_newer_version_reloads_the_cache(self):
+        """
+        should reload the cache once notified of a newer version by another worker
+        """
+        make_category()
+
+        categories_reference_cache.all()
+
+        categories_reference_cache.notify_version(get_reference_cache_version('categories') + 1)
+
+        with self.assertNumQueries(1):
+            categories_reference_cache.all()
+
+    def test_published_invalidation_is_received(self):
+        """
+        should be notified of the invalidations published by other workers
+        """
+        make_category()
+
+        categories_reference_cache.all()
+
+        version = get_reference_cache_version('categories')
+
+        categories_reference_cache._publish_invalidation()
+
+        for i in range(50):
+            if categories_reference_cache._latest_version > version:
+                break
+            time.sleep(0.1)
+
+        self.assertGreater(categories_reference_cache._latest_version, version)
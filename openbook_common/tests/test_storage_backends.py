@@ -0,0 +1,45 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from openbook.storage_backends import S3PrivateMediaStorage
+
+
+class S3PrivateMediaStorageTests(TestCase):
+    """
+    S3PrivateMediaStorage
+    """
+
+    def setUp(self):
+        cache.delete_many(['signed_media_url:posts/a.jpg', 'signed_media_url:posts/b.jpg'])
+
+    def test_urls_are_signed_once(self):
+        """
+        should reuse the cached presigned urls instead of signing them again
+        """
+        storage = S3PrivateMediaStorage(location='')
+
+        with mock.patch.object(S3Boto3Storage, 'url', side_effect=lambda name: 'https://signed/%s' % name) as url:
+            self.assertEqual(storage.urls(['posts/a.jpg', 'posts/b.jpg']), {
+                'posts/a.jpg': 'https://signed/posts/a.jpg',
+                'posts/b.jpg': 'https://signed/posts/b.jpg',
+            })
+            self.assertEqual(storage.url('posts/a.jpg'), 'https://signed/posts/a.jpg')
+            self.assertEqual(storage.urls(['posts/b.jpg']), {'posts/b.jpg': 'https://signed/posts/b.jpg'})
+
+        self.assertEqual(url.call_count, 2)
+
+    def test_urls_with_parameters_are_not_cached(self):
+        """
+        should sign the urls asked with custom parameters every time
+        """
+        storage = S3PrivateMediaStorage(location='')
+
+        with mock.patch.object(S3Boto3Storage, 'url', return_value='https://signed/download') as url:
+            storage.url('posts/a.jpg', parameters={'ResponseContentDisposition': 'attachment'})
+            storage.url('posts/a.jpg', parameters={'ResponseContentDisposition': 'attachment'})
+
+        self.assertEqual(url.call_count, 2)
+        self.assertIsNone(cache.get('signed_media_url:posts/a.jpg'))
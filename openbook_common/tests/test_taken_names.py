@@ -0,0 +1,103 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django_redis import get_redis_connection
+
+from openbook_auth.models import User
+from openbook_common.tests.helpers import make_user
+from openbook_common.utils.taken_names import TAKEN_USERNAMES_KEY, TAKEN_EMAILS_KEY
+from openbook_invitations.models import UserInvite
+
+
+@override_settings(TAKEN_NAMES_INDEX_ENABLED=True)
+class TakenNamesIndexesTests(TestCase):
+    """
+    Taken names indexes
+    """
+
+    def setUp(self):
+        get_redis_connection('default').delete(TAKEN_USERNAMES_KEY, TAKEN_EMAILS_KEY)
+
+    def tearDown(self):
+        get_redis_connection('default').delete(TAKEN_USERNAMES_KEY, TAKEN_EMAILS_KEY)
+
+    def test_free_names_dont_query_once_built(self):
+        """
+        should answer that a username or email is free without querying the database once the indexes are built
+        """
+        make_user()
+
+        call_command('build_taken_names_indexes', batch_size=1)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(User.is_username_taken('free_username'))
+            self.assertFalse(User.is_email_taken('free@example.com'))
+
+    def test_taken_names_are_confirmed(self):
+        """
+        should answer that the names of the users and invites built in the indexes or saved afterwards are taken
+        """
+        user = make_user()
+        invite = UserInvite.objects.create(username='invited_username', email='invited@example.com')
+
+        call_command('build_taken_names_indexes')
+
+        created_user = make_user()
+        UserInvite.bulk_create_invites([UserInvite(username='bulk_invited_username', email='bulk@example.com')])
+
+        for username in (user.username, invite.username, created_user.username, 'bulk_invited_username'):
+            self.assertTrue(User.is_username_taken(username))
+
+        self.assertTrue(User.is_email_taken(created_user.email))
+
+    def test_saving_other_fields_leaves_indexes(self):
+        """
+        should only update the indexes when the username or email of a saved user changed
+        """
+        user = User.objects.get(pk=make_user().pk)
+
+        with mock.patch('openbook_common.utils.taken_names._add_names') as add_names:
+            user.invite_count = 5
+            user.save()
+
+            self.assertFalse(add_names.called)
+
+    def test_renamed_user_releases_former_username(self):
+        """
+        should take the new username of a renamed user and release the former one
+        """
+        user = User.objects.get(pk=make_user().pk)
+        former_username = user.username
+
+        call_command('build_taken_names_indexes')
+
+        # The callbacks on commit never run within a test case
+        with mock.patch('django.db.transaction.on_commit', side_effect=lambda callback: callback()):
+            user.update_username('renamed_username')
+
+        self.assertTrue(User.is_username_taken('renamed_username'))
+
+        with self.assertNumQueries(0):
+            self.assertFalse(User.is_username_taken(former_username))
+
+    def test_released_names_stay_taken_while_in_database(self):
+        """
+        should only release a username from the index once no user nor invite has it anymore
+        """
+        user = make_user()
+        invite = UserInvite.objects.create(username=user.username, email='invited@example.com')
+
+        call_command('build_taken_names_indexes')
+
+        # The callbacks on commit never run within a test case
+        with mock.patch('django.db.transaction.on_commit', side_effect=lambda callback: callback()):
+            invite.delete()
+
+            self.assertTrue(User.is_username_taken(user.username))
+
+            user.delete()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(User.is_username_taken(user.username))
+            self.assertFalse(User.is_email_taken(user.email))
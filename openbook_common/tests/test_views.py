@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -5,7 +6,8 @@ from rest_framework.test import APITestCase
 import logging
 import json
 
-from openbook_common.tests.helpers import make_emoji_group, make_emoji, make_user, make_authentication_headers_for_user
+from openbook_common.tests.helpers import make_emoji_group, make_emoji, make_user, make_authentication_headers_for_user, \
+    make_fake_post_text
 
 logger = logging.getLogger(__name__)
 
@@ -96,5 +98,179 @@ class TestEmojiGroups(APITestCase):
 
         self.assertEqual(len(response_groups), 0)
 
+    def test_retrieve_unchanged_emoji_groups_returns_not_modified(self):
+        """
+        should return 304 when retrieving the emoji groups with the ETag of an unchanged previous response
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        make_emoji_group(is_reaction_group=False)
+
+        url = self._get_url()
+
+        response = self.client.get(url, **headers)
+        etag = response['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_changed_emoji_groups_returns_modified(self):
+        """
+        should return 200 when retrieving the emoji groups with the ETag of a response previous to a new group
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        make_emoji_group(is_reaction_group=False)
+
+        url = self._get_url()
+
+        response = self.client.get(url, **headers)
+        etag = response['ETag']
+
+        make_emoji_group(is_reaction_group=False)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_groups = json.loads(response.content)
+
+        self.assertEqual(len(response_groups), 2)
+
     def _get_url(self):
         return reverse('emoji-groups')
+
+
+class TestBatch(APITestCase):
+    """
+    Batch API
+    """
+
+    def test_can_batch_requests(self):
+        """
+        should be able to retrieve several urls in a single request and return 200
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        make_emoji_group(is_reaction_group=False)
+
+        batch_urls = [reverse('emoji-groups'), reverse('authenticated-user'), reverse('circles')]
+
+        response = self.client.post(self._get_url(), {
+            'requests': [{'url': batch_url} for batch_url in batch_urls]
+        }, format='json', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        parsed_response = json.loads(response.content)
+
+        self.assertEqual([batch_response['url'] for batch_response in parsed_response], batch_urls)
+
+        for batch_response in parsed_response:
+            self.assertEqual(batch_response['status'], status.HTTP_200_OK)
+
+        self.assertEqual(len(parsed_response[0]['body']), 1)
+        self.assertEqual(parsed_response[1]['body']['username'], user.username)
+
+    def test_batch_requests_keep_query_params(self):
+        """
+        should pass the query params of each url to its view
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        for i in range(3):
+            user.create_public_post(text=make_fake_post_text())
+
+        response = self.client.post(self._get_url(), {
+            'requests': [{'url': '%s?count=1' % reverse('posts')}]
+        }, format='json', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        parsed_response = json.loads(response.content)
+
+        self.assertEqual(parsed_response[0]['status'], status.HTTP_200_OK)
+        self.assertEqual(len(parsed_response[0]['body']), 1)
+
+    def test_batch_returns_each_request_status(self):
+        """
+        should return the status of every request even when some of them fail
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        response = self.client.post(self._get_url(), {
+            'requests': [
+                {'url': reverse('circles')},
+                {'url': '/api/not-an-endpoint/'},
+                {'url': '%s?count=notanumber' % reverse('posts')},
+            ]
+        }, format='json', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        parsed_response = json.loads(response.content)
+
+        self.assertEqual([batch_response['status'] for batch_response in parsed_response],
+                         [status.HTTP_200_OK, status.HTTP_404_NOT_FOUND, status.HTTP_400_BAD_REQUEST])
+
+    def test_cant_nest_batch_requests(self):
+        """
+        should not be able to batch the batch endpoint
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        response = self.client.post(self._get_url(), {
+            'requests': [{'url': self._get_url()}]
+        }, format='json', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        parsed_response = json.loads(response.content)
+
+        self.assertEqual(parsed_response[0]['status'], status.HTTP_400_BAD_REQUEST)
+
+    def test_cant_batch_non_api_urls(self):
+        """
+        should not be able to batch urls outside the api and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        response = self.client.post(self._get_url(), {
+            'requests': [{'url': '/admin/'}]
+        }, format='json', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cant_batch_too_many_requests(self):
+        """
+        should not be able to batch more than BATCH_MAX_REQUESTS urls and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        response = self.client.post(self._get_url(), {
+            'requests': [{'url': reverse('circles')} for i in range(settings.BATCH_MAX_REQUESTS + 1)]
+        }, format='json', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cant_batch_unauthenticated(self):
+        """
+        should not be able to batch requests without being authenticated and return 401
+        """
+        response = self.client.post(self._get_url(), {
+            'requests': [{'url': reverse('circles')}]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def _get_url(self):
+        return reverse('batch')
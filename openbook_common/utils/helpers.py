@@ -1,8 +1,8 @@
 import secrets
 
 from django.http import QueryDict
-from imagekit.utils import get_cache
-from imagekit.models import ProcessedImageField
+
+from openbook_common.utils.media_garbage import bury_media_keys
 
 r = lambda: secrets.randbelow(255)
 
@@ -42,22 +42,28 @@ def generate_random_hex_color():
 
 
 def delete_file_field(filefield):
-
+    """
+    Leaves the file to the media garbage collection, which deletes it without holding up the request
+    """
     if not filefield:
         return
 
-    try:
-        file = filefield.file
+    bury_media_keys(field=filefield.field, keys=[filefield.name])
+
+
+def iterate_in_batches(query_set, batch_size):
+    """
+    Yields the rows of the query set as lists of batch_size rows, each fetched past the last id of the previous one
+    so neither the whole query set nor the offset of the batch is ever loaded
+    """
+    last_id = 0
 
-    except FileNotFoundError:
-        pass
+    while True:
+        batch = list(query_set.filter(pk__gt=last_id).order_by('pk')[:batch_size])
 
-    else:
+        if not batch:
+            return
 
-        if isinstance(filefield.field, ProcessedImageField):
-            # ImageKit has a bug where files are cached and not deleted right away
-            # https://github.com/matthewwithanm/django-imagekit/issues/229#issuecomment-315690575
-            cache = get_cache()
-            cache.delete(cache.get(file))
+        yield batch
 
-        filefield.storage.delete(file.name)
+        last_id = batch[-1].pk
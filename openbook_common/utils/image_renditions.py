@@ -0,0 +1,175 @@
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
+from django.db import models, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+from PIL import Image
+from pilkit.processors import ProcessorPipeline
+from pilkit.utils import save_image
+
+from openbook_common.utils.media_garbage import bury_media_keys
+from openbook_common.utils.model_loaders import get_image_rendition_model
+
+
+class ImageRenditionSpec:
+    """
+    A named resized copy of an image, e.g. a square thumbnail of an avatar
+    """
+
+    def __init__(self, name, processors, format='JPEG', quality=50):
+        self.name = name
+        self.processors = processors
+        self.format = format
+        self.quality = quality
+
+    @property
+    def extension(self):
+        return self.format.lower().replace('jpeg', 'jpg')
+
+    def as_webp(self):
+        return ImageRenditionSpec(name='%s_webp' % self.name, processors=self.processors, format='WEBP',
+                                  quality=self.quality)
+
+
+class RenditionedImageField(models.ImageField):
+    """
+    An ImageField storing uploads as they are, its renditions are produced by a background job which then
+    swaps the primary rendition in place of the upload
+    """
+
+    def __init__(self, *args, renditions=None, primary_rendition=None, **kwargs):
+        self.renditions = renditions or []
+        self.primary_rendition = primary_rendition
+        super().__init__(*args, **kwargs)
+
+    def contribute_to_class(self, cls, name, **kwargs):
+        super().contribute_to_class(cls, name, **kwargs)
+
+        if not cls._meta.abstract:
+            post_save.connect(self._enqueue_pending_renditions, sender=cls, weak=False,
+                              dispatch_uid='enqueue_image_renditions_%s_%s' % (cls._meta.label_lower, name))
+
+    def pre_save(self, model_instance, add):
+        file = getattr(model_instance, self.attname)
+        is_upload = bool(file) and not file._committed
+
+        file = super().pre_save(model_instance, add)
+
+        if is_upload and self.renditions:
+            model_instance.__dict__.setdefault('_pending_image_renditions', set()).add(self.attname)
+
+        return file
+
+    def get_renditions_specs(self):
+        specs = list(self.renditions)
+
+        if settings.IMAGE_RENDITIONS_WEBP_ENABLED:
+            specs.extend([spec.as_webp() for spec in self.renditions])
+
+        return specs
+
+    def _enqueue_pending_renditions(self, sender, instance=None, **kwargs):
+        pending_renditions = instance.__dict__.get('_pending_image_renditions')
+
+        if not pending_renditions or self.attname not in pending_renditions:
+            return
+
+        pending_renditions.discard(self.attname)
+
+        self.enqueue_renditions(instance)
+
+    def enqueue_renditions(self, instance):
+        """
+        Queues the processing of the renditions of the image of the instance once the transaction commits, to be
+        called for the instances saved without signals e.g. through bulk_create
+        """
+        # Imported here as the jobs import the models
+        from openbook_common.jobs import process_image_renditions
+
+        model_label = instance._meta.label
+        instance_id = instance.pk
+        field_name = self.attname
+        source_name = getattr(instance, self.attname).name
+
+        transaction.on_commit(lambda: process_image_renditions.delay(model_label=model_label, instance_id=instance_id,
+                                                                     field_name=field_name, source_name=source_name))
+
+
+def make_image_renditions(field_file, specs):
+    """
+    Renders every spec out of the stored image, returns (spec, key, width, height) tuples
+    """
+    storage = field_file.storage
+
+    with storage.open(field_file.name, 'rb') as source_file:
+        source_image = Image.open(source_file)
+        source_image.load()
+
+    source_path = os.path.splitext(field_file.name)[0]
+    renditions = []
+
+    for spec in specs:
+        image = ProcessorPipeline(spec.processors).process(source_image.copy())
+
+        content = BytesIO()
+        save_image(image, content, spec.format, options={'quality': spec.quality})
+
+        key = storage.save('%s-%s.%s' % (source_path, spec.name, spec.extension), ContentFile(content.getvalue()))
+        renditions.append((spec, key, image.width, image.height))
+
+    return renditions
+
+
+def swap_image_renditions(instance, field_name, source_name, renditions):
+    """
+    Replaces the renditions of the field with the given ones and the field file with the primary rendition,
+    unless the field changed since the renditions were made. Returns whether the renditions were swapped in.
+    """
+    ImageRendition = get_image_rendition_model()
+    field = instance._meta.get_field(field_name)
+    content_type = ContentType.objects.get_for_model(instance)
+
+    primary_rendition = next((rendition for rendition in renditions if rendition[0].name == field.primary_rendition),
+                             None)
+
+    with transaction.atomic():
+        locked_instance = type(instance).objects.select_for_update().filter(pk=instance.pk).first()
+
+        if not locked_instance or getattr(locked_instance, field_name).name != source_name:
+            return False
+
+        update_fields = [field_name]
+
+        if primary_rendition:
+            spec, key, width, height = primary_rendition
+            # Set without the descriptor, which would download the file to read the dimensions we already have
+            locked_instance.__dict__[field.attname] = key
+            if field.width_field:
+                setattr(locked_instance, field.width_field, width)
+                update_fields.append(field.width_field)
+            if field.height_field:
+                setattr(locked_instance, field.height_field, height)
+                update_fields.append(field.height_field)
+
+        locked_instance.save(update_fields=update_fields)
+
+        ImageRendition.objects.filter(content_type=content_type, object_id=instance.pk, field_name=field_name).delete()
+
+        current_name = getattr(locked_instance, field_name).name
+        created = timezone.now()
+
+        ImageRendition.objects.bulk_create([
+            ImageRendition(content_type=content_type, object_id=instance.pk, field_name=field_name,
+                           source=current_name, name=spec.name, key=key, width=width, height=height,
+                           created=created)
+            for spec, key, width, height in renditions
+        ])
+
+        if primary_rendition:
+            bury_media_keys(field=field, keys=[source_name])
+
+    return True
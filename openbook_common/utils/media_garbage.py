@@ -0,0 +1,130 @@
+import logging
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models, transaction
+from django.utils import timezone
+from imagekit.utils import get_cache
+
+from openbook_common.utils.model_loaders import get_media_tombstone_model
+
+logger = logging.getLogger(__name__)
+
+
+def bury_media_keys(field, keys):
+    """
+    Records the given files of the model field as tombstones, once the transaction commits the media garbage
+    collection job deletes them off the request
+    """
+    keys = [key for key in keys if key]
+
+    if not keys:
+        return
+
+    MediaTombstone = get_media_tombstone_model()
+    field_label = make_field_label(field)
+    created = timezone.now()
+
+    MediaTombstone.objects.bulk_create([
+        MediaTombstone(field=field_label, key=key, created=created) for key in keys
+    ])
+
+    transaction.on_commit(enqueue_media_garbage_collection)
+
+
+def enqueue_media_garbage_collection():
+    # Imported here as the jobs import the models
+    from openbook_common.jobs import collect_media_garbage
+
+    try:
+        collect_media_garbage.delay()
+    except Exception:
+        # The tombstones stay around for the next collection
+        logger.exception('Could not enqueue the media garbage collection')
+
+
+def delete_buried_media(batch_size=None):
+    """
+    Deletes the files of the tombstones a batch at a time. The tombstones of the files which could not be deleted
+    are kept so the next collection retries them. Returns the number of deleted files.
+    """
+    MediaTombstone = get_media_tombstone_model()
+    batch_size = batch_size or settings.MEDIA_GC_BATCH_SIZE
+
+    deleted_count = 0
+    last_tombstone_id = 0
+
+    while True:
+        tombstones = list(MediaTombstone.objects.filter(pk__gt=last_tombstone_id).order_by('pk')[:batch_size])
+
+        if not tombstones:
+            break
+
+        last_tombstone_id = tombstones[-1].pk
+
+        tombstones_by_field = defaultdict(list)
+        for tombstone in tombstones:
+            tombstones_by_field[tombstone.field].append(tombstone)
+
+        deleted_tombstones_ids = []
+
+        for field_label, field_tombstones in tombstones_by_field.items():
+            try:
+                field = get_field_with_label(field_label)
+            except (LookupError, FieldDoesNotExist):
+                logger.exception('Could not find the storage of the buried media of %s' % field_label)
+                continue
+
+            keys = [tombstone.key for tombstone in field_tombstones]
+            failed_keys = set(delete_storage_keys(storage=field.storage, keys=keys))
+
+            if isinstance(field, models.ImageField):
+                clear_imagekit_cache(keys=keys)
+
+            deleted_tombstones_ids.extend(
+                [tombstone.pk for tombstone in field_tombstones if tombstone.key not in failed_keys])
+
+        MediaTombstone.objects.filter(pk__in=deleted_tombstones_ids).delete()
+        deleted_count += len(deleted_tombstones_ids)
+
+    return deleted_count
+
+
+def delete_storage_keys(storage, keys):
+    """
+    Deletes the keys with a single request per batch where the storage supports it, returns the keys which failed
+    """
+    if hasattr(storage, 'delete_many'):
+        return storage.delete_many(keys)
+
+    failed_keys = []
+
+    for key in keys:
+        try:
+            storage.delete(key)
+        except Exception:
+            logger.exception('Could not delete the buried media %s' % key)
+            failed_keys.append(key)
+
+    return failed_keys
+
+
+def clear_imagekit_cache(keys):
+    # ImageKit has a bug where files are cached and not deleted right away
+    # https://github.com/matthewwithanm/django-imagekit/issues/229#issuecomment-315690575
+    cache = get_cache()
+    cached_keys = cache.get_many(keys)
+
+    if cached_keys:
+        cache.delete_many(list(cached_keys.values()))
+
+
+def make_field_label(field):
+    return '%s.%s' % (field.model._meta.label, field.name)
+
+
+def get_field_with_label(field_label):
+    model_label, field_name = field_label.rsplit('.', 1)
+    return apps.get_model(model_label)._meta.get_field(field_name)
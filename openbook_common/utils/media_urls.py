@@ -0,0 +1,49 @@
+from collections import defaultdict
+
+from django.db.models import prefetch_related_objects
+
+
+def get_media_urls(media):
+    """
+    The urls of the given (storage, name) files as a {name: url} dict, asked a storage at a time so the storages
+    caching their urls need a single round trip
+    """
+    names_by_storage = defaultdict(set)
+
+    for storage, name in media:
+        if name:
+            names_by_storage[storage].add(name)
+
+    urls = {}
+
+    for storage, names in names_by_storage.items():
+        if hasattr(storage, 'urls'):
+            urls.update(storage.urls(names))
+        else:
+            urls.update({name: storage.url(name) for name in names})
+
+    return urls
+
+
+def get_posts_media_urls(posts):
+    """
+    The urls of the images, image renditions and videos of the given posts, to be handed to the post serializers
+    as the media_urls context
+    """
+    posts = list(posts)
+    prefetch_related_objects(posts, 'image__image_renditions', 'video')
+
+    media = []
+
+    for post in posts:
+        if post.has_image():
+            image = post.image.image
+            media.append((image.storage, image.name))
+            media.extend([(image.storage, rendition.key) for rendition in post.image.image_renditions.all()
+                          if rendition.source == image.name])
+
+        if post.has_video():
+            video = post.video.video
+            media.append((video.storage, video.name))
+
+    return get_media_urls(media)
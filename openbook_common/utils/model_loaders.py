@@ -41,6 +41,14 @@ def get_community_log_model():
     return apps.get_model('openbook_communities.CommunityLog')
 
 
+def get_post_image_model():
+    return apps.get_model('openbook_posts.PostImage')
+
+
+def get_post_video_model():
+    return apps.get_model('openbook_posts.PostVideo')
+
+
 def get_post_comment_model():
     return apps.get_model('openbook_posts.PostComment')
 
@@ -65,6 +73,14 @@ def get_badge_model():
     return apps.get_model('openbook_common.Badge')
 
 
+def get_image_rendition_model():
+    return apps.get_model('openbook_common.ImageRendition')
+
+
+def get_media_tombstone_model():
+    return apps.get_model('openbook_common.MediaTombstone')
+
+
 def get_tag_model():
     return apps.get_model('openbook_tags.Tag')
 
@@ -109,5 +125,21 @@ def get_device_model():
     return apps.get_model('openbook_devices.Device')
 
 
+def get_upload_model():
+    return apps.get_model('openbook_uploads.Upload')
+
+
+def get_import_model():
+    return apps.get_model('openbook_importer.Import')
+
+
+def get_export_model():
+    return apps.get_model('openbook_exporter.Export')
+
+
+def get_user_deletion_model():
+    return apps.get_model('openbook_auth.UserDeletion')
+
+
 def get_user_model():
     return apps.get_model('openbook_auth.User')
@@ -0,0 +1,128 @@
+from django.core import signing
+from django.db.models import Q
+from django.utils.translation import ugettext_lazy as _
+from rest_framework.exceptions import ValidationError
+
+CURSOR_SALT = 'openbook_common.pagination.cursor'
+
+
+class Cursor:
+    """
+    A position in a keyset ordered list, made of the sort key value and the id of an item.
+    A reverse cursor pages towards the start of the list, a regular one towards the end.
+    """
+
+    def __init__(self, id, position=None, reverse=False):
+        self.id = id
+        self.position = id if position is None else position
+        self.reverse = reverse
+
+    @property
+    def max_id(self):
+        """
+        The equivalent of the legacy max_id parameter for lists sorted by descending id
+        """
+        return None if self.reverse else self.id
+
+    @property
+    def min_id(self):
+        """
+        The equivalent of the legacy min_id parameter for lists sorted by descending id
+        """
+        return self.id if self.reverse else None
+
+    def encode(self):
+        return signing.dumps([self.position, self.id, self.reverse], salt=CURSOR_SALT, compress=True)
+
+    @classmethod
+    def decode(cls, value):
+        try:
+            position, id, reverse = signing.loads(value, salt=CURSOR_SALT)
+        except (signing.BadSignature, TypeError, ValueError):
+            raise ValidationError(_('Invalid cursor.'))
+
+        return cls(id=id, position=position, reverse=bool(reverse))
+
+
+class CursorPage:
+    def __init__(self, items, next_cursor=None, previous_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+
+def paginate_queryset(queryset, count, cursor=None, sort_field='id', descending=True):
+    """
+    Retrieves a page of at most count items ordered by (sort_field, id) starting after the given cursor.
+    Every page is a range scan of the (sort_field, id) index rather than an OFFSET.
+
+    Combined querysets (union) can't be filtered, their parts must already be bounded using cursor.max_id and
+    cursor.min_id.
+    """
+    reverse = cursor.reverse if cursor else False
+
+    # Walking backwards flips the ordering, the page is flipped back once fetched
+    page_descending = descending != reverse
+
+    if cursor and not queryset.query.combinator:
+        queryset = queryset.filter(_make_cursor_query(cursor=cursor, sort_field=sort_field,
+                                                      descending=page_descending))
+
+    ordering = [sort_field] if sort_field == 'id' else [sort_field, 'id']
+    if page_descending:
+        ordering = ['-%s' % field for field in ordering]
+
+    items = list(queryset.order_by(*ordering)[:count + 1])
+    has_more = len(items) > count
+    items = items[:count]
+
+    if reverse:
+        items.reverse()
+
+    if not items:
+        return CursorPage(items=items)
+
+    next_cursor = None
+    if has_more or reverse:
+        next_cursor = _make_cursor_for_item(item=items[-1], sort_field=sort_field, reverse=False)
+
+    # Always given so clients can poll for items newer than the first one of the page
+    previous_cursor = _make_cursor_for_item(item=items[0], sort_field=sort_field, reverse=True)
+
+    return CursorPage(items=items, next_cursor=next_cursor, previous_cursor=previous_cursor)
+
+
+def paginate_queryset_with_offset(queryset, count, cursor=None, offset=None, sort_field='id', descending=True):
+    """
+    Retrieves a page the way paginate_queryset does, or at the given offset for the older clients still sending one.
+    The offset is deprecated as an OFFSET degrades with the page depth, the pages it gives have no cursors.
+    """
+    if not offset:
+        return paginate_queryset(queryset, count=count, cursor=cursor, sort_field=sort_field, descending=descending)
+
+    ordering = [sort_field] if sort_field == 'id' else [sort_field, 'id']
+    if descending:
+        ordering = ['-%s' % field for field in ordering]
+
+    return CursorPage(items=queryset.order_by(*ordering)[offset:offset + count])
+
+
+def _make_cursor_query(cursor, sort_field, descending):
+    lookup = 'lt' if descending else 'gt'
+
+    if sort_field == 'id':
+        return Q(**{'id__%s' % lookup: cursor.id})
+
+    cursor_query = Q(**{'%s__%s' % (sort_field, lookup): cursor.position})
+    cursor_query.add(Q(**{sort_field: cursor.position, 'id__%s' % lookup: cursor.id}), Q.OR)
+
+    return cursor_query
+
+
+def _make_cursor_for_item(item, sort_field, reverse):
+    position = getattr(item, sort_field)
+
+    if hasattr(position, 'isoformat'):
+        position = position.isoformat()
+
+    return Cursor(id=item.pk, position=position, reverse=reverse).encode()
@@ -0,0 +1,171 @@
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+from django_redis import get_redis_connection
+
+from openbook_common.utils.model_loaders import get_emoji_model, get_emoji_group_model, get_badge_model, \
+    get_category_model
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_CACHE_CHANNEL = 'ob-api-reference-cache'
+REFERENCE_CACHE_VERSION_KEY_PREFIX = 'reference_cache_version:'
+
+
+class ReferenceCache:
+    """
+    An in-process copy of a small table that rarely changes, loaded once per worker and indexed by
+    the given fields so lookups are dict hits.
+
+    Saving or deleting a row bumps the table version in Redis and publishes it, every worker subscribed to
+    REFERENCE_CACHE_CHANNEL then drops its copy, which is reloaded on the next lookup.
+    """
+    caches = {}
+
+    def __init__(self, name, get_queryset, indexes):
+        self.name = name
+        self.get_queryset = get_queryset
+        self.indexes = indexes
+        self._data = None
+        self._latest_version = 0
+        self._lock = threading.Lock()
+        ReferenceCache.caches[name] = self
+
+    def all(self):
+        return self._get_data().items
+
+    def get(self, **lookup):
+        (field, value), = lookup.items()
+        return self._get_data().indexes[field].get(value)
+
+    def invalidate(self):
+        """
+        Drops the copy of this worker right away and, once the transaction commits, the copies of every other worker
+        """
+        self._data = None
+        transaction.on_commit(self._publish_invalidation)
+
+    def notify_version(self, version):
+        self._latest_version = max(self._latest_version, version)
+
+    def _get_data(self):
+        data = self._data
+
+        if not settings.REFERENCE_CACHE_ENABLED:
+            return self._load_data(version=0)
+
+        if data is None or data.version < self._latest_version:
+            with self._lock:
+                data = self._data
+                if data is None or data.version < self._latest_version:
+                    start_invalidations_listener()
+                    data = self._data = self._load_data(version=get_reference_cache_version(self.name))
+
+        return data
+
+    def _load_data(self, version):
+        items = list(self.get_queryset())
+        indexes = {field: {getattr(item, field): item for item in items} for field in self.indexes}
+        self._latest_version = max(self._latest_version, version)
+        return _ReferenceCacheData(version=version, items=items, indexes=indexes)
+
+    def _publish_invalidation(self):
+        self._data = None
+        key = _make_reference_cache_version_key(self.name)
+
+        try:
+            version = cache.incr(key)
+        except ValueError:
+            version = int(time.time() * 1000000)
+            cache.set(key, version, timeout=None)
+
+        get_redis_connection('default').publish(REFERENCE_CACHE_CHANNEL, '%s:%d' % (self.name, version))
+
+
+class _ReferenceCacheData:
+    def __init__(self, version, items, indexes):
+        self.version = version
+        self.items = items
+        self.indexes = indexes
+
+
+def get_reference_cache_version(name):
+    return cache.get(_make_reference_cache_version_key(name)) or 0
+
+
+_listener_lock = threading.Lock()
+_listener_pid = None
+
+
+def start_invalidations_listener():
+    """
+    Starts the thread listening to the invalidations of other workers, once per process
+    """
+    global _listener_pid
+
+    if _listener_pid == os.getpid():
+        return
+
+    with _listener_lock:
+        if _listener_pid == os.getpid():
+            return
+
+        listener = threading.Thread(target=_listen_to_invalidations, name='reference-cache-invalidations', daemon=True)
+        listener.start()
+        _listener_pid = os.getpid()
+
+
+def _listen_to_invalidations():
+    while True:
+        try:
+            pubsub = get_redis_connection('default').pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(REFERENCE_CACHE_CHANNEL)
+
+            # Catch up with the invalidations published while we were not subscribed
+            for name, reference_cache in ReferenceCache.caches.items():
+                reference_cache.notify_version(get_reference_cache_version(name))
+
+            for message in pubsub.listen():
+                name, version = message['data'].decode('utf-8').rsplit(':', 1)
+                reference_cache = ReferenceCache.caches.get(name)
+                if reference_cache:
+                    reference_cache.notify_version(int(version))
+        except Exception:
+            logger.exception('Lost the reference cache invalidations subscription, resubscribing')
+            time.sleep(1)
+
+
+def _make_reference_cache_version_key(name):
+    return REFERENCE_CACHE_VERSION_KEY_PREFIX + name
+
+
+emojis_reference_cache = ReferenceCache(
+    name='emojis',
+    get_queryset=lambda: get_emoji_model().objects.order_by('order', 'id'),
+    indexes=('id', 'keyword'),
+)
+
+emoji_groups_reference_cache = ReferenceCache(
+    name='emoji_groups',
+    get_queryset=lambda: get_emoji_group_model().objects.prefetch_related(
+        Prefetch('emojis', queryset=get_emoji_model().objects.order_by('order', 'id'))).order_by('order', 'id'),
+    indexes=('id', 'keyword'),
+)
+
+badges_reference_cache = ReferenceCache(
+    name='badges',
+    get_queryset=lambda: get_badge_model().objects.order_by('id'),
+    indexes=('id', 'keyword'),
+)
+
+categories_reference_cache = ReferenceCache(
+    name='categories',
+    get_queryset=lambda: get_category_model().objects.order_by('order', 'id'),
+    indexes=('id', 'name'),
+)
@@ -0,0 +1,119 @@
+import hashlib
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import translation, timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from openbook_common.utils.model_loaders import get_community_model
+
+RESOURCE_VERSION_KEY_PREFIX = 'resource_version:'
+
+EMOJI_GROUPS_RESOURCE = 'emoji_groups'
+CATEGORIES_RESOURCE = 'categories'
+
+
+def make_user_resource(username):
+    return 'user:%s' % username
+
+
+def make_community_resource(community_name):
+    return 'community:%s' % community_name
+
+
+def make_user_circles_resource(user_id):
+    return 'circles:%s' % user_id
+
+
+def make_user_lists_resource(user_id):
+    return 'lists:%s' % user_id
+
+
+def get_resources_versions(resources):
+    keys = [_make_resource_version_key(resource) for resource in resources]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _make_initial_version(), timeout=None)
+            versions[key] = cache.get(key)
+
+    return [versions[key] for key in keys]
+
+
+def bump_resources_versions(resources):
+    """
+    Bumps the versions right away so the change is seen within the current transaction, and once more on commit
+    so a request that read the old rows in between can't have them cached under the new version
+    """
+    resources = list(resources)
+
+    if not resources:
+        return
+
+    _bump_resources_versions(resources)
+    transaction.on_commit(lambda: _bump_resources_versions(resources))
+
+
+def bump_users_resources_versions(users_ids):
+    User = get_user_model()
+    usernames = User.objects.filter(pk__in=users_ids).values_list('username', flat=True)
+    bump_resources_versions([make_user_resource(username) for username in usernames])
+
+
+def bump_communities_resources_versions(communities_ids):
+    Community = get_community_model()
+    communities_names = Community.objects.filter(pk__in=communities_ids).values_list('name', flat=True)
+    bump_resources_versions([make_community_resource(community_name) for community_name in communities_names])
+
+
+def make_resources_etag(request, resources):
+    """
+    The ETag of a response built from the given resources, it changes whenever any of them is saved or deleted
+    """
+    user = getattr(request, 'user', None)
+
+    etag_parts = [
+        user.pk if user else None,
+        translation.get_language(),
+        timezone.get_current_timezone_name(),
+        request.META.get('HTTP_ACCEPT', ''),
+        sorted(request.GET.lists()),
+    ]
+
+    etag_parts.extend(zip(resources, get_resources_versions(resources)))
+
+    return hashlib.sha1(repr(etag_parts).encode('utf-8')).hexdigest()
+
+
+def versioned_etag(get_resources):
+    """
+    Decorates an APIView method to answer If-None-Match with a 304 as long as none of the
+    get_resources(request, *args, **kwargs) resources changed, before the view runs any query or serializer
+    """
+
+    def etag_func(request, *args, **kwargs):
+        return make_resources_etag(request=request, resources=get_resources(request, *args, **kwargs))
+
+    return method_decorator(condition(etag_func=etag_func))
+
+
+def _bump_resources_versions(resources):
+    for resource in resources:
+        key = _make_resource_version_key(resource)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Never set or evicted, any fresh version differs from the ones handed out before
+            cache.set(key, _make_initial_version(), timeout=None)
+
+
+def _make_resource_version_key(resource):
+    return RESOURCE_VERSION_KEY_PREFIX + resource
+
+
+def _make_initial_version():
+    return int(time.time() * 1000000)
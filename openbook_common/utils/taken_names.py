@@ -0,0 +1,141 @@
+from django.conf import settings
+from django.db import transaction
+from django_redis import get_redis_connection
+
+from openbook_common.utils.model_loaders import get_user_model, get_user_invite_model
+
+TAKEN_USERNAMES_KEY = 'ob-api-taken-usernames'
+TAKEN_EMAILS_KEY = 'ob-api-taken-emails'
+
+# Member of an index once it holds every name of the database. An index never built or evicted by Redis lacks it,
+# its lookups then fall back to the database.
+INDEX_COMPLETE_MEMBER = ''
+
+
+def may_username_be_taken(username):
+    """
+    False only when no user nor invite has the username, without querying the database. True answers must be
+    confirmed against the database, the index keeping the names released while it was being updated.
+    """
+    return _may_name_be_taken(key=TAKEN_USERNAMES_KEY, name=username)
+
+
+def may_email_be_taken(email):
+    return _may_name_be_taken(key=TAKEN_EMAILS_KEY, name=email)
+
+
+def add_taken_usernames(usernames):
+    _add_taken_names(key=TAKEN_USERNAMES_KEY, names=usernames)
+
+
+def add_taken_emails(emails):
+    _add_taken_names(key=TAKEN_EMAILS_KEY, names=emails)
+
+
+def release_taken_username(username):
+    """
+    Removes the username from the index once the transaction commits, unless another user or invite still has it
+    """
+    def is_username_taken():
+        User = get_user_model()
+        UserInvite = get_user_invite_model()
+        return User.objects.filter(username__iexact=username).exists() or \
+               UserInvite.objects.filter(username__iexact=username).exists()
+
+    _release_taken_name(key=TAKEN_USERNAMES_KEY, name=username, is_name_taken=is_username_taken)
+
+
+def release_taken_email(email):
+    def is_email_taken():
+        User = get_user_model()
+        return User.objects.filter(email__iexact=email).exists()
+
+    _release_taken_name(key=TAKEN_EMAILS_KEY, name=email, is_name_taken=is_email_taken)
+
+
+def build_taken_names_indexes(batch_size=None):
+    """
+    Adds the usernames of the users and invites and the emails of the users a batch at a time, then marks the
+    indexes complete. The names created meanwhile are added by the signals, so the indexes can be built live.
+    """
+    User = get_user_model()
+    UserInvite = get_user_invite_model()
+
+    batch_size = batch_size or settings.TAKEN_NAMES_INDEX_BATCH_SIZE
+
+    names_query_sets = (
+        (TAKEN_USERNAMES_KEY, User.objects.values_list('pk', 'username')),
+        (TAKEN_USERNAMES_KEY, UserInvite.objects.filter(username__isnull=False).values_list('pk', 'username')),
+        (TAKEN_EMAILS_KEY, User.objects.filter(email__isnull=False).values_list('pk', 'email')),
+    )
+
+    for key, query_set in names_query_sets:
+        last_id = 0
+
+        while True:
+            batch = list(query_set.filter(pk__gt=last_id).order_by('pk')[:batch_size])
+
+            if not batch:
+                break
+
+            _add_names(key=key, names=[name for pk, name in batch])
+            last_id = batch[-1][0]
+
+    redis = get_redis_connection('default')
+
+    for key in (TAKEN_USERNAMES_KEY, TAKEN_EMAILS_KEY):
+        redis.sadd(key, INDEX_COMPLETE_MEMBER)
+
+
+def _may_name_be_taken(key, name):
+    if not settings.TAKEN_NAMES_INDEX_ENABLED:
+        return True
+
+    pipeline = get_redis_connection('default').pipeline(transaction=False)
+    pipeline.sismember(key, INDEX_COMPLETE_MEMBER)
+    pipeline.sismember(key, _normalize_name(name))
+    is_index_complete, is_name_in_index = pipeline.execute()
+
+    return not is_index_complete or is_name_in_index
+
+
+def _add_taken_names(key, names):
+    """
+    Adds the names right away so they are seen taken before the transaction commits, and once more on commit so
+    they stay in the index if a deletion committed in between released them
+    """
+    names = [name for name in names if name]
+
+    if not names or not settings.TAKEN_NAMES_INDEX_ENABLED:
+        return
+
+    _add_names(key=key, names=names)
+    transaction.on_commit(lambda: _add_names(key=key, names=names))
+
+
+def _release_taken_name(key, name, is_name_taken):
+    """
+    The name is removed before checking the database, a creation committing after the check adds it back on commit
+    """
+    if not name or not settings.TAKEN_NAMES_INDEX_ENABLED:
+        return
+
+    def release_name():
+        redis = get_redis_connection('default')
+        normalized_name = _normalize_name(name)
+        redis.srem(key, normalized_name)
+
+        if is_name_taken():
+            redis.sadd(key, normalized_name)
+
+    transaction.on_commit(release_name)
+
+
+def _add_names(key, names):
+    if names:
+        get_redis_connection('default').sadd(key, *[_normalize_name(name) for name in names])
+
+
+def _normalize_name(name):
+    # The database may compare names case insensitively, a name must never be missed for its case
+    return name.lower()
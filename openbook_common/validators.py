@@ -3,7 +3,7 @@ import re
 from rest_framework.exceptions import ValidationError
 from django.utils.translation import ugettext_lazy as _
 
-from openbook_common.utils.model_loaders import get_emoji_model, get_emoji_group_model
+from openbook_common.utils.reference_cache import emojis_reference_cache, emoji_groups_reference_cache
 
 
 def hex_color_validator(hex_color):
@@ -14,16 +14,14 @@ def hex_color_validator(hex_color):
 
 
 def emoji_id_exists(list_id):
-    Emoji = get_emoji_model()
-    if not Emoji.objects.filter(pk=list_id).exists():
+    if not emojis_reference_cache.get(id=list_id):
         raise ValidationError(
             _('No emoji with the provided id exists.'),
         )
 
 
 def emoji_group_id_exists(emoji_group_id):
-    EmojiGroup = get_emoji_group_model()
-    if not EmojiGroup.objects.filter(pk=emoji_group_id).exists():
+    if not emoji_groups_reference_cache.get(id=emoji_group_id):
         raise ValidationError(
             _('No emoji group with the provided id exists.'),
         )
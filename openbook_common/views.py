@@ -1,12 +1,25 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, QueryDict
+from django.urls import resolve, Resolver404
 from django.utils.timezone import get_current_timezone
+from django.utils.translation import ugettext_lazy as _
+from django.utils import translation
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.utils import timezone
 
-from openbook_common.serializers import EmojiGroupSerializer, EmojiSerializer
-from openbook_common.utils.model_loaders import get_emoji_group_model, get_emoji_model
+from openbook_common.serializers import EmojiGroupSerializer, EmojiSerializer, BatchSerializer
+from openbook_common.utils.reference_cache import emoji_groups_reference_cache
+from openbook_common.utils.resource_versions import versioned_etag, EMOJI_GROUPS_RESOURCE
+
+logger = logging.getLogger(__name__)
 
 
 class Time(APIView):
@@ -38,9 +51,107 @@ class Health(APIView):
 class EmojiGroups(APIView):
     permission_classes = (IsAuthenticated,)
 
+    @versioned_etag(lambda request: [EMOJI_GROUPS_RESOURCE])
     def get(self, request):
-        EmojiGroup = get_emoji_group_model()
-        emoji_groups = EmojiGroup.objects.filter(is_reaction_group=False).all().order_by('order')
+        emoji_groups = [emoji_group for emoji_group in emoji_groups_reference_cache.all() if
+                        not emoji_group.is_reaction_group]
         serializer = EmojiGroupSerializer(emoji_groups, many=True, context={'request': request})
 
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class Batch(APIView):
+    """
+    API for retrieving several API GET urls in a single round trip.
+    The urls are dispatched as the authenticated user and can run concurrently in a thread pool.
+    """
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+        urls = [batch_request['url'] for batch_request in data.get('requests')]
+
+        max_workers = min(settings.BATCH_MAX_WORKERS, len(urls))
+
+        if max_workers <= 1:
+            responses = [self._get_batch_response(request=request, url=url) for url in urls]
+        else:
+            language = translation.get_language()
+            time_zone = timezone.get_current_timezone()
+
+            def get_batch_response_in_thread(url):
+                # Translations, timezones and database connections are all thread local
+                translation.activate(language)
+                timezone.activate(time_zone)
+                try:
+                    return self._get_batch_response(request=request, url=url)
+                finally:
+                    connections.close_all()
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(get_batch_response_in_thread, urls))
+
+        return Response(responses, status=status.HTTP_200_OK)
+
+    def _get_batch_response(self, request, url):
+        split_url = urlsplit(url)
+
+        try:
+            resolver_match = resolve(split_url.path)
+        except Resolver404:
+            return self._make_batch_response(url=url, status_code=status.HTTP_404_NOT_FOUND,
+                                             body={'detail': _('Not found.')})
+
+        if getattr(resolver_match.func, 'view_class', None) is Batch:
+            return self._make_batch_response(url=url, status_code=status.HTTP_400_BAD_REQUEST,
+                                             body={'detail': _('Batch requests can\'t be nested.')})
+
+        batch_request = self._make_batch_request(request=request, path=split_url.path, query=split_url.query)
+        batch_request.resolver_match = resolver_match
+
+        try:
+            response = resolver_match.func(batch_request, *resolver_match.args, **resolver_match.kwargs)
+        except Exception:
+            logger.exception('Batched request to %s failed' % url)
+            return self._make_batch_response(url=url, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                                             body={'detail': _('A server error occurred.')})
+
+        headers = {header: value for header, value in response.items() if header.startswith('X-')}
+
+        return self._make_batch_response(url=url, status_code=response.status_code,
+                                         body=getattr(response, 'data', None), headers=headers)
+
+    def _make_batch_request(self, request, path, query):
+        http_request = request._request
+
+        batch_request = HttpRequest()
+        batch_request.method = 'GET'
+        batch_request.path = batch_request.path_info = path
+        batch_request.META = {key: value for key, value in http_request.META.items() if
+                              key not in ('CONTENT_TYPE', 'CONTENT_LENGTH', 'HTTP_IF_NONE_MATCH',
+                                          'HTTP_IF_MODIFIED_SINCE')}
+        batch_request.META.update({
+            'REQUEST_METHOD': 'GET',
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+        })
+        batch_request.GET = QueryDict(query)
+        batch_request.COOKIES = http_request.COOKIES
+        batch_request.user = request.user
+
+        # Reuses the authentication of the batch request instead of looking the token up again
+        batch_request._force_auth_user = request.user
+        batch_request._force_auth_token = request.auth
+
+        return batch_request
+
+    def _make_batch_response(self, url, status_code, body, headers=None):
+        return {
+            'url': url,
+            'status': status_code,
+            'headers': headers or {},
+            'body': body,
+        }
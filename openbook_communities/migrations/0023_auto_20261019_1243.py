@@ -0,0 +1,25 @@
+# Generated by Django 2.2 on 2026-10-19 10:43
+
+from django.db import migrations
+import openbook_common.utils.image_renditions
+import openbook_communities.helpers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openbook_communities', '0022_auto_20190502_1804'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='community',
+            name='avatar',
+            field=openbook_common.utils.image_renditions.RenditionedImageField(null=True, upload_to=openbook_communities.helpers.upload_to_community_avatar_directory, verbose_name='avatar'),
+        ),
+        migrations.AlterField(
+            model_name='community',
+            name='cover',
+            field=openbook_common.utils.image_renditions.RenditionedImageField(null=True, upload_to=openbook_communities.helpers.upload_to_community_cover_directory, verbose_name='cover'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from django.conf import settings
+from django.contrib.contenttypes.fields import GenericRelation
 from django.db import models
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
 
 # Create your models here.
 from django.utils import timezone
@@ -11,13 +14,16 @@ from openbook.settings import COLOR_ATTR_MAX_LENGTH
 from openbook_auth.models import User
 from django.utils.translation import ugettext_lazy as _
 
+from openbook_common.utils.image_renditions import RenditionedImageField, ImageRenditionSpec
 from openbook_common.utils.model_loaders import get_community_invite_model, \
-    get_community_log_model, get_category_model
+    get_community_log_model
+from openbook_common.utils.reference_cache import categories_reference_cache
+from openbook_common.utils.resource_versions import bump_resources_versions, make_community_resource, \
+    bump_communities_resources_versions
 from openbook_common.validators import hex_color_validator
 from openbook_communities.helpers import upload_to_community_avatar_directory, upload_to_community_cover_directory
 from openbook_communities.validators import community_name_characters_validator
 from openbook_posts.models import Post
-from imagekit.models import ProcessedImageField
 
 
 class Community(models.Model):
@@ -30,12 +36,23 @@ class Community(models.Model):
                                    null=True, )
     rules = models.CharField(_('rules'), max_length=settings.COMMUNITY_RULES_MAX_LENGTH, blank=False,
                              null=True)
-    avatar = ProcessedImageField(verbose_name=_('avatar'), blank=False, null=True, format='JPEG',
-                                 options={'quality': 60}, processors=[ResizeToFill(500, 500)],
-                                 upload_to=upload_to_community_avatar_directory)
-    cover = ProcessedImageField(verbose_name=_('cover'), blank=False, null=True, format='JPEG', options={'quality': 50},
-                                upload_to=upload_to_community_cover_directory,
-                                processors=[ResizeToFit(width=1024, upscale=False)])
+    avatar = RenditionedImageField(verbose_name=_('avatar'), blank=False, null=True,
+                                   upload_to=upload_to_community_avatar_directory,
+                                   renditions=[
+                                       ImageRenditionSpec(name='thumbnail', processors=[ResizeToFill(100, 100)],
+                                                          quality=60),
+                                       ImageRenditionSpec(name='full', processors=[ResizeToFill(500, 500)],
+                                                          quality=60),
+                                   ], primary_rendition='full')
+    cover = RenditionedImageField(verbose_name=_('cover'), blank=False, null=True,
+                                  upload_to=upload_to_community_cover_directory,
+                                  renditions=[
+                                      ImageRenditionSpec(name='feed',
+                                                         processors=[ResizeToFit(width=1024, upscale=False)]),
+                                      ImageRenditionSpec(name='full',
+                                                         processors=[ResizeToFit(width=2048, upscale=False)]),
+                                  ], primary_rendition='feed')
+    image_renditions = GenericRelation('openbook_common.ImageRendition')
     created = models.DateTimeField(editable=False)
     starrers = models.ManyToManyField(User, related_name='favorite_communities')
     banned_users = models.ManyToManyField(User, related_name='banned_of_communities')
@@ -132,7 +149,10 @@ class Community(models.Model):
         trending_communities_query = Q(type=cls.COMMUNITY_TYPE_PUBLIC)
 
         if category_name:
-            trending_communities_query.add(Q(categories__name=category_name), Q.AND)
+            category = categories_reference_cache.get(name=category_name)
+            # Filtering on the id skips joining the categories table
+            category_query = Q(categories__id=category.pk) if category else Q(pk__in=[])
+            trending_communities_query.add(category_query, Q.AND)
 
         return trending_communities_query
 
@@ -283,7 +303,11 @@ class Community(models.Model):
                users_adjective=None, rules=None, categories_names=None, invites_enabled=None):
 
         if name:
-            self.name = name.lower()
+            name = name.lower()
+            if name != self.name:
+                # Requests to the old name must not get a 304 anymore
+                bump_resources_versions([make_community_resource(self.name)])
+            self.name = name
 
         if title:
             self.title = title
@@ -348,9 +372,8 @@ class Community(models.Model):
 
     def set_categories_with_names(self, categories_names):
         self.clear_categories()
-        Category = get_category_model()
-        categories = Category.objects.filter(name__in=categories_names)
-        self.categories.set(categories)
+        categories = [categories_reference_cache.get(name=category_name) for category_name in categories_names]
+        self.categories.set([category for category in categories if category])
 
     def clear_categories(self):
         self.categories.clear()
@@ -544,3 +567,36 @@ class CommunityInvite(models.Model):
     @classmethod
     def is_user_with_username_invited_to_community_with_name(cls, username, community_name):
         return cls.objects.filter(community__name=community_name, invited_user__username=username).exists()
+
+
+@receiver([post_save, post_delete], sender=Community, dispatch_uid='bump_community_versions')
+def bump_community_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the community
+    """
+    bump_resources_versions([make_community_resource(instance.name)])
+
+
+@receiver([post_save, post_delete], sender=CommunityMembership, dispatch_uid='bump_community_membership_versions')
+@receiver([post_save, post_delete], sender=CommunityInvite, dispatch_uid='bump_community_invite_versions')
+def bump_community_member_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the community whose members, staff or invites changed
+    """
+    bump_communities_resources_versions([instance.community_id])
+
+
+@receiver(m2m_changed, sender=Community.starrers.through, dispatch_uid='bump_community_starrers_versions')
+@receiver(m2m_changed, sender=Community.banned_users.through, dispatch_uid='bump_community_banned_users_versions')
+def bump_community_users_versions(sender, instance=None, action=None, reverse=False, pk_set=None, **kwargs):
+    """"
+    Invalidate the ETags of the communities whose favorites or banned users changed
+    """
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            bump_resources_versions([make_community_resource(instance.name)])
+    elif action == 'pre_clear':
+        through_communities = sender.objects.filter(user_id=instance.pk).values_list('community_id', flat=True)
+        bump_communities_resources_versions(list(through_communities))
+    elif action in ('post_add', 'post_remove'):
+        bump_communities_resources_versions(pk_set)
@@ -610,6 +610,45 @@ class JoinedCommunities(APITestCase):
             response_community_id = response_community.get('id')
             self.assertIn(response_community_id, offsetted_communities_ids)
 
+    def test_retrieve_joined_communities_with_cursor(self):
+        """
+        should be able to page through all own communities with the returned cursors and return 200
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        total_amount_of_communities = 10
+
+        community_creator = make_user()
+        communities_ids = []
+
+        for i in range(0, total_amount_of_communities):
+            community = make_community(creator=community_creator)
+            user.join_community_with_name(community_name=community.name)
+            communities_ids.append(community.pk)
+
+        url = self._get_url()
+
+        response_communities_ids = []
+        params = {'count': 3}
+
+        while True:
+            response = self.client.get(url, params, **headers)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            response_communities = json.loads(response.content)
+            response_communities_ids.extend([community.get('id') for community in response_communities])
+
+            next_cursor = response.get('X-Next-Cursor')
+
+            if not next_cursor:
+                break
+
+            params['cursor'] = next_cursor
+
+        self.assertEqual(response_communities_ids, sorted(communities_ids))
+
     def _get_url(self):
         return reverse('joined-communities')
 
@@ -675,6 +675,50 @@ class CommunityAPITests(APITestCase):
 
         self.assertTrue(Community.objects.filter(pk=community.pk).exists())
 
+    def test_retrieve_unchanged_community_returns_not_modified(self):
+        """
+        should return 304 when retrieving a community with the ETag of an unchanged previous response
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        other_user = make_user()
+        community = make_community(creator=other_user, type='P')
+
+        url = self._get_url(community_name=community.name)
+
+        response = self.client.get(url, **headers)
+        etag = response['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_joined_community_returns_modified(self):
+        """
+        should return 200 when retrieving a community with the ETag of a response previous to a member joining
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        other_user = make_user()
+        community = make_community(creator=other_user, type='P')
+
+        url = self._get_url(community_name=community.name)
+
+        response = self.client.get(url, **headers)
+        etag = response['ETag']
+
+        make_user().join_community_with_name(community_name=community.name)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        parsed_response = json.loads(response.content)
+
+        self.assertEqual(parsed_response['members_count'], 2)
+
     def _get_url(self, community_name):
         return reverse('community', kwargs={
             'community_name': community_name
@@ -4,7 +4,8 @@ from rest_framework import serializers
 from openbook.settings import COLOR_ATTR_MAX_LENGTH
 from openbook_categories.models import Category
 from openbook_categories.validators import category_name_exists
-from openbook_common.serializers_fields.request import RestrictedImageFileSizeField
+from openbook_common.serializers import SparseFieldsetsSerializerMixin
+from openbook_common.serializers_fields.request import RestrictedImageFileSizeField, CursorField
 from openbook_common.validators import hex_color_validator
 from openbook_communities.models import Community, CommunityMembership
 from openbook_communities.serializers_fields import IsInvitedField, IsCreatorField, CommunityMembershipsField, \
@@ -55,6 +56,9 @@ class GetJoinedCommunitiesSerializer(serializers.Serializer):
     offset = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
 
 
 class GetModeratedCommunitiesSerializer(serializers.Serializer):
@@ -65,6 +69,9 @@ class GetModeratedCommunitiesSerializer(serializers.Serializer):
     offset = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
 
 
 class GetAdministratedCommunitiesSerializer(serializers.Serializer):
@@ -75,6 +82,9 @@ class GetAdministratedCommunitiesSerializer(serializers.Serializer):
     offset = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
 
 
 class GetFavoriteCommunitiesSerializer(serializers.Serializer):
@@ -85,6 +95,9 @@ class GetFavoriteCommunitiesSerializer(serializers.Serializer):
     offset = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
 
 
 class SearchCommunitiesSerializer(serializers.Serializer):
@@ -129,7 +142,7 @@ class CommunitiesCommunityMembershipSerializer(serializers.ModelSerializer):
         )
 
 
-class CommunitiesCommunitySerializer(serializers.ModelSerializer):
+class CommunitiesCommunitySerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     categories = GetCommunitiesCommunityCategorySerializer(many=True)
     is_invited = IsInvitedField()
     is_favorite = IsFavoriteField()
@@ -6,9 +6,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.utils.translation import gettext as _
 
-from openbook_common.responses import ApiMessageResponse
+from openbook_common.responses import ApiMessageResponse, CursorPaginatedResponse
 from openbook_common.utils.helpers import normalize_list_value_in_request_data, normalise_request_data
 from openbook_common.utils.model_loaders import get_community_model
+from openbook_common.utils.pagination import paginate_queryset_with_offset
 from openbook_communities.views.communities.serializers import CreateCommunitySerializer, \
     CommunitiesCommunitySerializer, SearchCommunitiesSerializer, CommunityNameCheckSerializer, \
     GetFavoriteCommunitiesSerializer, GetJoinedCommunitiesSerializer, TrendingCommunitiesSerializer, \
@@ -60,16 +61,19 @@ class Communities(APIView):
         data = serializer.validated_data
 
         count = data.get('count', 10)
-        offset = data.get('offset', 0)
+        offset = data.get('offset')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        communities = user.get_joined_communities()[offset:offset + count]
+        communities = user.get_joined_communities()
 
-        response_serializer = CommunitiesCommunitySerializer(communities, many=True,
+        page = paginate_queryset_with_offset(communities, count=count, cursor=cursor, offset=offset, descending=False)
+
+        response_serializer = CommunitiesCommunitySerializer(page.items, many=True,
                                                              context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
 
 class CommunityNameCheck(APIView):
@@ -98,16 +102,19 @@ class JoinedCommunities(APIView):
         data = serializer.validated_data
 
         count = data.get('count', 10)
-        offset = data.get('offset', 0)
+        offset = data.get('offset')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        communities = user.get_joined_communities()[offset:offset + count]
+        communities = user.get_joined_communities()
 
-        response_serializer = CommunitiesCommunitySerializer(communities, many=True,
+        page = paginate_queryset_with_offset(communities, count=count, cursor=cursor, offset=offset, descending=False)
+
+        response_serializer = CommunitiesCommunitySerializer(page.items, many=True,
                                                              context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
 
 class SearchJoinedCommunities(APIView):
@@ -144,16 +151,19 @@ class ModeratedCommunities(APIView):
         data = serializer.validated_data
 
         count = data.get('count', 10)
-        offset = data.get('offset', 0)
+        offset = data.get('offset')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        communities = user.get_moderated_communities()[offset:offset + count]
+        communities = user.get_moderated_communities()
 
-        response_serializer = CommunitiesCommunitySerializer(communities, many=True,
+        page = paginate_queryset_with_offset(communities, count=count, cursor=cursor, offset=offset, descending=False)
+
+        response_serializer = CommunitiesCommunitySerializer(page.items, many=True,
                                                              context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
 
 class AdministratedCommunities(APIView):
@@ -167,16 +177,19 @@ class AdministratedCommunities(APIView):
         data = serializer.validated_data
 
         count = data.get('count', 10)
-        offset = data.get('offset', 0)
+        offset = data.get('offset')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        communities = user.get_administrated_communities()[offset:offset + count]
+        communities = user.get_administrated_communities()
 
-        response_serializer = CommunitiesCommunitySerializer(communities, many=True,
+        page = paginate_queryset_with_offset(communities, count=count, cursor=cursor, offset=offset, descending=False)
+
+        response_serializer = CommunitiesCommunitySerializer(page.items, many=True,
                                                              context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
 
 class TrendingCommunities(APIView):
@@ -210,14 +223,17 @@ class FavoriteCommunities(APIView):
         data = serializer.validated_data
 
         count = data.get('count', 10)
-        offset = data.get('offset', 0)
+        offset = data.get('offset')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        communities = user.get_favorite_communities()[offset:offset + count]
+        communities = user.get_favorite_communities()
 
-        posts_serializer = CommunitiesCommunitySerializer(communities, many=True, context={"request": request})
-        return Response(posts_serializer.data, status=status.HTTP_200_OK)
+        page = paginate_queryset_with_offset(communities, count=count, cursor=cursor, offset=offset, descending=False)
+
+        posts_serializer = CommunitiesCommunitySerializer(page.items, many=True, context={"request": request})
+        return CursorPaginatedResponse(posts_serializer.data, page=page)
 
 
 class SearchCommunities(APIView):
@@ -3,6 +3,7 @@ from rest_framework import serializers
 
 from openbook_auth.models import User, UserProfile
 from openbook_auth.validators import username_characters_validator, user_username_exists
+from openbook_common.serializers_fields.request import CursorField
 from openbook_communities.validators import community_name_characters_validator, community_name_exists
 
 
@@ -28,6 +29,9 @@ class GetCommunityAdministratorsSerializer(serializers.Serializer):
     max_id = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
     count = serializers.IntegerField(
         required=False,
         max_value=20
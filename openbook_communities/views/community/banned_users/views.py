@@ -6,8 +6,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.utils.translation import gettext as _
 
-from openbook_common.responses import ApiMessageResponse
+from openbook_common.responses import ApiMessageResponse, CursorPaginatedResponse
 from openbook_common.utils.helpers import normalise_request_data
+from openbook_common.utils.pagination import paginate_queryset
 from openbook_communities.views.community.banned_users.serializers import GetCommunityBannedUsersUserSerializer, \
     GetCommunityBannedUsersSerializer, BanUserSerializer, UnbanUserSerializer, SearchCommunityBannedUsersSerializer
 
@@ -26,16 +27,17 @@ class CommunityBannedUsers(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        banned_users = user.get_community_with_name_banned_users(community_name=community_name, max_id=max_id).order_by(
-            '-id')[:count]
+        banned_users = user.get_community_with_name_banned_users(community_name=community_name, max_id=max_id)
+        page = paginate_queryset(banned_users, count=count, cursor=cursor)
 
-        response_serializer = GetCommunityBannedUsersUserSerializer(banned_users, many=True,
+        response_serializer = GetCommunityBannedUsersUserSerializer(page.items, many=True,
                                                                     context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
 
 class BanUser(APIView):
@@ -4,7 +4,9 @@ from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from openbook_common.responses import CursorPaginatedResponse
 from openbook_common.utils.helpers import normalise_request_data, normalize_list_value_in_request_data
+from openbook_common.utils.pagination import paginate_queryset
 from openbook_communities.views.community.members.serializers import JoinCommunitySerializer, \
     GetCommunityMembersSerializer, GetCommunityMembersMemberSerializer, LeaveCommunitySerializer, \
     InviteCommunityMemberSerializer, MembersCommunitySerializer, SearchCommunityMembersSerializer, InviteUserSerializer
@@ -25,18 +27,19 @@ class CommunityMembers(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
         exclude = data.get('exclude')
 
         user = request.user
 
         members = user.get_community_with_name_members(community_name=community_name, max_id=max_id,
-                                                       exclude_keywords=exclude).order_by(
-            '-id')[:count]
+                                                       exclude_keywords=exclude)
+        page = paginate_queryset(members, count=count, cursor=cursor)
 
-        response_serializer = GetCommunityMembersMemberSerializer(members, many=True,
+        response_serializer = GetCommunityMembersMemberSerializer(page.items, many=True,
                                                                   context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
 
 class JoinCommunity(APIView):
@@ -4,6 +4,7 @@ from rest_framework import serializers
 from openbook_auth.models import User, UserProfile
 from openbook_auth.validators import username_characters_validator, user_username_exists
 from openbook_common.serializers_fields.user import IsFollowingField
+from openbook_common.serializers_fields.request import CursorField
 from openbook_communities.serializers_fields import UserCommunitiesMembershipsField
 from openbook_communities.validators import community_name_characters_validator, community_name_exists
 
@@ -30,6 +31,9 @@ class GetCommunityModeratorsSerializer(serializers.Serializer):
     max_id = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
     count = serializers.IntegerField(
         required=False,
         max_value=20
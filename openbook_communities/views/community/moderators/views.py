@@ -6,8 +6,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.utils.translation import gettext as _
 
-from openbook_common.responses import ApiMessageResponse
+from openbook_common.responses import ApiMessageResponse, CursorPaginatedResponse
 from openbook_common.utils.helpers import normalise_request_data
+from openbook_common.utils.pagination import paginate_queryset
 from openbook_communities.views.community.moderators.serializers import GetCommunityModeratorsSerializer, \
     GetCommunityModeratorsUserSerializer, RemoveCommunityModeratorSerializer, \
     AddCommunityModeratorSerializer, SearchCommunityModeratorsSerializer
@@ -27,16 +28,17 @@ class CommunityModerators(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        moderators = user.get_community_with_name_moderators(community_name=community_name, max_id=max_id).order_by(
-            '-id')[:count]
+        moderators = user.get_community_with_name_moderators(community_name=community_name, max_id=max_id)
+        page = paginate_queryset(moderators, count=count, cursor=cursor)
 
-        response_serializer = GetCommunityModeratorsUserSerializer(moderators, many=True,
+        response_serializer = GetCommunityModeratorsUserSerializer(page.items, many=True,
                                                                    context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
     def put(self, request, community_name):
         request_data = normalise_request_data(request.data)
@@ -3,9 +3,11 @@ from rest_framework import serializers
 
 from openbook_auth.models import User, UserProfile
 from openbook_common.models import Emoji, Badge
+from openbook_common.serializers import SparseFieldsetsSerializerMixin
 from openbook_common.serializers_fields.post import ReactionsEmojiCountField, CommentsCountField, PostCreatorField, \
     IsMutedField, ReactionField
-from openbook_common.serializers_fields.request import RestrictedImageFileSizeField
+from openbook_common.serializers_fields.image import ImageRenditionsField, MediaUrlField
+from openbook_common.serializers_fields.request import RestrictedImageFileSizeField, CursorField
 from openbook_communities.models import CommunityMembership, Community
 from openbook_communities.validators import community_name_characters_validator, community_name_exists
 from openbook_posts.models import PostImage, PostVideo, Post, PostReaction
@@ -15,6 +17,9 @@ class GetCommunityPostsSerializer(serializers.Serializer):
     max_id = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
     count = serializers.IntegerField(
         required=False,
         max_value=20
@@ -36,14 +41,16 @@ class CreateCommunityPostSerializer(serializers.Serializer):
 
 
 class CommunityPostImageSerializer(serializers.ModelSerializer):
-    image = serializers.ImageField(read_only=True)
+    image = MediaUrlField()
+    renditions = ImageRenditionsField(image_field_name='image')
 
     class Meta:
         model = PostImage
         fields = (
             'image',
             'width',
-            'height'
+            'height',
+            'renditions'
         )
 
 
@@ -81,6 +88,8 @@ class CommunityPostCreatorSerializer(serializers.ModelSerializer):
 
 
 class CommunityPostVideoSerializer(serializers.ModelSerializer):
+    video = MediaUrlField()
+
     class Meta:
         model = PostVideo
         fields = (
@@ -146,7 +155,7 @@ class PostReactionSerializer(serializers.ModelSerializer):
         )
 
 
-class CommunityPostSerializer(serializers.ModelSerializer):
+class CommunityPostSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     image = CommunityPostImageSerializer(many=False)
     video = CommunityPostVideoSerializer(many=False)
     creator = PostCreatorField(post_creator_serializer=CommunityPostCreatorSerializer,
@@ -5,7 +5,10 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from openbook_common.responses import CursorPaginatedResponse
 from openbook_common.utils.helpers import normalise_request_data
+from openbook_common.utils.media_urls import get_posts_media_urls
+from openbook_common.utils.pagination import paginate_queryset
 from openbook_communities.views.community.posts.serializers import GetCommunityPostsSerializer, CommunityPostSerializer, \
     CreateCommunityPostSerializer
 
@@ -24,16 +27,18 @@ class CommunityPosts(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        posts = user.get_posts_for_community_with_name(community_name=community_name, max_id=max_id).order_by(
-            '-created')[:count]
+        posts = user.get_posts_for_community_with_name(community_name=community_name, max_id=max_id)
+        page = paginate_queryset(posts, count=count, cursor=cursor, sort_field='created')
 
-        response_serializer = CommunityPostSerializer(posts, many=True,
-                                                      context={"request": request})
+        response_serializer = CommunityPostSerializer(page.items, many=True,
+                                                      context={"request": request,
+                                                               "media_urls": get_posts_media_urls(page.items)})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
     def put(self, request, community_name):
         request_data = normalise_request_data(request.data)
@@ -72,13 +77,15 @@ class ClosedCommunityPosts(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        posts = user.get_closed_posts_for_community_with_name(community_name=community_name, max_id=max_id).order_by(
-            '-created')[:count]
+        posts = user.get_closed_posts_for_community_with_name(community_name=community_name, max_id=max_id)
+        page = paginate_queryset(posts, count=count, cursor=cursor, sort_field='created')
 
-        response_serializer = CommunityPostSerializer(posts, many=True,
-                                                      context={"request": request})
+        response_serializer = CommunityPostSerializer(page.items, many=True,
+                                                      context={"request": request,
+                                                               "media_urls": get_posts_media_urls(page.items)})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
@@ -4,6 +4,8 @@ from rest_framework import serializers
 from openbook_auth.models import User, UserProfile
 from openbook_categories.models import Category
 from openbook_categories.validators import category_name_exists
+from openbook_common.serializers import SparseFieldsetsSerializerMixin
+from openbook_common.serializers_fields.image import ImageRenditionsField
 from openbook_common.serializers_fields.request import RestrictedImageFileSizeField
 from openbook_common.serializers_fields.user import IsFollowingField
 from openbook_common.validators import hex_color_validator
@@ -125,7 +127,7 @@ class GetCommunityCommunityMembershipSerializer(serializers.ModelSerializer):
         )
 
 
-class GetCommunityCommunitySerializer(serializers.ModelSerializer):
+class GetCommunityCommunitySerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     categories = GetCommunityCommunityCategorySerializer(many=True)
     is_invited = IsInvitedField()
     is_creator = IsCreatorField()
@@ -134,6 +136,8 @@ class GetCommunityCommunitySerializer(serializers.ModelSerializer):
     administrators = AdministratorsField(administrator_serializer=GetCommunityStaffUserSerializer)
     memberships = CommunityMembershipsField(community_membership_serializer=GetCommunityCommunityMembershipSerializer)
     rules = RulesField()
+    avatar_renditions = ImageRenditionsField(image_field_name='avatar')
+    cover_renditions = ImageRenditionsField(image_field_name='cover')
 
     class Meta:
         model = Community
@@ -142,7 +146,9 @@ class GetCommunityCommunitySerializer(serializers.ModelSerializer):
             'title',
             'name',
             'avatar',
+            'avatar_renditions',
             'cover',
+            'cover_renditions',
             'members_count',
             'color',
             'description',
@@ -5,15 +5,21 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from openbook_common.utils.helpers import normalise_request_data, normalize_list_value_in_request_data
+from openbook_common.utils.resource_versions import versioned_etag, make_community_resource, CATEGORIES_RESOURCE
 from openbook_communities.views.community.serializers import GetCommunityCommunitySerializer, DeleteCommunitySerializer, \
     UpdateCommunitySerializer, UpdateCommunityAvatarSerializer, UpdateCommunityCoverSerializer, GetCommunitySerializer, \
     FavoriteCommunitySerializer, CommunityAvatarCommunitySerializer, CommunityCoverCommunitySerializer, \
     FavoriteCommunityCommunitySerializer
 
 
+def get_community_item_resources(request, community_name):
+    return [make_community_resource(community_name), CATEGORIES_RESOURCE]
+
+
 class CommunityItem(APIView):
     permission_classes = (IsAuthenticated,)
 
+    @versioned_etag(get_community_item_resources)
     def get(self, request, community_name):
         serializer = GetCommunitySerializer(data={'community_name': community_name})
         serializer.is_valid(raise_exception=True)
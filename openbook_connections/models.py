@@ -1,7 +1,13 @@
 from django.db import models
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Create your models here.
 from openbook_auth.models import User
+from openbook_common.utils.model_loaders import get_circle_model
+from openbook_common.utils.resource_versions import bump_resources_versions, bump_users_resources_versions, \
+    make_user_circles_resource
 
 
 class Connection(models.Model):
@@ -32,6 +38,43 @@ class Connection(models.Model):
 
         return connection
 
+    @classmethod
+    def bulk_create_connections(cls, user_id, target_users_ids, circles_ids):
+        """
+        Connects the user with each of the target users at once, bumping the versions the post_save receiver
+        would have
+        """
+        target_users_ids = list(target_users_ids)
+
+        cls.objects.bulk_create([cls(user_id=target_user_id, target_user_id=user_id)
+                                 for target_user_id in target_users_ids] +
+                                [cls(user_id=user_id, target_user_id=target_user_id)
+                                 for target_user_id in target_users_ids])
+
+        # bulk_create doesn't return the ids on every database, the rows are matched back by their users
+        connections = list(cls.objects.filter(Q(user_id=user_id, target_user_id__in=target_users_ids) |
+                                              Q(user_id__in=target_users_ids, target_user_id=user_id)))
+        connections_by_users_ids = {(c.user_id, c.target_user_id): c for c in connections}
+
+        for connection in connections:
+            connection.target_connection = connections_by_users_ids[(connection.target_user_id, connection.user_id)]
+
+        cls.objects.bulk_update(connections, ['target_connection'])
+
+        ConnectionCircle = cls.circles.through
+        ConnectionCircle.objects.bulk_create([ConnectionCircle(connection=connection, circle_id=circle_id)
+                                              for connection in connections if connection.user_id == user_id
+                                              for circle_id in circles_ids])
+
+        Circle = get_circle_model()
+        Circle.update_users_counts(circles_query=Q(pk__in=circles_ids))
+
+        bump_users_resources_versions([user_id] + target_users_ids)
+        bump_resources_versions([make_user_circles_resource(connection_user_id)
+                                 for connection_user_id in [user_id] + target_users_ids])
+
+        return [connection for connection in connections if connection.user_id == user_id]
+
     @classmethod
     def connection_exists(cls, user_a_id, user_b_id):
         count = Connection.objects.select_related('target_connection__user_id').filter(user_id=user_a_id,
@@ -60,3 +103,12 @@ class Connection(models.Model):
             return True
 
         return False
+
+
+@receiver([post_save, post_delete], sender=Connection, dispatch_uid='bump_connection_versions')
+def bump_connection_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of both users and of the connection owner circles
+    """
+    bump_users_resources_versions([instance.user_id, instance.target_user_id])
+    bump_resources_versions([make_user_circles_resource(instance.user_id)])
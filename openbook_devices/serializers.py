@@ -1,6 +1,7 @@
 from django.conf import settings
 from rest_framework import serializers
 
+from openbook_common.serializers_fields.request import CursorField
 from openbook_devices.models import Device
 
 
@@ -12,6 +13,9 @@ class GetDevicesSerializer(serializers.Serializer):
     max_id = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
 
 
 class GetDevicesDeviceSerializer(serializers.ModelSerializer):
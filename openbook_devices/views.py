@@ -5,7 +5,9 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from openbook_common.responses import CursorPaginatedResponse
 from openbook_common.utils.helpers import normalise_request_data
+from openbook_common.utils.pagination import paginate_queryset
 from openbook_devices.serializers import GetDevicesSerializer, GetDevicesDeviceSerializer, \
     DeleteDeviceSerializer, CreateDeviceSerializer, UpdateDeviceSerializer
 
@@ -40,15 +42,16 @@ class Devices(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        devices = user.get_devices(max_id=max_id).order_by('-created')[:count]
+        page = paginate_queryset(user.get_devices(max_id=max_id), count=count, cursor=cursor, sort_field='created')
 
-        response_serializer = GetDevicesDeviceSerializer(devices, many=True,
+        response_serializer = GetDevicesDeviceSerializer(page.items, many=True,
                                                          context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
     def delete(self, request):
         user = request.user
@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class OpenbookExporterConfig(AppConfig):
+    name = 'openbook_exporter'
@@ -0,0 +1,217 @@
+import json
+import logging
+from shutil import copyfileobj
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED, ZIP_STORED
+
+from django.conf import settings
+from django.db.models import Prefetch
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.utils.encoders import JSONEncoder
+
+from openbook_auth.models import User
+from openbook_auth.views.authenticated_user.serializers import GetAuthenticatedUserProfileSerializer
+from openbook_circles.models import Circle
+from openbook_circles.serializers import GetCirclesCircleSerializer
+from openbook_common.utils.helpers import iterate_in_batches
+from openbook_connections.models import Connection
+from openbook_connections.serializers import ConnectionUserCircleSerializer
+from openbook_follows.models import Follow
+from openbook_follows.serializers import FollowUserListSerializer
+from openbook_lists.models import List
+from openbook_lists.serializers import GetListsListSerializer
+from openbook_notifications.models import Notification
+from openbook_notifications.serializers import GetNotificationsNotificationSerializer
+from openbook_posts.models import Post, PostComment, PostReaction, PostImage, PostVideo
+from openbook_posts.views.posts.serializers import PostImageSerializer, PostVideoSerializer, PostCircleSerializer, \
+    PostReactionEmojiSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class ExportUserSerializer(serializers.ModelSerializer):
+    profile = GetAuthenticatedUserProfileSerializer(many=False)
+
+    class Meta:
+        model = User
+        fields = (
+            'id',
+            'uuid',
+            'email',
+            'username',
+            'date_joined',
+            'profile',
+        )
+
+
+class ExportPostSerializer(serializers.ModelSerializer):
+    image = PostImageSerializer(many=False)
+    video = PostVideoSerializer(many=False)
+    circles = PostCircleSerializer(many=True, source='exported_circles')
+    community = serializers.SlugRelatedField(slug_field='name', read_only=True)
+
+    class Meta:
+        model = Post
+        fields = (
+            'id',
+            'uuid',
+            'created',
+            'text',
+            'image',
+            'video',
+            'circles',
+            'community',
+            'comments_enabled',
+            'public_reactions',
+            'is_edited',
+            'is_closed',
+        )
+
+
+class ExportPostCommentSerializer(serializers.ModelSerializer):
+    post = serializers.SlugRelatedField(slug_field='uuid', read_only=True)
+
+    class Meta:
+        model = PostComment
+        fields = (
+            'id',
+            'post',
+            'created',
+            'text',
+            'is_edited',
+        )
+
+
+class ExportPostReactionSerializer(serializers.ModelSerializer):
+    post = serializers.SlugRelatedField(slug_field='uuid', read_only=True)
+    emoji = PostReactionEmojiSerializer(many=False)
+
+    class Meta:
+        model = PostReaction
+        fields = (
+            'id',
+            'post',
+            'created',
+            'emoji',
+        )
+
+
+class ExportFollowSerializer(serializers.ModelSerializer):
+    followed_user = serializers.SlugRelatedField(slug_field='username', read_only=True)
+    lists = FollowUserListSerializer(many=True, source='exported_lists')
+
+    class Meta:
+        model = Follow
+        fields = (
+            'id',
+            'followed_user',
+            'lists',
+        )
+
+
+class ExportConnectionSerializer(serializers.ModelSerializer):
+    target_user = serializers.SlugRelatedField(slug_field='username', read_only=True)
+    circles = ConnectionUserCircleSerializer(many=True, source='exported_circles')
+
+    class Meta:
+        model = Connection
+        fields = (
+            'id',
+            'target_user',
+            'circles',
+        )
+
+
+def write_export_archive(user, file):
+    """
+    Writes the data of the user to the file as a zip archive. Every relation is fetched EXPORT_BATCH_SIZE rows at a
+    time and every media file copied EXPORT_MEDIA_CHUNK_SIZE bytes at a time, so memory stays bounded whatever the
+    number of posts.
+    """
+    with ZipFile(file, 'w', compression=ZIP_DEFLATED) as zipf:
+        _write_json(zipf=zipf, name='profile.json', data=ExportUserSerializer(user).data)
+
+        for name, query_set, serializer_class in _get_relations(user=user):
+            _write_json_array(zipf=zipf, name=name, query_set=query_set, serializer_class=serializer_class)
+
+        _write_media(zipf=zipf, user=user)
+
+
+def _get_relations(user):
+    """
+    The many to many relations are prefetched to lists, as prefetching them to managers costs a query set per row
+    """
+    return (
+        ('posts.json',
+         Post.objects.filter(creator_id=user.pk).select_related('image', 'video', 'community').prefetch_related(
+             Prefetch('circles', to_attr='exported_circles'), 'image__image_renditions'),
+         ExportPostSerializer),
+        ('comments.json', PostComment.objects.filter(commenter_id=user.pk).select_related('post'),
+         ExportPostCommentSerializer),
+        ('reactions.json', PostReaction.objects.filter(reactor_id=user.pk).select_related('post', 'emoji'),
+         ExportPostReactionSerializer),
+        ('circles.json', Circle.objects.filter(creator_id=user.pk), GetCirclesCircleSerializer),
+        ('lists.json', List.objects.filter(creator_id=user.pk).select_related('emoji'), GetListsListSerializer),
+        ('follows.json', Follow.objects.filter(user_id=user.pk).select_related('followed_user').prefetch_related(
+            Prefetch('lists', to_attr='exported_lists')), ExportFollowSerializer),
+        ('connections.json', Connection.objects.filter(user_id=user.pk).select_related('target_user').prefetch_related(
+            Prefetch('circles', to_attr='exported_circles')), ExportConnectionSerializer),
+        ('notifications.json', Notification.objects.filter(owner_id=user.pk).prefetch_related('content_object'),
+         GetNotificationsNotificationSerializer),
+    )
+
+
+def _write_json(zipf, name, data):
+    with zipf.open(name, 'w') as member:
+        member.write(json.dumps(data, cls=JSONEncoder).encode('utf-8'))
+
+
+def _write_json_array(zipf, name, query_set, serializer_class):
+    """
+    Writes the rows of the query set as a JSON array, serialized and written a batch at a time
+    """
+    with zipf.open(name, 'w', force_zip64=True) as member:
+        member.write(b'[')
+        separator = b''
+
+        for batch in iterate_in_batches(query_set=query_set, batch_size=settings.EXPORT_BATCH_SIZE):
+            for item in serializer_class(batch, many=True).data:
+                member.write(separator + json.dumps(item, cls=JSONEncoder).encode('utf-8'))
+                separator = b','
+
+        member.write(b']')
+
+
+def _write_media(zipf, user):
+    """
+    Copies the files of the profile and of the posts of the user under media/, at the path they have in the storage
+    """
+    profile = user.profile
+
+    for field_file in (profile.avatar, profile.cover):
+        _write_media_file(zipf=zipf, field_file=field_file)
+
+    for Model, field_name in ((PostImage, 'image'), (PostVideo, 'video')):
+        query_set = Model.objects.filter(post__creator_id=user.pk)
+
+        for batch in iterate_in_batches(query_set=query_set, batch_size=settings.EXPORT_BATCH_SIZE):
+            for media in batch:
+                _write_media_file(zipf=zipf, field_file=getattr(media, field_name))
+
+
+def _write_media_file(zipf, field_file):
+    if not field_file:
+        return
+
+    try:
+        source = field_file.storage.open(field_file.name, 'rb')
+    except FileNotFoundError:
+        logger.warning('Skipping the missing media %s of an export' % field_file.name)
+        return
+
+    # Media are compressed already
+    member_info = ZipInfo('media/%s' % field_file.name, date_time=timezone.now().timetuple()[:6])
+    member_info.compress_type = ZIP_STORED
+
+    with source, zipf.open(member_info, 'w', force_zip64=True) as member:
+        copyfileobj(source, member, settings.EXPORT_MEDIA_CHUNK_SIZE)
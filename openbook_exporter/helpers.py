@@ -0,0 +1,9 @@
+import uuid
+
+
+def upload_to_export_directory(export, filename):
+    path = 'exports/%(export_uuid)s/' % {
+        'export_uuid': str(export.uuid)}
+
+    return '%(path)s%(new_filename)s' % {'path': path,
+                                         'new_filename': str(uuid.uuid4()) + '.zip', }
@@ -0,0 +1,17 @@
+from django_rq import job
+
+from openbook_common.utils.model_loaders import get_export_model
+
+
+@job('low')
+def process_export(export_id):
+    """
+    Writes the archive of a data export and hands it to the storage
+    """
+    Export = get_export_model()
+    export = Export.objects.filter(pk=export_id).select_related('creator__profile').first()
+
+    if not export:
+        return
+
+    export.process()
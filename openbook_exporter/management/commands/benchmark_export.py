@@ -0,0 +1,59 @@
+import secrets
+import tempfile
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from openbook_common.utils.model_loaders import get_user_model
+from openbook_exporter.archive import write_export_archive
+
+
+class Command(BaseCommand):
+    help = 'Measures the time and the peak memory of the export of a synthetic user with many posts. The user is ' \
+           'rolled back afterwards.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=50000, help='The number of posts of the user')
+
+    def handle(self, *args, **options):
+        posts_count = options['posts']
+
+        with transaction.atomic():
+            user = self._make_user_with_posts(posts_count=posts_count)
+
+            with tempfile.TemporaryFile() as archive:
+                tracemalloc.start()
+                started = time.perf_counter()
+
+                write_export_archive(user=user, file=archive)
+
+                elapsed = time.perf_counter() - started
+                current_memory, peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                archive_size = archive.tell()
+
+            transaction.set_rollback(True)
+
+        self.stdout.write('%d posts in %.2fs, %.1f posts/s, %.1fMB peak memory, %.1fMB archive' % (
+            posts_count, elapsed, posts_count / elapsed, peak_memory / 1024 / 1024, archive_size / 1024 / 1024))
+
+    def _make_user_with_posts(self, posts_count):
+        User = get_user_model()
+
+        username = 'benchmark%d' % secrets.randbelow(1000000)
+        user = User.create_user(username=username, email='%s@example.com' % username,
+                                password=secrets.token_hex(16), name='Benchmark', is_of_legal_age=True,
+                                are_guidelines_accepted=True)
+
+        batch_size = settings.POSTS_BULK_CREATE_BATCH_SIZE
+
+        for offset in range(0, posts_count, batch_size):
+            user.bulk_create_public_posts(posts_data=[
+                {'text': 'Benchmark post %d' % i} for i in range(offset, min(offset + batch_size, posts_count))
+            ])
+
+        return user
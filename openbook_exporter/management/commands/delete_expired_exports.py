@@ -0,0 +1,20 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from openbook_common.utils.model_loaders import get_export_model
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Deletes the data exports older than EXPORT_EXPIRY along with their archives'
+
+    def handle(self, *args, **options):
+        Export = get_export_model()
+
+        with transaction.atomic():
+            deleted_count, deleted_per_model = Export.delete_expired_exports()
+
+        logger.info('Deleted %d expired exports' % deleted_count)
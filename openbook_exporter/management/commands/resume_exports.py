@@ -0,0 +1,22 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from openbook_common.utils.model_loaders import get_export_model
+from openbook_exporter.jobs import process_export
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Queues again the exports which were not done after EXPORT_STALL_TIMEOUT, e.g. after a worker crash'
+
+    def handle(self, *args, **options):
+        Export = get_export_model()
+
+        stalled_exports_ids = list(Export.get_stalled_exports().values_list('pk', flat=True))
+
+        for export_id in stalled_exports_ids:
+            process_export.delay(export_id)
+
+        logger.info('Queued %d stalled exports' % len(stalled_exports_ids))
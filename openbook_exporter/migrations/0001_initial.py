@@ -0,0 +1,31 @@
+# Generated by Django 2.2 on 2026-10-19 11:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import openbook_exporter.helpers
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Export',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('status', models.CharField(choices=[('P', 'Pending'), ('R', 'Running'), ('C', 'Completed'), ('F', 'Failed')], default='P', max_length=1)),
+                ('file', models.FileField(blank=True, null=True, upload_to=openbook_exporter.helpers.upload_to_export_directory, verbose_name='file')),
+                ('created', models.DateTimeField(db_index=True, editable=False)),
+                ('updated', models.DateTimeField(editable=False)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exports', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,112 @@
+import uuid
+from datetime import timedelta
+from tempfile import TemporaryFile
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from openbook.storage_backends import S3PrivateMediaStorage
+from openbook_auth.models import User
+from openbook_common.utils.helpers import delete_file_field
+from openbook_exporter.helpers import upload_to_export_directory
+
+export_storage = S3PrivateMediaStorage() if settings.IS_PRODUCTION else default_storage
+
+
+class Export(models.Model):
+    """
+    The export of the data of a user, written to a zip archive by a background job a batch of rows at a time
+    """
+    STATUS_PENDING = 'P'
+    STATUS_RUNNING = 'R'
+    STATUS_COMPLETED = 'C'
+    STATUS_FAILED = 'F'
+
+    STATUSES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_FAILED, 'Failed'),
+    )
+
+    creator = models.ForeignKey(User, on_delete=models.CASCADE, related_name='exports', null=False)
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    status = models.CharField(max_length=1, choices=STATUSES, default=STATUS_PENDING, null=False, blank=False)
+    file = models.FileField(_('file'), storage=export_storage, upload_to=upload_to_export_directory, null=True,
+                            blank=True)
+    created = models.DateTimeField(editable=False, db_index=True)
+    updated = models.DateTimeField(editable=False)
+
+    @classmethod
+    def create_export(cls, creator):
+        # The stalled exports of the creator are superseded by the new one rather than queued again
+        cls.get_stalled_exports().filter(creator=creator).update(status=cls.STATUS_FAILED, updated=timezone.now())
+        return cls.objects.create(creator=creator)
+
+    @classmethod
+    def get_stalled_exports(cls):
+        """
+        The exports whose job was lost, e.g. along with a crashed worker
+        """
+        stalled_before = timezone.now() - timedelta(seconds=settings.EXPORT_STALL_TIMEOUT)
+        return cls.objects.filter(status__in=[cls.STATUS_PENDING, cls.STATUS_RUNNING], updated__lt=stalled_before)
+
+    @classmethod
+    def delete_expired_exports(cls):
+        expired_before = timezone.now() - timedelta(seconds=settings.EXPORT_EXPIRY)
+        return cls.objects.filter(created__lt=expired_before).delete()
+
+    def is_done(self):
+        return self.status in [self.STATUS_COMPLETED, self.STATUS_FAILED]
+
+    def process(self):
+        """
+        Writes the archive to a temporary file a batch of rows and a chunk of media at a time, then hands it to the
+        storage, which uploads it in parts
+        """
+        # Imported here as the serializers of the archive import the models of every app
+        from openbook_exporter.archive import write_export_archive
+
+        with transaction.atomic():
+            Export.objects.select_for_update().filter(pk=self.pk).first()
+            self.refresh_from_db()
+
+            if self.is_done():
+                return
+
+            self.status = self.STATUS_RUNNING
+            self.save()
+
+        try:
+            with TemporaryFile() as archive:
+                write_export_archive(user=self.creator, file=archive)
+                archive.seek(0)
+                self.file.save('export.zip', File(archive), save=False)
+        except Exception:
+            self.status = self.STATUS_FAILED
+            self.save()
+            raise
+
+        self.status = self.STATUS_COMPLETED
+        self.save()
+
+    def save(self, *args, **kwargs):
+        now = timezone.now()
+        if not self.id:
+            self.created = now
+        self.updated = now
+        return super(Export, self).save(*args, **kwargs)
+
+
+@receiver(post_delete, sender=Export, dispatch_uid='delete_export_file')
+def delete_export_file(sender, instance=None, **kwargs):
+    """"
+    Delete the archive of the export once its row is gone
+    """
+    delete_file_field(instance.file)
@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from openbook_common.serializers_fields.image import MediaUrlField
+from openbook_exporter.models import Export
+
+
+class GetExportSerializer(serializers.Serializer):
+    export_uuid = serializers.UUIDField()
+
+
+class GetExportsExportSerializer(serializers.ModelSerializer):
+    file = MediaUrlField()
+
+    class Meta:
+        model = Export
+        fields = (
+            'uuid',
+            'status',
+            'file',
+            'created',
+        )
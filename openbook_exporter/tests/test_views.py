@@ -0,0 +1,199 @@
+import json
+import tempfile
+from datetime import timedelta
+from zipfile import ZipFile
+
+from django.conf import settings
+from django.core.files import File
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openbook_common.tests.helpers import make_user, make_authentication_headers_for_user, make_fake_post_text, \
+    make_fake_post_comment_text, make_post_image
+from openbook_exporter.archive import write_export_archive
+from openbook_exporter.models import Export
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ExportsAPITests(APITestCase):
+    """
+    ExportsAPI
+    """
+
+    fixtures = [
+        'openbook_circles/fixtures/circles.json'
+    ]
+
+    def test_can_export_data(self):
+        """
+        should be able to export the posts, comments and media of the user as a zip archive and return 202
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        post = user.create_public_post(text=make_fake_post_text())
+        image_post = user.create_public_post(image=File(make_post_image()))
+        user.comment_post_with_id(post_id=post.pk, text=make_fake_post_comment_text())
+
+        response = self.client.put(self._get_url(), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        export = Export.objects.get(uuid=json.loads(response.content)['uuid'])
+
+        self.assertEqual(export.status, Export.STATUS_COMPLETED)
+
+        with export.file.open('rb') as archive, ZipFile(archive) as zipf:
+            posts = json.loads(zipf.read('posts.json'))
+            comments = json.loads(zipf.read('comments.json'))
+            profile = json.loads(zipf.read('profile.json'))
+
+            self.assertEqual({exported_post['id'] for exported_post in posts}, {post.pk, image_post.pk})
+            self.assertEqual(comments[0]['post'], str(post.uuid))
+            self.assertEqual(profile['username'], user.username)
+            self.assertIn('media/%s' % image_post.image.image.name, zipf.namelist())
+
+    def test_exports_relations_in_batches(self):
+        """
+        should export every row of a relation spanning several batches
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        posts_ids = {user.create_public_post(text=make_fake_post_text()).pk for i in range(0, 5)}
+
+        with self.settings(EXPORT_BATCH_SIZE=2):
+            response = self.client.put(self._get_url(), **headers)
+
+        export = Export.objects.get(uuid=json.loads(response.content)['uuid'])
+
+        with export.file.open('rb') as archive, ZipFile(archive) as zipf:
+            posts = json.loads(zipf.read('posts.json'))
+
+        self.assertEqual({exported_post['id'] for exported_post in posts}, posts_ids)
+
+    def test_export_queries_dont_grow_with_posts(self):
+        """
+        should write the archive with the same number of queries whatever the number of posts within a batch
+        """
+        few_posts_user = make_user()
+        many_posts_user = make_user()
+
+        for i in range(0, 2):
+            few_posts_user.create_public_post(text=make_fake_post_text())
+
+        for i in range(0, 10):
+            many_posts_user.create_public_post(text=make_fake_post_text())
+
+        write_export_archive(user=few_posts_user, file=tempfile.TemporaryFile())
+
+        with CaptureQueriesContext(connection) as few_posts_queries:
+            write_export_archive(user=few_posts_user, file=tempfile.TemporaryFile())
+
+        with CaptureQueriesContext(connection) as many_posts_queries:
+            write_export_archive(user=many_posts_user, file=tempfile.TemporaryFile())
+
+        self.assertEqual(len(few_posts_queries), len(many_posts_queries))
+
+    def test_cant_export_data_while_export_in_progress(self):
+        """
+        should not be able to export the data while another export is in progress and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        Export.create_export(creator=user)
+
+        response = self.client.put(self._get_url(), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(user.exports.count(), 1)
+
+    def test_can_export_data_when_export_stalled(self):
+        """
+        should be able to export the data when the export in progress stalled, which is failed, and return 202
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        stalled_export = Export.create_export(creator=user)
+        Export.objects.filter(pk=stalled_export.pk).update(
+            status=Export.STATUS_RUNNING,
+            updated=timezone.now() - timedelta(seconds=settings.EXPORT_STALL_TIMEOUT + 1))
+
+        response = self.client.put(self._get_url(), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        stalled_export.refresh_from_db()
+
+        self.assertEqual(stalled_export.status, Export.STATUS_FAILED)
+        self.assertEqual(user.exports.filter(status=Export.STATUS_COMPLETED).count(), 1)
+
+    def test_can_retrieve_exports(self):
+        """
+        should be able to retrieve the exports of the user and return 200
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        export = Export.create_export(creator=user)
+        Export.create_export(creator=make_user())
+
+        response = self.client.get(self._get_url(), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([response_export['uuid'] for response_export in json.loads(response.content)],
+                         [str(export.uuid)])
+
+    def _get_url(self):
+        return reverse('exports')
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ExportItemAPITests(APITestCase):
+    """
+    ExportItemAPI
+    """
+
+    def test_can_retrieve_export_download_link(self):
+        """
+        should be able to retrieve a completed export along with the link to download its archive and return 200
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        export = Export.create_export(creator=user)
+        export.process()
+
+        response = self.client.get(self._get_url(export=export), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_export = json.loads(response.content)
+
+        self.assertEqual(response_export['status'], Export.STATUS_COMPLETED)
+        self.assertTrue(response_export['file'].endswith(export.file.url))
+
+    def test_cant_retrieve_foreign_export(self):
+        """
+        should not be able to retrieve the export of another user and return 404
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        export = Export.create_export(creator=make_user())
+
+        response = self.client.get(self._get_url(export=export), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def _get_url(self, export):
+        return reverse('export', kwargs={
+            'export_uuid': export.uuid
+        })
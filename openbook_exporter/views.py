@@ -0,0 +1,54 @@
+from django.db import transaction
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+
+from openbook_exporter.jobs import process_export
+from openbook_exporter.serializers import GetExportSerializer, GetExportsExportSerializer
+
+
+class Exports(APIView):
+
+    permission_classes = (IsAuthenticated,)
+
+    def put(self, request):
+        """
+        Queues the export of the data of the user, the archive can then be downloaded from ExportItem once completed
+        """
+        user = request.user
+
+        with transaction.atomic():
+            export = user.create_export()
+
+        process_export.delay(export.pk)
+
+        response_serializer = GetExportsExportSerializer(export, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    def get(self, request):
+        user = request.user
+
+        exports = user.get_exports()
+
+        response_serializer = GetExportsExportSerializer(exports, many=True, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
+class ExportItem(APIView):
+
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, export_uuid):
+        serializer = GetExportSerializer(data={'export_uuid': export_uuid})
+        serializer.is_valid(raise_exception=True)
+
+        user = request.user
+
+        export = user.get_export_with_uuid(export_uuid=export_uuid)
+
+        response_serializer = GetExportsExportSerializer(export, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
@@ -1,7 +1,11 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 
 # Create your models here.
 from openbook_auth.models import User
+from openbook_common.utils.resource_versions import bump_resources_versions, bump_users_resources_versions, \
+    make_user_lists_resource
 
 
 class Follow(models.Model):
@@ -19,3 +23,51 @@ class Follow(models.Model):
             follow.lists.add(*lists_ids)
 
         return follow
+
+    @classmethod
+    def bulk_create_follows(cls, user_id, followed_users_ids, lists_ids=None):
+        """
+        Follows each of the given users at once, bumping the versions the post_save receiver would have
+        """
+        followed_users_ids = list(followed_users_ids)
+        cls.objects.bulk_create([cls(user_id=user_id, followed_user_id=followed_user_id)
+                                 for followed_user_id in followed_users_ids])
+
+        if lists_ids:
+            cls._add_follows_lists(user_id=user_id, followed_users_ids=followed_users_ids, lists_ids=lists_ids)
+
+        bump_users_resources_versions([user_id] + followed_users_ids)
+        bump_resources_versions([make_user_lists_resource(user_id)])
+
+    @classmethod
+    def update_follows_lists(cls, user_id, followed_users_ids, lists_ids):
+        """
+        Replaces the lists of the follows of each of the given users at once
+        """
+        followed_users_ids = list(followed_users_ids)
+
+        ListFollow = cls.lists.through
+        ListFollow.objects.filter(follow__user_id=user_id, follow__followed_user_id__in=followed_users_ids).delete()
+
+        if lists_ids:
+            cls._add_follows_lists(user_id=user_id, followed_users_ids=followed_users_ids, lists_ids=lists_ids)
+
+        bump_users_resources_versions([user_id] + followed_users_ids)
+        bump_resources_versions([make_user_lists_resource(user_id)])
+
+    @classmethod
+    def _add_follows_lists(cls, user_id, followed_users_ids, lists_ids):
+        ListFollow = cls.lists.through
+        follows_ids = cls.objects.filter(user_id=user_id, followed_user_id__in=followed_users_ids).values_list(
+            'id', flat=True)
+        ListFollow.objects.bulk_create([ListFollow(follow_id=follow_id, list_id=list_id)
+                                        for follow_id in follows_ids for list_id in lists_ids])
+
+
+@receiver([post_save, post_delete], sender=Follow, dispatch_uid='bump_follow_versions')
+def bump_follow_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of both users and of the follower lists
+    """
+    bump_users_resources_versions([instance.user_id, instance.followed_user_id])
+    bump_resources_versions([make_user_lists_resource(instance.user_id)])
@@ -97,3 +97,51 @@ class UpdateFollowSerializer(serializers.Serializer):
         required=False,
         child=serializers.IntegerField(validators=[list_id_exists])
     )
+
+
+class BulkFollowUsersSerializer(serializers.Serializer):
+    # The usernames are checked to exist all at once when following
+    usernames = serializers.ListField(
+        required=True,
+        allow_empty=False,
+        max_length=settings.BULK_FOLLOWS_MAX_USERS,
+        child=serializers.CharField(max_length=settings.USERNAME_MAX_LENGTH,
+                                    allow_blank=False,
+                                    validators=[username_characters_validator])
+    )
+    lists_ids = serializers.ListSerializer(
+        required=False,
+        child=serializers.IntegerField(validators=[list_id_exists])
+    )
+
+
+class BulkUnfollowUsersSerializer(serializers.Serializer):
+    usernames = serializers.ListField(
+        required=True,
+        allow_empty=False,
+        max_length=settings.BULK_FOLLOWS_MAX_USERS,
+        child=serializers.CharField(max_length=settings.USERNAME_MAX_LENGTH,
+                                    allow_blank=False,
+                                    validators=[username_characters_validator])
+    )
+
+
+class BulkFollowUserSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = (
+            'id',
+            'username',
+        )
+
+
+class BulkFollowSerializer(serializers.ModelSerializer):
+    followed_user = BulkFollowUserSerializer(many=False)
+
+    class Meta:
+        model = Follow
+        fields = (
+            'id',
+            'user',
+            'followed_user',
+        )
@@ -1,4 +1,6 @@
 # Create your tests here.
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -10,8 +12,10 @@ from faker import Faker
 import logging
 import json
 
+from openbook_common.tests.helpers import make_user, make_authentication_headers_for_user
 from openbook_lists.models import List
 from openbook_follows.models import Follow
+from openbook_notifications.jobs import send_follow_notifications
 from openbook_notifications.models import FollowNotification, Notification
 
 logger = logging.getLogger(__name__)
@@ -382,3 +386,217 @@ class UpdateFollowAPITest(APITestCase):
 
     def _get_url(self):
         return reverse('update-follow')
+
+
+class BulkFollowUsersAPITests(APITestCase):
+    """
+    BulkFollowUsersAPI
+    """
+
+    def test_can_bulk_follow_users(self):
+        """
+        should be able to follow many users in lists at once and return 201
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        list = mixer.blend(List, creator=user)
+        users_to_follow = [make_user() for i in range(3)]
+
+        data = {
+            'usernames': ','.join([user_to_follow.username for user_to_follow in users_to_follow]),
+            'lists_ids': str(list.pk)
+        }
+
+        response = self.client.post(self._get_url(), data, **headers, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(json.loads(response.content)), len(users_to_follow))
+
+        for user_to_follow in users_to_follow:
+            self.assertTrue(user.is_following_user_with_id_in_list_with_id(user_to_follow.pk, list.pk))
+
+    def test_bulk_follow_queries_dont_grow_with_users(self):
+        """
+        should follow many users with the same number of queries however many users are followed
+        """
+        user = make_user()
+        list = mixer.blend(List, creator=user)
+
+        def get_follow_queries_count(users_count):
+            usernames = [make_user().username for i in range(users_count)]
+
+            with CaptureQueriesContext(connection) as context:
+                user.follow_users_with_usernames(usernames=usernames, lists_ids=[list.pk])
+
+            return len(context.captured_queries)
+
+        self.assertEqual(get_follow_queries_count(users_count=2), get_follow_queries_count(users_count=10))
+
+    def test_cannot_bulk_follow_blocked_user(self):
+        """
+        should not be able to follow many users at once when one of them is blocked and return 403
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        user_to_follow = make_user()
+        blocked_user = make_user()
+        user.block_user_with_id(blocked_user.pk)
+
+        data = {
+            'usernames': ','.join([user_to_follow.username, blocked_user.username])
+        }
+
+        response = self.client.post(self._get_url(), data, **headers, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(user.is_following_user_with_id(user_to_follow.pk))
+
+    def test_cannot_bulk_follow_past_max_follows(self):
+        """
+        should not be able to follow more users at once than the follows left and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        users_to_follow = [make_user() for i in range(3)]
+
+        data = {
+            'usernames': ','.join([user_to_follow.username for user_to_follow in users_to_follow])
+        }
+
+        with self.settings(USER_MAX_FOLLOWS=2):
+            response = self.client.post(self._get_url(), data, **headers, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(user.follows.exists())
+
+    def test_bulk_follow_notifications_are_created_by_one_job(self):
+        """
+        should create the notifications of all the users followed at once in the follow notifications job
+        """
+        user = make_user()
+        users_to_follow = [make_user() for i in range(3)]
+        followed_users_ids = [user_to_follow.pk for user_to_follow in users_to_follow]
+
+        user.follow_users_with_usernames(usernames=[user_to_follow.username for user_to_follow in users_to_follow])
+
+        send_follow_notifications(following_user_id=user.pk, followed_users_ids=followed_users_ids)
+
+        self.assertEqual(Notification.objects.filter(notification_type=Notification.FOLLOW,
+                                                     owner_id__in=followed_users_ids).count(), len(users_to_follow))
+        self.assertEqual(FollowNotification.objects.filter(follower_id=user.pk).count(), len(users_to_follow))
+
+    def test_bulk_follow_notifications_skip_orphaned_follow_notifications(self):
+        """
+        should attach the notifications to the new follow notifications rather than to the ones left without one
+        """
+        user = make_user()
+        orphaned_follow_notification = FollowNotification.objects.create(follower_id=user.pk)
+        users_to_follow = [make_user() for i in range(3)]
+        followed_users_ids = [user_to_follow.pk for user_to_follow in users_to_follow]
+
+        user.follow_users_with_usernames(usernames=[user_to_follow.username for user_to_follow in users_to_follow])
+
+        send_follow_notifications(following_user_id=user.pk, followed_users_ids=followed_users_ids)
+
+        self.assertFalse(orphaned_follow_notification.notification.exists())
+
+        for followed_user_id in followed_users_ids:
+            self.assertEqual(FollowNotification.objects.filter(follower_id=user.pk,
+                                                               notification__owner_id=followed_user_id).count(), 1)
+
+    def _get_url(self):
+        return reverse('bulk-follow-users')
+
+
+class BulkUnfollowUsersAPITests(APITestCase):
+    """
+    BulkUnfollowUsersAPI
+    """
+
+    def test_can_bulk_unfollow_users(self):
+        """
+        should be able to unfollow many users at once and return 200
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        users_to_unfollow = [make_user() for i in range(3)]
+        user_to_keep = make_user()
+
+        for followed_user in users_to_unfollow + [user_to_keep]:
+            user.follow_user_with_id(followed_user.pk)
+
+        data = {
+            'usernames': ','.join([user_to_unfollow.username for user_to_unfollow in users_to_unfollow])
+        }
+
+        response = self.client.post(self._get_url(), data, **headers, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(user.follows.values_list('followed_user_id', flat=True)), [user_to_keep.pk])
+        self.assertFalse(FollowNotification.objects.filter(follower_id=user.pk,
+                                                           notification__owner_id__in=[
+                                                               user_to_unfollow.pk for user_to_unfollow in
+                                                               users_to_unfollow]).exists())
+
+    def test_cannot_bulk_unfollow_not_followed_user(self):
+        """
+        should not be able to unfollow many users at once when one of them is not followed and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        followed_user = make_user()
+        user.follow_user_with_id(followed_user.pk)
+
+        data = {
+            'usernames': ','.join([followed_user.username, make_user().username])
+        }
+
+        response = self.client.post(self._get_url(), data, **headers, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(user.is_following_user_with_id(followed_user.pk))
+
+    def _get_url(self):
+        return reverse('bulk-unfollow-users')
+
+
+class BulkUpdateFollowUsersAPITests(APITestCase):
+    """
+    BulkUpdateFollowUsersAPI
+    """
+
+    def test_can_bulk_update_follows_lists(self):
+        """
+        should be able to replace the lists of many follows at once and return 200
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        old_list = mixer.blend(List, creator=user)
+        new_list = mixer.blend(List, creator=user)
+
+        followed_users = [make_user() for i in range(3)]
+
+        for followed_user in followed_users:
+            user.follow_user_with_id(followed_user.pk, lists_ids=[old_list.pk])
+
+        data = {
+            'usernames': ','.join([followed_user.username for followed_user in followed_users]),
+            'lists_ids': str(new_list.pk)
+        }
+
+        response = self.client.post(self._get_url(), data, **headers, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        for followed_user in followed_users:
+            self.assertTrue(user.is_following_user_with_id_in_list_with_id(followed_user.pk, new_list.pk))
+            self.assertFalse(user.is_following_user_with_id_in_list_with_id(followed_user.pk, old_list.pk))
+
+    def _get_url(self):
+        return reverse('bulk-update-follows')
@@ -6,9 +6,10 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from openbook_common.utils.helpers import normalise_request_data
+from openbook_common.utils.helpers import normalise_request_data, nomalize_usernames_in_request_data
 from openbook_follows.serializers import FollowUserRequestSerializer, FollowSerializer, \
-    DeleteFollowSerializer, UpdateFollowSerializer, FollowUserSerializer
+    DeleteFollowSerializer, UpdateFollowSerializer, FollowUserSerializer, BulkFollowUsersSerializer, \
+    BulkUnfollowUsersSerializer, BulkFollowSerializer
 
 
 class Follows(APIView):
@@ -93,6 +94,75 @@ class UpdateFollowUser(APIView):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
+class BulkFollowUsers(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request):
+        request_data = _prepare_request_data_for_validation(request.data)
+        nomalize_usernames_in_request_data(request_data)
+
+        serializer = BulkFollowUsersSerializer(data=request_data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        lists_ids = data.get('lists_ids')
+        usernames = data.get('usernames')
+
+        user = request.user
+
+        with transaction.atomic():
+            follows = user.follow_users_with_usernames(usernames=usernames, lists_ids=lists_ids)
+
+        response_serializer = BulkFollowSerializer(follows, many=True, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
+
+class BulkUnfollowUsers(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request):
+        request_data = normalise_request_data(request.data)
+        nomalize_usernames_in_request_data(request_data)
+
+        serializer = BulkUnfollowUsersSerializer(data=request_data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        usernames = data.get('usernames')
+
+        user = request.user
+
+        with transaction.atomic():
+            user.unfollow_users_with_usernames(usernames=usernames)
+
+        return Response(status=status.HTTP_200_OK)
+
+
+class BulkUpdateFollowUsers(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request):
+        request_data = _prepare_request_data_for_validation(request.data)
+        nomalize_usernames_in_request_data(request_data)
+
+        serializer = BulkFollowUsersSerializer(data=request_data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        lists_ids = data.get('lists_ids')
+        usernames = data.get('usernames')
+
+        user = request.user
+
+        with transaction.atomic():
+            follows = user.update_follows_for_users_with_usernames(usernames=usernames, lists_ids=lists_ids)
+
+        response_serializer = BulkFollowSerializer(follows, many=True, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
 def _prepare_request_data_for_validation(request_data):
     request_data_copy = normalise_request_data(request_data)
     lists_ids = request_data_copy.get('lists_ids', None)
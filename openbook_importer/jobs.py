@@ -0,0 +1,17 @@
+from django_rq import job
+
+from openbook_common.utils.model_loaders import get_import_model
+
+
+@job('low')
+def process_import(import_id):
+    """
+    Imports the posts of an archive, resuming from its progress when re-run
+    """
+    Import = get_import_model()
+    archive_import = Import.objects.filter(pk=import_id).first()
+
+    if not archive_import:
+        return
+
+    archive_import.process()
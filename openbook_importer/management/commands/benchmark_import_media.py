@@ -0,0 +1,57 @@
+import os
+import tempfile
+import time
+from io import BytesIO
+from zipfile import ZipFile
+
+from PIL import Image
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from openbook_importer.socialmedia_archive_parser.fb_parser import zip_parser, archive_media
+
+
+class Command(BaseCommand):
+    help = 'Compares the throughput of the serial and parallel preparation of the media of a synthetic archive'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--photos', type=int, default=2000, help='The number of photos of the archive')
+        parser.add_argument('--workers', type=int, default=settings.IMPORT_MEDIA_MAX_WORKERS,
+                            help='The number of processes of the parallel run')
+        parser.add_argument('--size', type=int, default=3000, help='The width of the photos, downsized to '
+                                                                    'IMPORT_IMAGE_MAX_DIMENSION')
+
+    def handle(self, *args, **options):
+        photos_count = options['photos']
+        workers = options['workers']
+
+        with tempfile.TemporaryDirectory() as directory:
+            archive_path = os.path.join(directory, 'archive.zip')
+            names = self._make_archive(path=archive_path, photos_count=photos_count, width=options['size'])
+
+            for max_workers in (1, workers):
+                with zip_parser(archive_path) as p:
+                    media = [archive_media(p, name) for name in names]
+
+                    started = time.perf_counter()
+
+                    for media_file in p.prepare_media(media=media, max_workers=max_workers,
+                                                      max_dimension=settings.IMPORT_IMAGE_MAX_DIMENSION):
+                        media_file.close()
+
+                    elapsed = time.perf_counter() - started
+
+                self.stdout.write('%d workers: %d photos in %.2fs, %.1f photos/s' % (
+                    max_workers, photos_count, elapsed, photos_count / elapsed))
+
+    def _make_archive(self, path, photos_count, width):
+        photo = BytesIO()
+        Image.linear_gradient('L').resize((width, width * 2 // 3)).convert('RGB').save(photo, format='JPEG')
+
+        names = ['photos_and_videos/your_posts/%d.jpg' % i for i in range(photos_count)]
+
+        with ZipFile(path, 'w') as zipf:
+            for name in names:
+                zipf.writestr(name, photo.getvalue())
+
+        return names
@@ -0,0 +1,22 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from openbook_common.utils.model_loaders import get_import_model
+from openbook_importer.jobs import process_import
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Queues again the imports which made no progress for IMPORT_STALL_TIMEOUT, e.g. after a worker crash'
+
+    def handle(self, *args, **options):
+        Import = get_import_model()
+
+        stalled_imports_ids = list(Import.get_stalled_imports().values_list('pk', flat=True))
+
+        for import_id in stalled_imports_ids:
+            process_import.delay(import_id)
+
+        logger.info('Queued %d stalled imports' % len(stalled_imports_ids))
@@ -0,0 +1,35 @@
+# Generated by Django 2.2 on 2026-10-19 11:07
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('openbook_uploads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Import',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('status', models.CharField(choices=[('P', 'Pending'), ('R', 'Running'), ('C', 'Completed'), ('F', 'Failed')], db_index=True, default='P', max_length=1)),
+                ('total_posts', models.PositiveIntegerField(null=True, verbose_name='total posts')),
+                ('processed_posts', models.PositiveIntegerField(default=0, verbose_name='processed posts')),
+                ('imported_posts', models.PositiveIntegerField(default=0, verbose_name='imported posts')),
+                ('error', models.CharField(blank=True, max_length=255, null=True, verbose_name='error')),
+                ('created', models.DateTimeField(editable=False)),
+                ('updated', models.DateTimeField(db_index=True, editable=False)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='imports', to=settings.AUTH_USER_MODEL)),
+                ('upload', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='imports', to='openbook_uploads.Upload')),
+            ],
+        ),
+    ]
@@ -0,0 +1,268 @@
+import logging
+import uuid
+from datetime import datetime, timedelta
+from hashlib import sha256
+from json import JSONDecodeError
+from os import path
+from zipfile import BadZipFile
+
+from django.conf import settings
+from django.core.files.images import ImageFile
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import ugettext_lazy as _
+
+from openbook_auth.models import User
+from openbook_common.utils.media_garbage import bury_media_keys
+from openbook_common.utils.model_loaders import get_post_image_model
+from openbook_importer.socialmedia_archive_parser.fb_parser import zip_parser
+from openbook_uploads.models import Upload
+
+logger = logging.getLogger(__name__)
+
+
+class Import(models.Model):
+    """
+    The import of a social media archive, processed by a background job a batch of posts at a time
+    """
+    STATUS_PENDING = 'P'
+    STATUS_RUNNING = 'R'
+    STATUS_COMPLETED = 'C'
+    STATUS_FAILED = 'F'
+
+    STATUSES = (
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_FAILED, 'Failed'),
+    )
+
+    creator = models.ForeignKey(User, on_delete=models.CASCADE, related_name='imports', null=False)
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    upload = models.ForeignKey(Upload, on_delete=models.SET_NULL, related_name='imports', null=True)
+    status = models.CharField(max_length=1, choices=STATUSES, default=STATUS_PENDING, null=False, blank=False,
+                              db_index=True)
+    total_posts = models.PositiveIntegerField(_('total posts'), null=True)
+    processed_posts = models.PositiveIntegerField(_('processed posts'), null=False, default=0)
+    imported_posts = models.PositiveIntegerField(_('imported posts'), null=False, default=0)
+    error = models.CharField(_('error'), max_length=settings.IMPORT_ERROR_MAX_LENGTH, null=True, blank=True)
+    created = models.DateTimeField(editable=False)
+    updated = models.DateTimeField(editable=False, db_index=True)
+
+    @classmethod
+    def create_import(cls, creator, upload):
+        return cls.objects.create(creator=creator, upload=upload)
+
+    @classmethod
+    def get_stalled_imports(cls):
+        """
+        The imports whose job was lost, e.g. along with a crashed worker
+        """
+        stalled_before = timezone.now() - timedelta(seconds=settings.IMPORT_STALL_TIMEOUT)
+        return cls.objects.filter(status__in=[cls.STATUS_PENDING, cls.STATUS_RUNNING], updated__lt=stalled_before)
+
+    def is_done(self):
+        return self.status in [self.STATUS_COMPLETED, self.STATUS_FAILED]
+
+    def process(self):
+        """
+        Imports the posts of the archive from the first one not processed yet, so a job re-run after a crash
+        resumes where the previous one stopped
+        """
+        with transaction.atomic():
+            Import.objects.select_for_update().filter(pk=self.pk).first()
+            self.refresh_from_db()
+
+            if self.is_done():
+                return
+
+            if not self.upload:
+                self._fail(error=_('The archive expired before it could be imported.'))
+                return
+
+            self.status = self.STATUS_RUNNING
+            self.save()
+
+        try:
+            # Opened by path so the media workers can open the archive as well
+            with zip_parser(self.upload.get_path()) as p:
+                posts = list(p.posts())
+
+                if self.total_posts is None:
+                    self.total_posts = len(posts)
+                    self.save()
+
+                existing_posts_keys = self._get_existing_posts_keys(posts=posts)
+
+                for offset in range(self.processed_posts, len(posts), settings.IMPORT_BATCH_SIZE):
+                    if not self._import_posts_batch(parser=p, posts=posts, offset=offset,
+                                                    existing_posts_keys=existing_posts_keys):
+                        # Another job took over the import
+                        return
+
+        except (FileNotFoundError, JSONDecodeError, KeyError, BadZipFile, BufferError):
+            self._fail(error=_('invalid archive'))
+            return
+
+        except TypeError:
+            logger.warning('Potentially malicious archive imported by user %d' % self.creator_id)
+            self._fail(error=_('invalid archive'))
+            return
+
+        except Exception:
+            # Likely transient, e.g. a lost database connection. The import is left running along with its archive so
+            # resume_imports retries it from its processed posts once stalled.
+            logger.exception('Import %d stopped at post %d' % (self.pk, self.processed_posts))
+            raise
+
+        with transaction.atomic():
+            self.status = self.STATUS_COMPLETED
+            self.save()
+            self.upload.delete()
+
+    def save(self, *args, **kwargs):
+        now = timezone.now()
+        if not self.id:
+            self.created = now
+        self.updated = now
+        return super(Import, self).save(*args, **kwargs)
+
+    def _import_posts_batch(self, parser, posts, offset, existing_posts_keys):
+        """
+        Saves a batch of posts along with the progress, returns False when the progress moved on in between
+        """
+        batch = posts[offset:offset + settings.IMPORT_BATCH_SIZE]
+        stored_images_names = []
+
+        try:
+            with transaction.atomic():
+                return self._import_posts_batch_in_transaction(parser=parser, batch=batch, offset=offset,
+                                                               existing_posts_keys=existing_posts_keys,
+                                                               stored_images_names=stored_images_names)
+        except Exception:
+            # The rollback took the tombstones of the images stored for the batch along
+            PostImage = get_post_image_model()
+            bury_media_keys(field=PostImage._meta.get_field('image'), keys=stored_images_names)
+            raise
+
+    def _import_posts_batch_in_transaction(self, parser, batch, offset, existing_posts_keys, stored_images_names):
+        processed_posts = Import.objects.select_for_update().values_list('processed_posts', flat=True).get(
+            pk=self.pk)
+
+        if processed_posts != offset:
+            return False
+
+        posts_data = []
+
+        for post in batch:
+            post_data = self._parse_post(post=post)
+            post_key = self._make_post_key(created=post_data['created'], text=post_data['text'])
+
+            if (not post_data['text'] and not post_data['media']) or post_key in existing_posts_keys:
+                continue
+
+            existing_posts_keys.add(post_key)
+            posts_data.append(post_data)
+
+        # Checked and downsized in parallel, in the order of the posts
+        media_files = parser.prepare_media(media=[post_data['media'] for post_data in posts_data
+                                                  if post_data['media']],
+                                           max_workers=settings.IMPORT_MEDIA_MAX_WORKERS,
+                                           max_dimension=settings.IMPORT_IMAGE_MAX_DIMENSION)
+
+        try:
+            for post_data in posts_data:
+                media = post_data.pop('media')
+                post_data['image'] = ImageFile(next(media_files), name=path.basename(media.name)) \
+                    if media else None
+
+            self.creator.bulk_create_public_posts(posts_data=posts_data, stored_images_names=stored_images_names)
+        finally:
+            media_files.close()
+
+            for post_data in posts_data:
+                if post_data.get('image'):
+                    post_data['image'].close()
+
+        self.processed_posts = offset + len(batch)
+        self.imported_posts += len(posts_data)
+        self.save()
+
+        return True
+
+    def _get_existing_posts_keys(self, posts):
+        """
+        The keys of the posts of the creator within the dates of the archive, fetched at once to skip the posts
+        imported already
+        """
+        if not posts:
+            return set()
+
+        posts_created = [self._get_post_created(post=post) for post in posts]
+
+        existing_posts = self.creator.posts.filter(created__range=(min(posts_created), max(posts_created))) \
+            .values_list('created', 'text')
+
+        return {self._make_post_key(created=created, text=text) for created, text in existing_posts}
+
+    def _make_post_key(self, created, text):
+        return created, sha256(text.encode('utf-8')).hexdigest() if text else None
+
+    def _parse_post(self, post):
+        media = None
+        images = None
+        text = None
+
+        if 'attachments' in post.keys():
+            images = self._get_media_content(post)
+
+        if 'data' in post.keys() and len(post['data']) != 0:
+            text = post['data'][0].get('post')
+
+        if images:
+            image = images[0]
+
+            if 'text' in image.keys():
+                text = image['text']
+
+            media = image['file']
+
+        return {
+            'text': text,
+            'media': media,
+            'created': self._get_post_created(post=post),
+        }
+
+    def _get_post_created(self, post):
+        created = datetime.fromtimestamp(post['timestamp'])
+        return parse_datetime(created.strftime('%Y-%m-%d %T+00:00'))
+
+    def _get_media_content(self, post):
+
+        images = []
+        image = {}
+
+        for attachment in post['attachments']:
+            for data in attachment['data']:
+                if 'media' not in data.keys():
+                    continue
+
+                image['file'] = data['media']['uri']
+
+                if 'description' in data['media'].keys():
+                    image['text'] = data['media']['description']
+
+                images.append(image)
+                image = {}
+
+        return images
+
+    def _fail(self, error):
+        with transaction.atomic():
+            self.status = self.STATUS_FAILED
+            self.error = error
+            self.save()
+
+            if self.upload:
+                self.upload.delete()
@@ -1,7 +1,40 @@
+from zipfile import is_zipfile
+
+from django.utils.translation import ugettext_lazy as _
 from rest_framework import serializers
 
+from openbook_importer.models import Import
+
 
 class ZipfileSerializer(serializers.Serializer):
 
-    serializers.FileField(max_length=20, required=True,
-                          allow_empty_file=False)
+    file = serializers.FileField(required=False, allow_empty_file=False)
+    upload_uuid = serializers.UUIDField(required=False)
+
+    def validate_file(self, file):
+        if not is_zipfile(file):
+            raise serializers.ValidationError(_('invalid archive'))
+        return file
+
+    def validate(self, data):
+        if bool(data.get('file')) == bool(data.get('upload_uuid')):
+            raise serializers.ValidationError(_('An archive must either be sent or uploaded beforehand.'))
+        return data
+
+
+class GetImportSerializer(serializers.Serializer):
+    import_uuid = serializers.UUIDField()
+
+
+class GetImportsImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Import
+        fields = (
+            'uuid',
+            'status',
+            'total_posts',
+            'processed_posts',
+            'imported_posts',
+            'error',
+            'created',
+        )
@@ -1,292 +1,333 @@
 #!/usr/bin/env python3
 
-from json import loads
+from json import load
 from yaml import safe_load
 from hashlib import sha3_256
 from zipfile import PyZipFile
-from os import access, R_OK, path
-from tempfile import TemporaryDirectory
+from os import access, R_OK, path, remove
+from shutil import copyfileobj
+from functools import lru_cache
+from tempfile import SpooledTemporaryFile, NamedTemporaryFile
+from concurrent.futures import ProcessPoolExecutor
 
 from magic import from_buffer
+from PIL import Image
 
+# Enough of a file for libmagic to tell its type
+MAGIC_BUFFER_SIZE = 2048
 
-class profile_import(object):
+# Media bigger than this are spooled to disk instead of memory when opened
+MEDIA_SPOOL_MAX_SIZE = 1024 * 1024
 
-    friends = False
-    albums = False
-    messages = False
-    posts = False
+MIMETYPES_PATH = path.join(path.dirname(path.abspath(__file__)),
+                           'mimetypes.yml')
 
-    def __init__(self, friends, albums, messages, posts):
+# Images downsized by prepare_media, other media are copied as they are
+RESIZABLE_IMAGES_FORMATS = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG'}
 
-        self.friends = friends
-        self.albums = albums
-        self.messages = messages
-        self.posts = posts
+# The archive opened once by each process of the prepare_media pool
+_worker_zipf = None
 
 
-class zip_parser():
+@lru_cache(maxsize=None)
+def get_mimetypes():
 
-    profile = False
+    if not access(MIMETYPES_PATH, R_OK):
+        raise FileNotFoundError(f"{MIMETYPES_PATH} not found")
 
-    def __init__(self, filename):
+    with open(MIMETYPES_PATH, 'r') as fd:
+        types = safe_load(fd)
 
-        zipf = PyZipFile(filename)
-        # test this with corrupt zipfile
-        zipf.testzip()
-        size = self._get_extracted_zipsize(zipf)
+    if 'mimetypes' not in types:
+        raise LookupError('file format incorrect, mimetypes key not found')
 
-        # if size > 1gb
-        if size > 1000000000:
-            raise BufferError('filesize exceeds 1GB')
+    return types['mimetypes']
 
-        friends = self._extract_friends(zipf)
-        albums = self._extract_albums(zipf)
-        messages = self._extract_messages(zipf)
-        posts = self._extract_posts(zipf)
 
-        self.profile = profile_import(friends, albums, messages, posts)
+def check_file_magic(zipf, name):
 
-    def _file_access(self, filename):
+    # A lookup in the index of the archive, namelist() would list every member on each call
+    try:
+        zipf.getinfo(name)
+    except KeyError:
+        raise FileNotFoundError(f"{name} not found in zip file")
 
-        if not access(filename, R_OK):
-            raise FileNotFoundError(f"{filename} not found")
+    if name.find('.') != -1:
+        extension = name.split('.')[-1]
+        mimetypes = get_mimetypes()
 
-        return True
+        if extension not in mimetypes:
+            raise KeyError(f'extension not found, unknown filetype for '
+                           f'{extension}')
 
-    def _return_mime_magic(self, extension):
+        mime = mimetypes[extension]
 
-        mpath = 'openbook_importer/socialmedia_archive_parser'
+    else:
+        raise TypeError(f"{name} filenames without extension not "
+                        "allowed")
 
-        if not self._file_access(f"{mpath}/mimetypes.yml"):
-            return False
+    with zipf.open(name) as member:
+        head = member.read(MAGIC_BUFFER_SIZE)
 
-        types = safe_load(open(f"{mpath}/mimetypes.yml", 'r'))
+    if from_buffer(head, mime=True) not in mime:
+        raise TypeError(f"{name}'s extension does not "
+                        f"match mime-type {mime}")
 
-        if 'mimetypes' not in types:
-            raise LookupError('file format incorrect, mimetypes key not found')
 
-        types = types['mimetypes']
+def prepare_media_file(zipf, name, max_dimension=None):
+    """
+    Checks the magic of the media and copies it to a temporary file,
+    downsizing images bigger than max_dimension, returns the file path
+    """
 
-        if extension not in types:
-            raise KeyError(f'extension not found, unknown filetype for '
-                           f'{extension}')
+    check_file_magic(zipf, name)
 
-        return types[extension]
+    extension = name.split('.')[-1].lower()
+    image_format = RESIZABLE_IMAGES_FORMATS.get(extension)
 
-    def _check_file_magic(self, zipf, name):
+    with NamedTemporaryFile(suffix=f'.{extension}', delete=False) as fd:
+        with zipf.open(name) as member:
+            copyfileobj(member, fd)
 
-        if name.find('.') != -1:
-            extension = name.split('.')[-1]
-            mime = self._return_mime_magic(extension)
+    if max_dimension and image_format:
+        with Image.open(fd.name) as image:
+            if max(image.size) > max_dimension:
+                image.thumbnail((max_dimension, max_dimension))
+                image.save(fd.name, format=image_format)
 
-        else:
-            raise TypeError(f"{name} filenames without extension not "
-                            "allowed")
+    return fd.name
 
-        if from_buffer(zipf.read(name), mime=True) not in mime:
-            raise TypeError(f"{name}'s extension does not "
-                            f"match mime-type {mime}")
 
-    def _read_file_from_zip(self, zipf, name):
+def _init_media_worker(filename):
 
-        if name in zipf.namelist():
-            self._check_file_magic(zipf, name)
-            return zipf.read(name)
+    global _worker_zipf
+    _worker_zipf = PyZipFile(filename)
 
-        else:
-            raise FileNotFoundError(f"{name} not found in zip file")
 
-    def _get_extracted_zipsize(self, zipf):
+def _prepare_media_in_worker(name, max_dimension):
 
-        size = 0
+    return prepare_media_file(_worker_zipf, name, max_dimension)
 
-        for entry in zipf.filelist:
-            size += entry.file_size
 
-        return size
+class archive_media(object):
+    """
+    A photo or video of the archive, only read from the zip once opened
+    """
 
-    def _get_files_from_directory(self, dir_name, zipf, directory=False,
-                                  filename=False):
+    def __init__(self, parser, name):
 
-        files = set()
-        for entry in zipf.filelist:
+        self.parser = parser
+        self.name = name
 
-            if not filename:
-                if not directory and not entry.is_dir():
-                    name = entry.filename
+    def open(self):
+        """
+        Returns the media as a file, spooled to disk past
+        MEDIA_SPOOL_MAX_SIZE so memory stays bounded
+        """
 
-                elif directory and entry.is_dir():
-                    name = entry.filename
+        self.parser._check_file_magic(self.name)
 
-                else:
-                    name = entry.filename
+        fd = SpooledTemporaryFile(max_size=MEDIA_SPOOL_MAX_SIZE)
 
-                if name[0:len(dir_name)+1] == f"{dir_name}/":
-                    if name != f"{dir_name}/":
-                        files.add(name)
+        with self.parser.zipf.open(self.name) as member:
+            copyfileobj(member, fd)
 
-            else:
-                if filename in entry.filename and not entry.is_dir():
-                    name = entry.filename
-                    files.add(name)
+        fd.seek(0)
+
+        return fd
 
-        return files
 
-    def _write_file_to_dir(self, dir_name, item, zipf):
+class zip_parser():
+    """
+    Reads a facebook archive lazily, every section is a generator which
+    only reads the members of the zip it needs as it is iterated
+    """
 
-        i_path = path.join(dir_name, item.split('/')[-1])
+    def __init__(self, filename):
 
-        with open(i_path, 'wb+') as fd:
-            fd.write(zipf.read(item))
+        self.filename = filename
+        self.zipf = PyZipFile(filename)
+        size = self._get_extracted_zipsize()
 
-    def _get_fd_from_file(self, dir_name, itype, item, zipf, mode='r'):
+        # if size > 1gb
+        if size > 1000000000:
+            raise BufferError('filesize exceeds 1GB')
 
-        self._write_file_to_dir(dir_name, item, zipf)
+    def __enter__(self):
 
-        name = item.split('/')[-1]
-        fd = open(path.join(dir_name, name), mode)
+        return self
 
-        return((name, fd))
+    def __exit__(self, *args):
 
-    def _parse_album_json(self, album_json, zipf):
+        self.close()
 
-        photo_attrs = ['uri', 'creation_timestamp', 'comments', 'description']
+    def close(self):
+
+        self.zipf.close()
 
-        json = loads(self._read_file_from_zip(zipf, album_json))
+    def prepare_media(self, media, max_workers=1, max_dimension=None):
+        """
+        Yields the given archive_media in order as files checked and with
+        images downsized to max_dimension, prepared by a pool of max_workers
+        processes when the archive was given as a path
+        """
 
-        album_name = json['name']
-        album = {}
-        album[album_name] = {'photos': []}
-        photos = {}
+        names = [m.name for m in media]
 
-        for photo in json['photos']:
-            for attr in photo_attrs:
-                if attr in photo.keys():
-                    photos[attr] = photo[attr]
+        if max_workers <= 1 or len(names) <= 1 or \
+                not isinstance(self.filename, str):
+            for name in names:
+                yield self._open_prepared_file(
+                    prepare_media_file(self.zipf, name, max_dimension))
+            return
 
-            album[album_name]['photos'].append(photos)
-            photos = {}
+        executor = ProcessPoolExecutor(max_workers=min(max_workers,
+                                                       len(names)),
+                                       initializer=_init_media_worker,
+                                       initargs=(self.filename,))
+        futures = [executor.submit(_prepare_media_in_worker, name,
+                                   max_dimension) for name in names]
 
-        return album
+        yielded_count = 0
 
-    def _extract_albums(self, zipf):
+        try:
+            for future in futures:
+                prepared_path = future.result()
+                yielded_count += 1
+                yield self._open_prepared_file(prepared_path)
 
-        album_defs = self._get_files_from_directory('photos_and_videos/album',
-                                                    zipf)
-        albums = []
+        finally:
+            for future in futures:
+                future.cancel()
 
-        for album in album_defs:
-            albums.append(self._parse_album_json(album, zipf))
+            executor.shutdown()
 
-        temp = TemporaryDirectory(dir='media')
+            # Drop the files prepared for a caller which stopped early
+            for future in futures[yielded_count:]:
+                if not future.cancelled() and not future.exception():
+                    self._remove_prepared_file(future.result())
 
-        for album in albums:
-            for value in album.values():
-                for file in (value['photos']):
-                    file['uri'] = self._get_fd_from_file(temp.name,
-                                                         'photos_and_videos',
-                                                         file['uri'], zipf,
-                                                         mode='rb')
+    def posts(self):
 
-        return albums
+        json = self._read_json_from_zip('posts/your_posts.json')
 
-    def _extract_friends(self, zipf):
+        if 'status_updates' not in json.keys():
+            raise KeyError('key status_updates not found in json')
+
+        for post in json['status_updates']:
+            self._wrap_attachments(post)
+            yield post
 
-        json = loads(self._read_file_from_zip(zipf, 'friends/friends.json'))
-        friends = json['friends']
+    def friends(self):
+
+        json = self._read_json_from_zip('friends/friends.json')
 
         profile_info = 'profile_information/profile_information.json'
-        profile_info = loads(self._read_file_from_zip(zipf, profile_info)
-                             )['profile']
+        profile_info = self._read_json_from_zip(profile_info)['profile']
         full_name = profile_info['name']['full_name']
 
-        sort_string = []
-        friends_hash = []
-
-        for friend in friends:
-            sort_string.append(friend['name'])
-            sort_string.append(full_name)
-            sort_string.sort()
+        for friend in json['friends']:
+            sort_string = sorted([friend['name'], full_name])
 
             friend_string = (f"{':'.join(sort_string)}:{friend['timestamp']}"
                              .encode('utf-8'))
 
-            friends_hash.append(sha3_256(friend_string).hexdigest())
-            sort_string = []
+            yield sha3_256(friend_string).hexdigest()
+
+    def albums(self):
+
+        photo_attrs = ['uri', 'creation_timestamp', 'comments', 'description']
+
+        for album_json in self._get_files_from_directory(
+                'photos_and_videos/album'):
+            json = self._read_json_from_zip(album_json)
+
+            photos = []
+
+            for photo in json['photos']:
+                photos.append({attr: photo[attr] for attr in photo_attrs
+                               if attr in photo.keys()})
+
+            for photo in photos:
+                photo['uri'] = archive_media(self, photo['uri'])
 
-        return(friends_hash)
+            yield {json['name']: {'photos': photos}}
 
-    def _parse_message(self, zipf, message):
+    def messages(self):
 
-        json = loads(self._read_file_from_zip(zipf, message))
+        for message in self._get_files_from_directory(
+                'messages', filename='message.json'):
+            json = self._read_json_from_zip(message)
 
-        temp = TemporaryDirectory(dir='media')
+            if 'messages' not in json.keys():
+                raise KeyError('key messages not found in json')
 
-        if 'messages' in json.keys():
             for m in json['messages']:
+                for p in m.get('photos', []):
+                    p['uri'] = archive_media(self, p['uri'])
 
-                if 'photos' in m.keys():
-                    for p in m['photos']:
-                        p['uri'] = self._get_fd_from_file(temp.name,
-                                                          'messages',
-                                                          p['uri'], zipf)
-        else:
-            raise KeyError('key messages not found in json')
+            yield json
 
-        return json
+    def _wrap_attachments(self, post):
 
-    def _extract_messages(self, zipf):
+        for attachment in post.get('attachments', []):
+            for item in attachment.get('data', []):
+                if 'media' in item.keys():
+                    media = item['media']
+                    media['uri'] = archive_media(self, media['uri'])
 
-        message_json = self._get_files_from_directory('messages', zipf,
-                                                      filename='message.json')
-        messages = []
-        for message in message_json:
-            messages.append(self._parse_message(zipf, message))
+                    if 'media_metadata' in media:
+                        media.pop('media_metadata')
 
-        return messages
+    def _check_file_magic(self, name):
 
-    def _has_attachment(self, zipf, post):
+        check_file_magic(self.zipf, name)
 
-        temp = TemporaryDirectory(dir='media')
+    def _open_prepared_file(self, prepared_path):
 
-        if 'attachments' in post.keys():
-            for attachment in post['attachments']:
-                if 'data' in attachment.keys():
-                    for item in attachment['data']:
-                        if 'media' in item.keys():
-                            media = item['media']
-                            uri = self._get_fd_from_file(temp.name,
-                                                         media['uri'].
-                                                         split('/')[0],
-                                                         media['uri'], zipf,
-                                                         mode='rb')
-                            media['uri'] = uri
+        fd = open(prepared_path, 'rb')
+        # Removed as soon as it is closed
+        remove(prepared_path)
 
-                            if 'media_metadata' in media:
-                                media.pop('media_metadata')
+        return fd
 
-                            return post
+    def _remove_prepared_file(self, prepared_path):
 
-                        else:
-                            return False
+        try:
+            remove(prepared_path)
+        except FileNotFoundError:
+            pass
 
-    def _extract_posts(self, zipf):
+    def _read_json_from_zip(self, name):
 
-        json = loads(self._read_file_from_zip(zipf, 'posts/your_posts.json'))
+        self._check_file_magic(name)
 
-        posts = []
+        with self.zipf.open(name) as member:
+            return load(member)
 
-        if 'status_updates' in json.keys():
-            for post in json['status_updates']:
-                media = self._has_attachment(zipf, post)
+    def _get_extracted_zipsize(self):
 
-                if media:
-                    post = media
+        size = 0
 
-                posts.append(post)
+        for entry in self.zipf.filelist:
+            size += entry.file_size
 
-        else:
-            raise KeyError('key status_updates not found in json')
+        return size
+
+    def _get_files_from_directory(self, dir_name, filename=False):
+
+        files = set()
+        for entry in self.zipf.filelist:
+
+            if not filename:
+                name = entry.filename
+
+                if name[0:len(dir_name)+1] == f"{dir_name}/":
+                    if name != f"{dir_name}/":
+                        files.add(name)
 
-        return posts
+            else:
+                if filename in entry.filename and not entry.is_dir():
+                    files.add(entry.filename)
+
+        return files
@@ -1,16 +1,32 @@
+import tempfile
+from io import BytesIO
+from unittest import mock
+from zipfile import ZipFile
+
+from django.core.files import File
+from django.core.files.images import get_image_dimensions
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from openbook_common.tests.helpers import make_user
+from openbook_common.models import MediaTombstone
 from openbook_common.tests.helpers import make_authentication_headers_for_user
+from openbook_uploads.models import Upload
+from openbook_importer.jobs import process_import
+from openbook_importer.models import Import
+from openbook_importer.socialmedia_archive_parser.fb_parser import zip_parser, archive_media
+from openbook_posts.models import Post, PostImage
 
 
+@override_settings(UPLOADS_DIRECTORY=tempfile.mkdtemp())
 class UploadFileTests(APITestCase):
 
     def test_upload_file_success(self):
         """
-        Upload valid archive imports 9 posts, return 200
+        Upload valid archive imports 9 posts, return 202
         """
 
         user = make_user()
@@ -21,7 +37,13 @@ class UploadFileTests(APITestCase):
             response = self.client.post(reverse('uploads'), {'file': fd},
                                         **headers)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        response_import = self.client.get(self._get_progress_url(response), **headers).json()
+
+        self.assertEqual(response_import['status'], Import.STATUS_COMPLETED)
+        self.assertEqual(response_import['total_posts'], 9)
+        self.assertEqual(response_import['imported_posts'], 9)
 
         number_of_posts = 9
 
@@ -30,7 +52,7 @@ class UploadFileTests(APITestCase):
 
     def test_upload_file_malicious(self):
         """
-        the file is malicious, should return 400
+        the file is malicious, the import should fail
         """
 
         user = make_user()
@@ -40,11 +62,16 @@ class UploadFileTests(APITestCase):
             response = self.client.post(reverse('uploads'), {'file': fd},
                                         **headers)
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        response = self.client.get(self._get_progress_url(response), **headers)
+
+        self.assertEqual(response.json()['status'], Import.STATUS_FAILED)
+        self.assertFalse(user.posts.exists())
 
     def test_upload_file_invalid(self):
         """
-        the file is invalid needs to return 400
+        the file is invalid, the import should fail
         """
 
         user = make_user()
@@ -54,7 +81,12 @@ class UploadFileTests(APITestCase):
             response = self.client.post(reverse('uploads'), {'file': fd},
                                         **headers)
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        response = self.client.get(self._get_progress_url(response), **headers)
+
+        self.assertEqual(response.json()['status'], Import.STATUS_FAILED)
+        self.assertFalse(user.posts.exists())
 
     def test_upload_file_duplicate(self):
         """
@@ -72,9 +104,246 @@ class UploadFileTests(APITestCase):
                                             **headers)
                 fd.seek(0)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        number_of_posts = 9
+
+        response = self.client.get(reverse('posts'), **headers)
+        self.assertEqual(len(response.json()), number_of_posts)
+
+    def test_upload_file_resumable_upload(self):
+        """
+        Importing a valid archive uploaded beforehand imports 9 posts, return 200
+        """
+
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        with open('openbook_importer/tests/facebook-jaybeenote5.zip',
+                  'rb') as fd:
+            archive = fd.read()
+
+        upload = user.create_upload(type=Upload.IMPORT_ARCHIVE,
+                                    filename='facebook.zip', size=len(archive))
+
+        with self.settings(UPLOADS_DIRECTORY=tempfile.mkdtemp()):
+            upload.append_chunk(offset=0, chunk_file=BytesIO(archive),
+                                chunk_size=len(archive))
+            upload.finalize()
+
+            response = self.client.post(reverse('uploads'),
+                                        {'upload_uuid': str(upload.uuid)},
+                                        **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
 
         number_of_posts = 9
 
         response = self.client.get(reverse('posts'), **headers)
         self.assertEqual(len(response.json()), number_of_posts)
+        self.assertFalse(Upload.objects.filter(pk=upload.pk).exists())
+
+    def test_upload_file_not_zip(self):
+        """
+        the file is not a zip archive, should return 400
+        """
+
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        response = self.client.post(reverse('uploads'),
+                                    {'file': BytesIO(b'not a zip')},
+                                    **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(user.imports.exists())
+
+    def test_cant_get_foreign_import_progress(self):
+        """
+        should not be able to get the progress of the import of another user
+        and return 404
+        """
+
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        foreign_import = Import.create_import(creator=make_user(), upload=None)
+
+        response = self.client.get(reverse('import-progress', kwargs={
+            'import_uuid': foreign_import.uuid
+        }), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def _get_progress_url(self, response):
+        return reverse('import-progress', kwargs={
+            'import_uuid': response.json()['uuid']
+        })
+
+
+@override_settings(UPLOADS_DIRECTORY=tempfile.mkdtemp())
+class ImportJobTests(TestCase):
+
+    def test_resumes_from_processed_posts(self):
+        """
+        a job re-run after a crash should only import the posts not
+        processed yet
+        """
+
+        user = make_user()
+        archive_import = self._make_import(user=user)
+
+        Import.objects.filter(pk=archive_import.pk).update(
+            status=Import.STATUS_RUNNING, total_posts=9, processed_posts=5)
+
+        with self.settings(IMPORT_BATCH_SIZE=2):
+            process_import(archive_import.pk)
+
+        archive_import.refresh_from_db()
+
+        self.assertEqual(archive_import.status, Import.STATUS_COMPLETED)
+        self.assertEqual(archive_import.processed_posts, 9)
+        self.assertEqual(archive_import.imported_posts, 4)
+        self.assertEqual(user.posts.count(), 4)
+
+    def test_completed_import_is_not_run_again(self):
+        """
+        a job re-run for a completed import should not import anything
+        """
+
+        user = make_user()
+        archive_import = self._make_import(user=user)
+
+        process_import(archive_import.pk)
+        process_import(archive_import.pk)
+
+        archive_import.refresh_from_db()
+
+        self.assertEqual(archive_import.imported_posts, 9)
+        self.assertEqual(user.posts.count(), 9)
+
+    def test_imports_posts_images(self):
+        """
+        the images of the archive should be stored along with their posts
+        """
+
+        user = make_user()
+        archive_import = self._make_import(user=user)
+
+        process_import(archive_import.pk)
+
+        posts_with_images = user.posts.filter(image__isnull=False)
+
+        self.assertTrue(posts_with_images.exists())
+
+        for post in posts_with_images:
+            self.assertTrue(post.image.image.storage.exists(post.image.image.name))
+            self.assertTrue(post.image.width and post.image.height)
+
+    def test_failed_batch_buries_its_images(self):
+        """
+        the images stored for a batch whose posts could not be inserted
+        should be buried rather than left in the storage, the import being
+        left running with its archive to be resumed
+        """
+
+        user = make_user()
+        archive_import = self._make_import(user=user)
+
+        with mock.patch.object(Post, '_insert_posts', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                process_import(archive_import.pk)
+
+        archive_import.refresh_from_db()
+
+        self.assertEqual(archive_import.status, Import.STATUS_RUNNING)
+        self.assertTrue(archive_import.upload)
+
+        tombstones_keys = MediaTombstone.objects.values_list('key', flat=True)
+
+        self.assertFalse(PostImage.objects.exists())
+        self.assertTrue(tombstones_keys)
+
+        for key in tombstones_keys:
+            self.assertTrue(PostImage._meta.get_field('image').storage.exists(key))
+
+    def _make_import(self, user):
+        with open('openbook_importer/tests/facebook-jaybeenote5.zip',
+                  'rb') as fd:
+            return user.create_import(archive=File(fd))
+
+
+class ZipParserTests(TestCase):
+
+    def test_reads_only_requested_sections(self):
+        """
+        iterating posts should not read the members of the other sections
+        """
+
+        with zip_parser('openbook_importer/tests/facebook-jaybeenote5.zip') as p:
+            with mock.patch.object(p.zipf, 'open', wraps=p.zipf.open) as zip_open:
+                posts = list(p.posts())
+
+        read_members = {call[0][0] for call in zip_open.call_args_list}
+
+        self.assertEqual(len(posts), 9)
+        self.assertEqual(read_members, {'posts/your_posts.json'})
+
+    def test_opens_attachments_lazily(self):
+        """
+        attachments should only be read from the zip once opened
+        """
+
+        with zip_parser('openbook_importer/tests/facebook-jaybeenote5.zip') as p:
+            media = [data['media']['uri'] for post in p.posts()
+                     for attachment in post.get('attachments', [])
+                     for data in attachment['data'] if 'media' in data]
+
+            self.assertTrue(media)
+
+            with media[0].open() as fd:
+                self.assertTrue(fd.read())
+
+    def test_prepares_media_in_parallel(self):
+        """
+        media prepared by a pool of processes should come in order and
+        downsized like the media prepared serially
+        """
+
+        with zip_parser('openbook_importer/tests/facebook-jaybeenote5.zip') as p:
+            media = [photo['uri'] for album in p.albums()
+                     for name, photos in album.items()
+                     for photo in photos['photos']]
+
+            serial_files = list(p.prepare_media(media=media, max_workers=1,
+                                                max_dimension=200))
+            parallel_files = list(p.prepare_media(media=media, max_workers=3,
+                                                  max_dimension=200))
+
+        self.assertTrue(len(media) > 1)
+        self.assertEqual(len(parallel_files), len(media))
+
+        for serial_file, parallel_file in zip(serial_files, parallel_files):
+            with serial_file, parallel_file:
+                self.assertEqual(serial_file.read(), parallel_file.read())
+                parallel_file.seek(0)
+
+                self.assertTrue(max(get_image_dimensions(parallel_file)) <= 200)
+
+    def test_prepared_media_magic_is_checked(self):
+        """
+        preparing a media not matching its extension should raise TypeError
+        """
+
+        archive = BytesIO()
+
+        with ZipFile(archive, 'w') as zipf:
+            zipf.writestr('photos_and_videos/photo.jpg', b'not a photo')
+
+        archive.seek(0)
+
+        with zip_parser(archive) as p:
+            media = [archive_media(p, 'photos_and_videos/photo.jpg')]
+
+            with self.assertRaises(TypeError):
+                list(p.prepare_media(media=media))
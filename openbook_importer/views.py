@@ -1,17 +1,11 @@
-from datetime import datetime
-from json import JSONDecodeError
-
+from django.db import transaction
 from rest_framework import status
-from openbook_posts.models import Post
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.core.files.images import ImageFile
-from django.utils.dateparse import parse_datetime
 from rest_framework.permissions import IsAuthenticated
-from django.utils.translation import ugettext_lazy as _
 
-from openbook_importer.serializers import ZipfileSerializer
-from openbook_importer.socialmedia_archive_parser.fb_parser import zip_parser
+from openbook_importer.jobs import process_import
+from openbook_importer.serializers import ZipfileSerializer, GetImportSerializer, GetImportsImportSerializer
 
 
 class ImportItem(APIView):
@@ -19,84 +13,40 @@ class ImportItem(APIView):
     permission_classes = (IsAuthenticated,)
 
     def post(self, request):
-        serializer = ZipfileSerializer(data=request.FILES)
+        """
+        Queues the import of the archive, its progress can then be followed with ImportProgress
+        """
+        serializer = ZipfileSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        zipfile = request.FILES['file']
-
-        try:
-            p = zip_parser(zipfile)
-
-        except FileNotFoundError:
-            return self._return_invalid()
-
-        except JSONDecodeError:
-            return self._return_invalid()
-
-        except TypeError:
-            return self._return_malicious()
-
-        if p.profile.posts:
-            self.save_posts(p.profile.posts, request.user)
-
-        return Response({
-            'message': _('done')
-        }, status=status.HTTP_200_OK)
+        data = serializer.validated_data
+        archive = data.get('file')
+        upload_uuid = data.get('upload_uuid')
 
-    def save_posts(self, posts, user):
+        user = request.user
 
-        for post in posts:
-            image = None
-            images = None
-            text = None
-            timestamp = post['timestamp']
-            created = datetime.fromtimestamp(timestamp)
-            created = parse_datetime(created.strftime('%Y-%m-%d %T+00:00'))
+        with transaction.atomic():
+            archive_import = user.create_import(archive=archive, upload_uuid=upload_uuid)
 
-            if 'attachments' in post.keys():
-                images = self._get_media_content(post)
+        process_import.delay(archive_import.pk)
 
-            if 'data' in post.keys() and len(post['data']) != 0:
-                text = post['data'][0]['post']
+        response_serializer = GetImportsImportSerializer(archive_import, context={"request": request})
 
-            if images:
-                image = images[0]
+        return Response(response_serializer.data, status=status.HTTP_202_ACCEPTED)
 
-                if 'text' in image.keys():
-                    text = image['text']
 
-                image = ImageFile(image['file'])
+class ImportProgress(APIView):
 
-            if not Post.objects.filter(creator=user.pk, text=text, created=created).exists():
-                user.create_public_post(text=text, image=image, created=created)
-
-    def _get_media_content(self, post):
-
-        images = []
-        image = {}
-
-        for attachment in post['attachments']:
-            for data in attachment['data']:
-                image['file'] = data['media']['uri'][1]
-
-                if 'description' in data['media'].keys():
-                    image['text'] = data['media']['description']
-
-                images.append(image)
-                image = {}
+    permission_classes = (IsAuthenticated,)
 
-        return images
+    def get(self, request, import_uuid):
+        serializer = GetImportSerializer(data={'import_uuid': import_uuid})
+        serializer.is_valid(raise_exception=True)
 
-    def _return_invalid(self):
+        user = request.user
 
-        return Response({
-            'message':_('invalid archive')
-        }, status=status.HTTP_400_BAD_REQUEST)
+        archive_import = user.get_import_with_uuid(import_uuid=import_uuid)
 
-    def _return_malicious(self):
-        # TODO LOG MALICIOUS ATTEMPT
-        print('---- POTENTIALLY MALICIOUS UPLOAD!!!')
+        response_serializer = GetImportsImportSerializer(archive_import, context={"request": request})
 
-        return Response({
-            'message':_('invalid archive')
-        }, status=status.HTTP_400_BAD_REQUEST)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
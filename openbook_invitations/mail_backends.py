@@ -0,0 +1,52 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.mail.backends.base import BaseEmailBackend
+
+
+class StandInEmailBackend(BaseEmailBackend):
+    """
+    Keeps the sent emails in memory like the locmem backend, waiting EMAIL_STAND_IN_LATENCY seconds per send
+    request as a remote API would, and counts the connections opened to check they are reused
+    """
+    outbox = []
+    opened_connections_count = 0
+    lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        super(StandInEmailBackend, self).__init__(*args, **kwargs)
+        self.is_open = False
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.outbox = []
+            cls.opened_connections_count = 0
+
+    def open(self):
+        if self.is_open:
+            return False
+
+        with self.lock:
+            StandInEmailBackend.opened_connections_count += 1
+
+        self.is_open = True
+        return True
+
+    def close(self):
+        self.is_open = False
+
+    def send_messages(self, email_messages):
+        is_new_connection = self.open()
+
+        try:
+            time.sleep(settings.EMAIL_STAND_IN_LATENCY)
+
+            with self.lock:
+                StandInEmailBackend.outbox.extend(email_messages)
+        finally:
+            if is_new_connection:
+                self.close()
+
+        return len(email_messages)
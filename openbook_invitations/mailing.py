@@ -0,0 +1,100 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.conf import settings
+from django.core.mail import get_connection
+
+from openbook_common.utils.model_loaders import get_user_invite_model
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Spaces out the calls to wait() of every thread so they stay under max_rate per second, e.g. the SES send rate
+    """
+
+    def __init__(self, max_rate):
+        self.interval = 1 / max_rate if max_rate else 0
+        self.next_call_time = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            call_time = max(self.next_call_time, now)
+            self.next_call_time = call_time + self.interval
+
+        time.sleep(max(0, call_time - now))
+
+
+def send_invites_emails(make_email, batch_size=None, max_workers=None, max_rate=None):
+    """
+    Sends the emails made by make_email(invite) to the invites not sent yet, a batch at a time by max_workers
+    threads which each keep their email backend connection open. The invites of a batch whose emails were sent are
+    marked sent with one update, so a run after a crash resumes from that batch and sends its emails which went out
+    before the crash again. Returns the sent and failed counts.
+    """
+    UserInvite = get_user_invite_model()
+
+    batch_size = batch_size or settings.INVITE_EMAILS_BATCH_SIZE
+    max_workers = max_workers or settings.INVITE_EMAILS_MAX_WORKERS
+    rate_limiter = RateLimiter(max_rate=settings.INVITE_EMAILS_MAX_RATE if max_rate is None else max_rate)
+
+    invites = UserInvite.objects.filter(is_invite_email_sent=False, email__isnull=False) \
+        .select_related('invited_by__profile').order_by('pk')
+
+    thread_data = threading.local()
+    connections = []
+    connections_lock = threading.Lock()
+
+    def get_thread_connection():
+        if not hasattr(thread_data, 'connection'):
+            thread_data.connection = get_connection()
+            thread_data.connection.open()
+            with connections_lock:
+                connections.append(thread_data.connection)
+        return thread_data.connection
+
+    def send_invite_email(invite):
+        try:
+            email = make_email(invite)
+            rate_limiter.wait()
+            return get_thread_connection().send_messages([email]) == 1
+        except Exception:
+            logger.exception('Could not send the email of invite %d' % invite.pk)
+            return False
+
+    sent_count = 0
+    failed_count = 0
+    last_invite_id = 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                # Paginated on the id so the invites marked sent along the way don't shift the batches
+                batch = list(invites.filter(pk__gt=last_invite_id)[:batch_size])
+
+                if not batch:
+                    break
+
+                last_invite_id = batch[-1].pk
+
+                futures = {executor.submit(send_invite_email, invite): invite for invite in batch}
+                sent_invites_ids = [futures[future].pk for future in as_completed(futures) if future.result()]
+
+                # Marked from this thread, the database connection isn't shared with the sending threads
+                UserInvite.objects.filter(pk__in=sent_invites_ids).update(is_invite_email_sent=True)
+
+                sent_count += len(sent_invites_ids)
+                failed_count += len(batch) - len(sent_invites_ids)
+    finally:
+        for connection in connections:
+            connection.close()
+
+    return sent_count, failed_count
@@ -1,8 +1,13 @@
-from django.core.management.base import BaseCommand
-from django.db import transaction, IntegrityError
+from datetime import datetime
 
-from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from django.db.models import F
+from django.utils import timezone
+
+from openbook_common.utils.model_loaders import get_user_model
+from openbook_common.utils.resource_versions import bump_users_resources_versions
 
 
 class Command(BaseCommand):
@@ -12,54 +17,81 @@ class Command(BaseCommand):
         parser.add_argument('--count', type=int, help='Count by which each users invites will be increased')
         parser.add_argument('--total', type=int, help='Total final amount to which each users invites will be set')
         parser.add_argument('--username', type=str, help='Username to allocate invites to')
+        parser.add_argument('--active', action='store_true', help='Only allocate invites to active users')
+        parser.add_argument('--joined-before', type=str, help='Only allocate invites to users who joined before '
+                                                              'this date, as YYYY-MM-DD')
+        parser.add_argument('--badge', type=str, help='Only allocate invites to users with the badge of this keyword')
+        parser.add_argument('--batch-size', type=int, help='The ids of users updated at once, in a transaction')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the users invites would be allocated to')
 
     def handle(self, *args, **options):
-        username = None
+        if options['count'] is None and options['total'] is None:
+            raise CommandError('Either --count or --total is required')
 
-        if options['username']:
-            username = str(options['username'])
+        users = self._get_users(options)
 
-        if options['count']:
-            count = int(options['count'])
-            self.handle_increase_count(count, username)
-        elif options['total']:
-            count = int(options['total'])
-            self.handle_set_total_count(count, username)
+        if options['username'] and not users.exists():
+            self.stderr.write('No user found with username %s' % options['username'])
+            return
 
-    def handle_increase_count(self, count, username):
-        User = get_user_model()
-        if username is not None:
-            users = User.objects.filter(username=username)
-            if not users.exists():
-                self.stderr.write('No user found with username %s' % username)
-                return
+        if options['dry_run']:
+            self.stdout.write('Would allocate invites to %d users' % users.count())
+            return
+
+        if options['count'] is not None:
+            invite_count = F('invite_count') + options['count']
         else:
-            users = User.objects.all()
+            invite_count = options['total']
 
-        try:
-            with transaction.atomic():
-                for user in users:
-                    user.invite_count = F('invite_count') + count
-                    user.save()
-        except IntegrityError as e:
-            print('IntegrityError %s ' % e)
-            self.stderr.write('Aborting allocation of invites..')
-
-    def handle_set_total_count(self, total_count, username):
+        updated_count = self._update_invite_count(users=users, invite_count=invite_count,
+                                                  batch_size=options['batch_size'] or
+                                                  settings.INVITES_ALLOCATION_BATCH_SIZE)
+
+        self.stdout.write(self.style.SUCCESS('Allocated invites to %d users' % updated_count))
+
+    def _get_users(self, options):
         User = get_user_model()
-        if username is not None:
-            users = User.objects.filter(username=username)
-            if not users.exists():
-                self.stderr.write('No user found with username %s' % username)
-                return
-        else:
-            users = User.objects.all()
+        users = User.objects.all()
+
+        if options['username']:
+            users = users.filter(username=options['username'])
+
+        if options['active']:
+            users = users.filter(is_active=True)
+
+        if options['joined_before']:
+            try:
+                joined_before = datetime.strptime(options['joined_before'], '%Y-%m-%d')
+            except ValueError:
+                raise CommandError('--joined-before must be YYYY-MM-DD')
+
+            users = users.filter(date_joined__lt=timezone.make_aware(joined_before))
+
+        if options['badge']:
+            users = users.filter(profile__badges__keyword=options['badge'])
+
+        return users
+
+    def _update_invite_count(self, users, invite_count, batch_size):
+        """
+        Updates the users a range of ids at a time, each range with one UPDATE in a transaction of its own so the
+        rows are never locked for long
+        """
+        ids = users.order_by('pk').values_list('pk', flat=True)
+        min_id = ids.first()
+        max_id = ids.last()
+
+        updated_count = 0
+
+        if min_id is None:
+            return updated_count
+
+        for start_id in range(min_id, max_id + 1, batch_size):
+            range_users = users.filter(pk__range=(start_id, start_id + batch_size - 1))
 
-        try:
             with transaction.atomic():
-                for user in users:
-                    user.invite_count = total_count
-                    user.save()
-        except IntegrityError as e:
-            print('IntegrityError %s ' % e)
-            self.stderr.write('Aborting allocation of invites..')
+                updated_count += range_users.update(invite_count=invite_count)
+                # The update doesn't send the signals invalidating the ETags of the users
+                bump_users_resources_versions(range_users.values('pk'))
+
+        return updated_count
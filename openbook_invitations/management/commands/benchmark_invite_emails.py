@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+
+from openbook_common.utils.model_loaders import get_user_invite_model
+from openbook_invitations.mail_backends import StandInEmailBackend
+from openbook_invitations.mailing import send_invites_emails
+
+
+class Command(BaseCommand):
+    help = 'Compares the throughput of sending invite emails one at a time and concurrently, with the stand-in ' \
+           'email backend taking --latency seconds per send. The invites are rolled back afterwards.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--invites', type=int, default=500, help='The number of invites to send')
+        parser.add_argument('--workers', type=int, default=8, help='The threads of the concurrent run')
+        parser.add_argument('--latency', type=float, default=0.05, help='The seconds each send takes')
+
+    def handle(self, *args, **options):
+        UserInvite = get_user_invite_model()
+        invites_count = options['invites']
+
+        with override_settings(EMAIL_BACKEND='openbook_invitations.mail_backends.StandInEmailBackend',
+                           EMAIL_STAND_IN_LATENCY=options['latency']):
+            for max_workers in (1, options['workers']):
+                with transaction.atomic():
+                    UserInvite.bulk_create_invites([
+                        UserInvite(name='Backer %d' % i, email='backer%d@example.com' % i) for i in
+                        range(invites_count)])
+
+                    StandInEmailBackend.reset()
+                    started = time.perf_counter()
+
+                    sent_count, failed_count = send_invites_emails(
+                        make_email=lambda invite: invite.make_invite_email(), max_workers=max_workers, max_rate=0)
+
+                    elapsed = time.perf_counter() - started
+
+                    transaction.set_rollback(True)
+
+                self.stdout.write('%d workers: %d emails in %.2fs, %.1f emails/s over %d connections' % (
+                    max_workers, sent_count, elapsed, sent_count / elapsed,
+                    StandInEmailBackend.opened_connections_count))
@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 
-from openbook_common.utils.model_loaders import get_user_invite_model, get_badge_model
+from openbook_common.utils.model_loaders import get_user_invite_model
+from openbook_invitations.parsers import get_badge_with_keyword
 
 import logging
 
@@ -27,8 +28,7 @@ class Command(BaseCommand):
         badge = None
 
         if badge_keyword:
-            Badge = get_badge_model()
-            badge = Badge.objects.get(keyword=badge_keyword)
+            badge = get_badge_with_keyword(badge_keyword)
 
         user_invite = UserInvite.create_invite(name=name, email=email, username=username,
                                                badge=badge)
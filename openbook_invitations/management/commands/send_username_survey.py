@@ -1,22 +1,21 @@
-from smtplib import SMTPException
-
 from django.core.management.base import BaseCommand
-from django.db import transaction
 
-from openbook_invitations.models import UserInvite
+from openbook_invitations.mailing import send_invites_emails
 
 
 class Command(BaseCommand):
     help = 'Sends alternate username survey emails for populated UserInvite models'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='The invites sent then marked sent at a time')
+        parser.add_argument('--workers', type=int, help='The emails sent concurrently')
+        parser.add_argument('--rate', type=float, help='The maximum emails sent per second')
+
     def handle(self, *args, **options):
-        user_invites = UserInvite.objects.filter(is_invite_email_sent=False)
+        sent_count, failed_count = send_invites_emails(
+            make_email=lambda invite: invite.make_alternate_username_survey_email(),
+            batch_size=options['batch_size'], max_workers=options['workers'], max_rate=options['rate'])
 
-        for user in user_invites:
-            if user.email is not None:
-                with transaction.atomic():
-                    try:
-                        user.send_alternate_username_survey_email()
-                    except SMTPException as e:
-                        self.stderr.write('Exception occurred during send_alternate_username_survey', e)
-        self.stdout.write(self.style.SUCCESS('Successfully sent username survey emails'))
+        if failed_count:
+            self.stderr.write('Exception occurred during send_alternate_username_survey for %d invites' % failed_count)
+        self.stdout.write(self.style.SUCCESS('Successfully sent %d username survey emails' % sent_count))
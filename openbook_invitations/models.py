@@ -1,18 +1,32 @@
+import secrets
+from functools import lru_cache
+
 from django.contrib.auth.validators import UnicodeUsernameValidator, ASCIIUsernameValidator
 from django.core.mail import EmailMultiAlternatives
 from django.db import models
 from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils import timezone
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.utils import six
 from django.utils.translation import ugettext_lazy as _
 import jwt
 from openbook.settings import USERNAME_MAX_LENGTH, PROFILE_NAME_MAX_LENGTH
 from openbook_common.models import Badge
 from openbook_common.utils.model_loaders import get_user_invite_model
+from openbook_common.utils.taken_names import add_taken_usernames, release_taken_username
 from rest_framework.exceptions import ValidationError
 
 
+@lru_cache(maxsize=None)
+def get_email_template(template_name):
+    """
+    The compiled template, loaded once rather than for every email
+    """
+    return get_template(template_name)
+
+
 class UserInvite(models.Model):
     invited_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='invited_users',
                                    null=True, blank=True)
@@ -57,12 +71,29 @@ class UserInvite(models.Model):
     @classmethod
     def create_invite(cls, email=None, name=None, username=None, badge=None, nickname=None, invited_by=None):
         UserInvite = get_user_invite_model()
-        invite = UserInvite.objects.create(nickname=nickname, name=name, email=email, username=username, badge=badge,
-                                           invited_by=invited_by)
+        invite = UserInvite(nickname=nickname, name=name, email=email, username=username, badge=badge,
+                            invited_by=invited_by)
         invite.token = invite.generate_token()
         invite.save()
         return invite
 
+    @classmethod
+    def bulk_create_invites(cls, invites):
+        """
+        Inserts the given unsaved invites at once, their token and created are set here as save() is not called
+        """
+        now = timezone.now()
+
+        for invite in invites:
+            invite.created = now
+            invite.token = invite.generate_token()
+
+        created_invites = UserInvite.objects.bulk_create(invites)
+        # bulk_create doesn't send the signals adding the usernames to the taken names index
+        add_taken_usernames([invite.username for invite in invites])
+
+        return created_invites
+
     @classmethod
     def get_invite_for_token(cls, token):
         cls._check_token_is_valid(token=token)
@@ -92,59 +123,77 @@ class UserInvite(models.Model):
         return super(UserInvite, self).save(*args, **kwargs)
 
     def send_invite_email(self):
+        self.make_invite_email().send()
+        self.is_invite_email_sent = True
+        self.save()
+
+    def make_invite_email(self):
+        mail_subject = _('You\'ve been invited to join Openbook')
+
         if self.invited_by:
-            mail_subject = _('You\'ve been invited to join Openbook')
-            text_message_content = render_to_string('openbook_invitations/email/user_invite.txt', {
+            template_name = 'openbook_invitations/email/user_invite'
+            context = {
                 'name': self.name,
                 'invited_by_name': self.invited_by.profile.name,
                 'invite_link': self._generate_one_time_link()
-            })
-            html_message_content = render_to_string('openbook_invitations/email/user_invite.html', {
-                'name': self.name,
-                'invited_by_name': self.invited_by.profile.name,
-                'invite_link': self._generate_one_time_link()
-            })
+            }
         else:
-            mail_subject = _('You\'ve been invited to join Openbook')
-            text_message_content = render_to_string('openbook_invitations/email/backer_onboard.txt', {
-                'name': self.name,
-                'invite_link': self._generate_one_time_link()
-            })
-            html_message_content = render_to_string('openbook_invitations/email/backer_onboard.html', {
+            template_name = 'openbook_invitations/email/backer_onboard'
+            context = {
                 'name': self.name,
                 'invite_link': self._generate_one_time_link()
-            })
-        email = EmailMultiAlternatives(mail_subject, text_message_content, to=[self.email],
-                                       from_email=settings.SERVICE_EMAIL_ADDRESS)
-        email.attach_alternative(html_message_content, 'text/html')
-        email.send()
+            }
+
+        return self._make_email(mail_subject=mail_subject, template_name=template_name, context=context)
+
+    def send_alternate_username_survey_email(self):
+        self.make_alternate_username_survey_email().send()
         self.is_invite_email_sent = True
         self.save()
 
-    def send_alternate_username_survey_email(self):
+    def make_alternate_username_survey_email(self):
         # Hack: Since username is unique, we populate name field with username during
         # parsing of this csv so we can import all records.
         # This is a one time operation before launch.
         mail_subject = _('Action Required: Choose an alternate username for Openbook')
-        text_message_content = render_to_string('openbook_invitations/email/backer_alternate_username.txt', {
-            'username': self.name,
-            'invite_link': 'https://openbook.typeform.com/to/MSbtq9'
-        })
-        html_message_content = render_to_string('openbook_invitations/email/backer_alternate_username.html', {
+        context = {
             'username': self.name,
+            'invite_link': 'https://openbook.typeform.com/to/MSbtq9',
             'typeform_link': 'https://openbook.typeform.com/to/MSbtq9'
-        })
+        }
+
+        return self._make_email(mail_subject=mail_subject,
+                                template_name='openbook_invitations/email/backer_alternate_username', context=context)
+
+    def _make_email(self, mail_subject, template_name, context):
+        text_message_content = get_email_template('%s.txt' % template_name).render(context)
+        html_message_content = get_email_template('%s.html' % template_name).render(context)
         email = EmailMultiAlternatives(mail_subject, text_message_content, to=[self.email],
                                        from_email=settings.SERVICE_EMAIL_ADDRESS)
         email.attach_alternative(html_message_content, 'text/html')
-        email.send()
-        self.is_invite_email_sent = True
-        self.save()
+        return email
 
     def generate_token(self):
-        token_bytes = jwt.encode({'id': self.id}, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+        # Made of a random nonce rather than the id so the invite gets its token before being inserted
+        token_bytes = jwt.encode({'nonce': secrets.token_urlsafe(16)}, settings.SECRET_KEY,
+                                 algorithm=settings.JWT_ALGORITHM)
         return token_bytes.decode('UTF-8')
 
     def _generate_one_time_link(self):
         return '{0}/api/auth/invite?token={1}'.format(settings.EMAIL_HOST, self.token)
 
+
+@receiver(post_save, sender=UserInvite, dispatch_uid='add_user_invite_taken_username')
+def add_user_invite_taken_username(sender, instance=None, **kwargs):
+    """"
+    Add the username of the invite to the taken usernames index
+    """
+    add_taken_usernames([instance.username])
+
+
+@receiver(post_delete, sender=UserInvite, dispatch_uid='release_user_invite_taken_username')
+def release_user_invite_taken_username(sender, instance=None, **kwargs):
+    """"
+    Release the username of the deleted invite from the taken usernames index
+    """
+    release_taken_username(instance.username)
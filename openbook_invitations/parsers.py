@@ -1,8 +1,13 @@
 import csv
 import re
 import secrets
+
+from django.conf import settings
+
 from openbook_common.models import Badge
 from openbook_common.utils.model_loaders import get_user_invite_model, get_user_model
+from openbook_common.utils.reference_cache import badges_reference_cache
+from openbook_common.utils.taken_names import release_taken_username
 
 
 def parse_kickstarter_csv(filepath):
@@ -11,21 +16,20 @@ def parse_kickstarter_csv(filepath):
             backer_data_reader = csv.reader(csvfile, delimiter=',')
             header_row = next(backer_data_reader)
             name_col, email_col, username_col, badge_keyword_col, email_kick_col = get_column_numbers_for_kickstarter(header_row)
-            for row in backer_data_reader:
-                name = row[name_col]
-                email = row[email_col]
-                if email is None or email is '':
-                    email = row[email_kick_col]
-                username = sanitise_username(row[username_col])
-                if username is None or username is '':
-                    print('Username was empty for:', name)
-                    username = get_temporary_username(email)
-                    print('Using generated random username @', username)
-                badge_keyword = row[badge_keyword_col]
-                badge = Badge.objects.get(keyword=badge_keyword)
-                UserInvite = get_user_invite_model()
-                UserInvite.create_invite(name=name, email=email, username=username,
-                                         badge=badge)
+
+            def get_invites_data():
+                for row in backer_data_reader:
+                    email = row[email_col]
+                    if email is None or email == '':
+                        email = row[email_kick_col]
+                    yield {
+                        'name': row[name_col],
+                        'email': email,
+                        'username': sanitise_username(row[username_col]),
+                        'badge': get_badge_with_keyword(row[badge_keyword_col]),
+                    }
+
+            bulk_create_invites(get_invites_data())
     except IOError as e:
         print('Unable to read file')
         raise e
@@ -37,29 +41,69 @@ def parse_indiegogo_csv(filepath):
             backer_data_reader = csv.reader(csvfile, delimiter=',')
             header_row = next(backer_data_reader)
             name_col, email_col, username_col, badge_keyword_col = get_column_numbers_for_indiegogo(header_row)
-            for row in backer_data_reader:
-                name = row[name_col]
-                email = row[email_col]
-                username = sanitise_username(row[username_col])
-                badge_keyword = row[badge_keyword_col]
-                if badge_keyword:
-                    badge = Badge.objects.get(keyword=badge_keyword)
-                else:
-                    badge = None
-                UserInvite = get_user_invite_model()
 
-                if username is None or username == '0' or username is '':
-                    print('Username was empty for:', name)
-                    username = get_temporary_username(email)
-                    print('Using generated random username @', username)
-                invited_user = UserInvite.create_invite(name=name, email=email, username=username,
-                                                        badge=badge)
-                invited_user.save()
+            def get_invites_data():
+                for row in backer_data_reader:
+                    badge_keyword = row[badge_keyword_col]
+                    yield {
+                        'name': row[name_col],
+                        'email': row[email_col],
+                        'username': sanitise_username(row[username_col]),
+                        'badge': get_badge_with_keyword(badge_keyword) if badge_keyword else None,
+                    }
+
+            bulk_create_invites(get_invites_data())
     except IOError as e:
         print('Unable to read file')
         raise e
 
 
+def bulk_create_invites(invites_data):
+    """
+    Creates the invites of the given name, email, username and badge dicts a batch at a time, so the rows of a csv
+    can be streamed in. Empty usernames are replaced by temporary ones free among the usernames fetched at once.
+    """
+    UserInvite = get_user_invite_model()
+    taken_usernames = get_taken_usernames()
+    invites = []
+    created_count = 0
+
+    for invite_data in invites_data:
+        name = invite_data['name']
+        email = invite_data['email']
+        username = invite_data['username']
+
+        if username is None or username == '0' or username == '':
+            print('Username was empty for:', name)
+            username = get_temporary_username(email, taken_usernames=taken_usernames)
+            print('Using generated random username @', username)
+
+        taken_usernames.add(username)
+        invites.append(UserInvite(name=name, email=email, username=username, badge=invite_data['badge']))
+
+        if len(invites) == settings.INVITES_BULK_CREATE_BATCH_SIZE:
+            UserInvite.bulk_create_invites(invites)
+            created_count += len(invites)
+            invites = []
+
+    if invites:
+        UserInvite.bulk_create_invites(invites)
+        created_count += len(invites)
+
+    return created_count
+
+
+def get_taken_usernames():
+    """
+    The usernames of the users and of the invites, which are unique whether used or not, in one query
+    """
+    User = get_user_model()
+    UserInvite = get_user_invite_model()
+    users_usernames = User.objects.values_list('username', flat=True)
+    invites_usernames = UserInvite.objects.filter(username__isnull=False).values_list('username', flat=True)
+    return set(users_usernames.union(invites_usernames))
+
+
 def parse_indiegogo_csv_and_sanitise_usernames(filepath):
     try:
         with open(filepath, newline='') as csvfile:
@@ -72,7 +116,7 @@ def parse_indiegogo_csv_and_sanitise_usernames(filepath):
                 username = sanitise_username(row[username_col])
                 badge_keyword = row[badge_keyword_col]
                 if badge_keyword:
-                    badge = Badge.objects.get(keyword=badge_keyword)
+                    badge = get_badge_with_keyword(badge_keyword)
                 else:
                     badge = None
                 UserInvite = get_user_invite_model()
@@ -96,6 +140,8 @@ def update_invite(email, name=None, username=None, badge=None):
             invite = invites.last()
     else:
         invite = invites.first()
+    if invite.username != username:
+        release_taken_username(invite.username)
     invite.username = username
     invite.save()
     print('New username is: ', invite.username)
@@ -126,6 +172,13 @@ def parse_conflicts_csv(filepath):
         raise e
 
 
+def get_badge_with_keyword(badge_keyword):
+    badge = badges_reference_cache.get(keyword=badge_keyword)
+    if badge is None:
+        raise Badge.DoesNotExist('No badge with keyword %s' % badge_keyword)
+    return badge
+
+
 def sanitise_username(username):
     chars = '[@#!±$%^&*()=|/><?,:;\~`{}]'
     return re.sub(chars, '', username).lower().replace(' ', '_').replace('+', '_').replace('-', '_').replace('\\', '')
@@ -173,11 +226,20 @@ def get_column_numbers_for_conflicts_csv(first_row):
     return name, email
 
 
-def get_temporary_username(email):
-    username = email.split('@')[0]
-    temp_username = sanitise_username(username) + str(secrets.randbelow(9999))
-    User = get_user_model()
-    while User.is_username_taken(temp_username):
+def get_temporary_username(email, taken_usernames=None):
+    """
+    Checks the username against taken_usernames when given, against the database otherwise
+    """
+    username = sanitise_username(email.split('@')[0])
+    temp_username = username + str(secrets.randbelow(9999))
+
+    if taken_usernames is None:
+        User = get_user_model()
+        is_username_taken = User.is_username_taken
+    else:
+        is_username_taken = taken_usernames.__contains__
+
+    while is_username_taken(temp_username):
         temp_username = username + str(secrets.randbelow(9999))
 
     return temp_username
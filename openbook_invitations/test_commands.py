@@ -0,0 +1,69 @@
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from openbook_auth.models import User
+from openbook_common.tests.helpers import make_user, make_badge
+
+
+class AllocateInvitesCommandTests(TestCase):
+    """
+    allocate_invites
+    """
+
+    def test_increases_invites_in_batches(self):
+        """
+        should increase the invites of every user whatever the batch size
+        """
+        users = [make_user() for i in range(0, 5)]
+        User.objects.filter(pk=users[0].pk).update(invite_count=3)
+
+        call_command('allocate_invites', count=2, batch_size=2, stdout=StringIO())
+
+        invite_counts = dict(User.objects.values_list('pk', 'invite_count'))
+
+        self.assertEqual(invite_counts[users[0].pk], 5)
+
+        for user in users[1:]:
+            self.assertEqual(invite_counts[user.pk], 2)
+
+    def test_sets_invites_of_filtered_users(self):
+        """
+        should only set the invites of the active users with the badge
+        """
+        badge = make_badge()
+
+        badged_user = make_user()
+        badged_user.profile.badges.add(badge)
+
+        inactive_badged_user = make_user()
+        inactive_badged_user.profile.badges.add(badge)
+        User.objects.filter(pk=inactive_badged_user.pk).update(is_active=False)
+
+        user = make_user()
+
+        call_command('allocate_invites', total=7, active=True, badge=badge.keyword, stdout=StringIO())
+
+        self.assertEqual(User.objects.get(pk=badged_user.pk).invite_count, 7)
+        self.assertEqual(User.objects.get(pk=inactive_badged_user.pk).invite_count, 0)
+        self.assertEqual(User.objects.get(pk=user.pk).invite_count, 0)
+
+    def test_dry_run_doesnt_allocate_invites(self):
+        """
+        should only count the users the invites would be allocated to on a dry run
+        """
+        user = make_user()
+        out = StringIO()
+
+        call_command('allocate_invites', count=2, dry_run=True, stdout=out)
+
+        self.assertEqual(User.objects.get(pk=user.pk).invite_count, 0)
+        self.assertIn('Would allocate invites to 1 users', out.getvalue())
+
+    def test_rejects_malformed_joined_before(self):
+        """
+        should fail with a command error when the joined before date is malformed
+        """
+        with self.assertRaises(CommandError):
+            call_command('allocate_invites', count=2, joined_before='01/02/2019', stdout=StringIO())
@@ -0,0 +1,66 @@
+from django.test import TestCase, override_settings
+
+from openbook_invitations.mail_backends import StandInEmailBackend
+from openbook_invitations.mailing import send_invites_emails
+from openbook_invitations.models import UserInvite
+
+
+@override_settings(EMAIL_BACKEND='openbook_invitations.mail_backends.StandInEmailBackend')
+class SendInvitesEmailsTests(TestCase):
+    """
+    send_invites_emails
+    """
+
+    def setUp(self):
+        StandInEmailBackend.reset()
+
+    def test_sends_and_marks_every_batch(self):
+        """
+        should send every invite email and mark them sent, reusing a connection per worker
+        """
+        invites = self._make_invites(amount=5)
+
+        sent_count, failed_count = send_invites_emails(make_email=lambda invite: invite.make_invite_email(),
+                                                       batch_size=2, max_workers=2, max_rate=0)
+
+        self.assertEqual(sent_count, 5)
+        self.assertEqual(failed_count, 0)
+        self.assertEqual(sorted(email.to[0] for email in StandInEmailBackend.outbox),
+                         sorted(invite.email for invite in invites))
+        self.assertTrue(StandInEmailBackend.opened_connections_count <= 2)
+        self.assertFalse(UserInvite.objects.filter(is_invite_email_sent=False).exists())
+
+    def test_resumes_from_unsent_invites(self):
+        """
+        should only send the emails of the invites not marked sent by a previous run
+        """
+        invites = self._make_invites(amount=4)
+        UserInvite.objects.filter(pk__in=[invite.pk for invite in invites[:3]]).update(is_invite_email_sent=True)
+
+        sent_count, failed_count = send_invites_emails(make_email=lambda invite: invite.make_invite_email(),
+                                                       max_rate=0)
+
+        self.assertEqual(sent_count, 1)
+        self.assertEqual([email.to[0] for email in StandInEmailBackend.outbox], [invites[3].email])
+
+    def test_failed_emails_are_not_marked_sent(self):
+        """
+        should leave the invites whose email failed to be sent on the next run
+        """
+        invites = self._make_invites(amount=3)
+        failing_invite = invites[1]
+
+        def make_email(invite):
+            if invite.pk == failing_invite.pk:
+                raise ValueError()
+            return invite.make_invite_email()
+
+        sent_count, failed_count = send_invites_emails(make_email=make_email, max_rate=0)
+
+        self.assertEqual(sent_count, 2)
+        self.assertEqual(failed_count, 1)
+        self.assertEqual(list(UserInvite.objects.filter(is_invite_email_sent=False)), [failing_invite])
+
+    def _make_invites(self, amount):
+        return [UserInvite.create_invite(name='Backer %d' % i, email='backer%d@example.com' % i) for i in
+                range(amount)]
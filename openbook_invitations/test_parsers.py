@@ -0,0 +1,60 @@
+import csv
+import tempfile
+
+from django.test import TestCase
+
+from openbook_common.tests.helpers import make_user, make_badge
+from openbook_invitations.models import UserInvite
+from openbook_invitations.parsers import parse_indiegogo_csv
+
+
+class ParseIndiegogoCsvTests(TestCase):
+    """
+    parse_indiegogo_csv
+    """
+
+    def test_creates_invites_in_batches(self):
+        """
+        should create an invite with a token for every row whatever the batch size
+        """
+        badge = make_badge()
+
+        rows = [['backer%d' % i, 'backer%d@example.com' % i, 'backer%d' % i, badge.keyword] for i in range(5)]
+
+        with self.settings(INVITES_BULK_CREATE_BATCH_SIZE=2):
+            parse_indiegogo_csv(self._make_csv(rows))
+
+        invites = UserInvite.objects.all()
+
+        self.assertEqual(invites.count(), 5)
+        self.assertEqual(len({invite.token for invite in invites}), 5)
+
+        for invite in invites:
+            self.assertTrue(UserInvite.is_token_valid(invite.token))
+            self.assertEqual(invite.badge, badge)
+
+    def test_generates_free_username_when_empty(self):
+        """
+        should give a temporary username not taken by a user or an invite to the rows without one
+        """
+        user = make_user()
+
+        rows = [['Backer', 'backer@example.com', '', ''], ['Other backer', 'other@example.com', '', '']]
+
+        parse_indiegogo_csv(self._make_csv(rows))
+
+        usernames = list(UserInvite.objects.values_list('username', flat=True))
+
+        self.assertEqual(len(set(usernames)), 2)
+        self.assertNotIn(user.username, usernames)
+        self.assertTrue(all(usernames))
+
+    def _make_csv(self, rows):
+        csv_file = tempfile.NamedTemporaryFile(mode='w', newline='', suffix='.csv', delete=False)
+
+        with csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['Name', 'Email', 'Username', 'Badge Keyword'])
+            writer.writerows(rows)
+
+        return csv_file.name
@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
 from django.utils import timezone
 
 # Create your models here.
@@ -8,6 +10,8 @@ from django.utils.translation import ugettext_lazy as _
 
 from openbook_common.models import Emoji
 from openbook_common.utils.model_loaders import get_follow_model
+from openbook_common.utils.resource_versions import bump_resources_versions, bump_users_resources_versions, \
+    make_user_lists_resource
 from openbook_follows.models import Follow
 
 
@@ -40,9 +44,7 @@ class List(models.Model):
         return users
 
     def clear_users(self):
-        follows = self.follows.all()
-        for follow in follows:
-            follow.lists.delete(self)
+        self.follows.clear()
 
     @property
     def follows_count(self):
@@ -53,3 +55,33 @@ class List(models.Model):
         if not self.id:
             self.created = timezone.now()
         return super(List, self).save(*args, **kwargs)
+
+
+@receiver([post_save, post_delete], sender=List, dispatch_uid='bump_list_versions')
+def bump_list_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the list creator
+    """
+    bump_users_resources_versions([instance.creator_id])
+    bump_resources_versions([make_user_lists_resource(instance.creator_id)])
+
+
+@receiver(m2m_changed, sender=List.follows.through, dispatch_uid='bump_list_follows_versions')
+def bump_list_follows_versions(sender, instance=None, action=None, reverse=False, pk_set=None, **kwargs):
+    """"
+    Invalidate the ETags of the lists owner and of the users added to or removed from the lists
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        users_ids = [instance.user_id, instance.followed_user_id]
+        lists_creator_id = instance.user_id
+    else:
+        users_ids = [instance.creator_id]
+        if pk_set:
+            users_ids.extend(Follow.objects.filter(pk__in=pk_set).values_list('followed_user_id', flat=True))
+        lists_creator_id = instance.creator_id
+
+    bump_users_resources_versions(users_ids)
+    bump_resources_versions([make_user_lists_resource(lists_creator_id)])
@@ -3,8 +3,9 @@ from rest_framework import serializers
 
 from openbook.settings import LIST_MAX_LENGTH
 from openbook_auth.models import UserProfile, User
-from openbook_auth.validators import username_characters_validator, user_username_exists
+from openbook_auth.validators import username_characters_validator
 from openbook_common.models import Emoji
+from openbook_common.serializers_fields.request import CursorField
 from openbook_lists.models import List
 from openbook_common.validators import emoji_id_exists
 from openbook_lists.validators import list_id_exists
@@ -23,13 +24,28 @@ class UpdateListSerializer(serializers.Serializer):
     list_id = serializers.IntegerField(required=False, validators=[list_id_exists])
     name = serializers.CharField(max_length=LIST_MAX_LENGTH, required=False, allow_blank=False)
     emoji_id = serializers.IntegerField(validators=[emoji_id_exists], required=False)
+    # The usernames are checked to exist all at once when updating the list
     usernames = serializers.ListSerializer(
         required=False,
         allow_empty=True,
         child=serializers.CharField(max_length=settings.USERNAME_MAX_LENGTH,
                                     allow_blank=False,
                                     required=False,
-                                    validators=[username_characters_validator, user_username_exists])
+                                    validators=[username_characters_validator])
+    )
+
+
+class GetListUsersSerializer(serializers.Serializer):
+    list_id = serializers.IntegerField(required=True, validators=[list_id_exists])
+    max_id = serializers.IntegerField(
+        required=False,
+    )
+    cursor = CursorField(
+        required=False,
+    )
+    count = serializers.IntegerField(
+        required=False,
+        max_value=20
     )
 
 
@@ -1,4 +1,6 @@
 # Create your tests here.
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from faker import Faker
 from rest_framework import status
@@ -231,6 +233,73 @@ class ListItemAPITests(APITestCase):
 
         self.assertEqual(len(list.users), 0)
 
+    def test_can_update_own_list_users_with_set_difference(self):
+        """
+        should be able to add followed and not followed users and remove users from an own list and return 200
+        """
+        user = make_user()
+
+        list = mixer.blend(List, creator=user)
+        list_id = list.pk
+
+        user_to_keep = make_user()
+        user.follow_user_with_id(user_to_keep.pk, lists_ids=[list_id])
+
+        user_to_remove = make_user()
+        user.follow_user_with_id(user_to_remove.pk, lists_ids=[list_id])
+
+        followed_user_to_add = make_user()
+        user.follow_user_with_id(followed_user_to_add.pk)
+
+        user_to_follow = make_user()
+
+        data = {
+            'usernames': ','.join([user_to_keep.username, followed_user_to_add.username, user_to_follow.username])
+        }
+
+        url = self._get_url(list_id)
+        headers = make_authentication_headers_for_user(user)
+        response = self.client.patch(url, data, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        for list_user in [user_to_keep, followed_user_to_add, user_to_follow]:
+            self.assertTrue(user.is_following_user_with_id_in_list_with_id(list_user.pk, list_id))
+
+        self.assertFalse(user.is_following_user_with_id_in_list_with_id(user_to_remove.pk, list_id))
+        self.assertTrue(user.is_following_user_with_id(user_to_remove.pk))
+
+    def test_update_own_list_users_queries_dont_grow_with_users(self):
+        """
+        should update the users of an own list with the same number of queries however many users change
+        """
+        user = make_user()
+
+        def get_update_queries_count(users_count):
+            list = mixer.blend(List, creator=user)
+            users_to_remove = [make_user() for i in range(users_count)]
+            followed_users_to_add = [make_user() for i in range(users_count)]
+            users_to_follow = [make_user() for i in range(users_count)]
+
+            for user_to_remove in users_to_remove:
+                user.follow_user_with_id(user_to_remove.pk, lists_ids=[list.pk])
+
+            for followed_user_to_add in followed_users_to_add:
+                user.follow_user_with_id(followed_user_to_add.pk)
+
+            usernames = [list_user.username for list_user in followed_users_to_add + users_to_follow]
+
+            with CaptureQueriesContext(connection) as context:
+                user.update_list_with_id(list.pk, usernames=usernames)
+
+            self.assertEqual(list.follows_count, users_count * 2)
+
+            return len(context.captured_queries)
+
+        get_update_queries_count(users_count=1)
+
+        self.assertEqual(get_update_queries_count(users_count=2), get_update_queries_count(users_count=10))
+
     def test_cannot_update_other_user_list(self):
         """
         should not be able update another user list and return 400
@@ -265,6 +334,66 @@ class ListItemAPITests(APITestCase):
         })
 
 
+class ListUsersAPITests(APITestCase):
+    """
+    ListUsersAPI
+    """
+
+    def test_can_retrieve_own_list_users_a_page_at_a_time(self):
+        """
+        should be able to retrieve the users of an own list a page at a time and return 200
+        """
+        user = make_user()
+
+        list = mixer.blend(List, creator=user)
+        list_id = list.pk
+
+        list_users_ids = []
+
+        for i in range(5):
+            user_to_follow = make_user()
+            user.follow_user_with_id(user_to_follow.pk, lists_ids=[list_id])
+            list_users_ids.append(user_to_follow.pk)
+
+        user.follow_user_with_id(make_user().pk)
+
+        url = self._get_url(list_id)
+        headers = make_authentication_headers_for_user(user)
+        response = self.client.get(url, {'count': 3}, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        first_page = json.loads(response.content)
+
+        self.assertEqual(len(first_page), 3)
+
+        response = self.client.get(url, {'count': 3, 'max_id': first_page[-1]['id']}, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        second_page = json.loads(response.content)
+
+        self.assertEqual(sorted([list_user['id'] for list_user in first_page + second_page]), list_users_ids)
+
+    def test_cannot_retrieve_other_user_list_users(self):
+        """
+        should not be able to retrieve the users of the list of another user and return 400
+        """
+        user = make_user()
+        list = mixer.blend(List, creator=make_user())
+
+        url = self._get_url(list.pk)
+        headers = make_authentication_headers_for_user(user)
+        response = self.client.get(url, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def _get_url(self, list_id):
+        return reverse('list-users', kwargs={
+            'list_id': list_id
+        })
+
+
 class ListNameCheckAPITests(APITestCase):
     """
     ListNameCheckAPI
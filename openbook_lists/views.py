@@ -7,11 +7,14 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.utils.translation import gettext as _
 
-from openbook_common.responses import ApiMessageResponse
+from openbook_common.responses import ApiMessageResponse, CursorPaginatedResponse
 from openbook_common.utils.helpers import normalise_request_data, nomalize_usernames_in_request_data
+from openbook_common.utils.pagination import paginate_queryset
+from openbook_common.utils.resource_versions import versioned_etag, make_user_lists_resource, \
+    EMOJI_GROUPS_RESOURCE
 from openbook_lists.serializers import CreateListSerializer, GetListsListSerializer, DeleteListSerializer, \
     UpdateListSerializer, \
-    ListNameCheckSerializer, GetListListSerializer
+    ListNameCheckSerializer, GetListListSerializer, GetListUsersSerializer, ListUserSerializer
 
 
 class Lists(APIView):
@@ -32,6 +35,7 @@ class Lists(APIView):
 
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @versioned_etag(lambda request: [make_user_lists_resource(request.user.pk), EMOJI_GROUPS_RESOURCE])
     def get(self, request):
         user = request.user
         response_serializer = GetListsListSerializer(user.lists.order_by('-created'), many=True, context={"request": request})
@@ -86,6 +90,32 @@ class ListItem(APIView):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
+class ListUsers(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, list_id):
+        query_params = request.query_params.dict()
+        query_params['list_id'] = list_id
+
+        serializer = GetListUsersSerializer(data=query_params)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+
+        count = data.get('count', 10)
+        max_id = data.get('max_id')
+        cursor = data.get('cursor')
+
+        user = request.user
+
+        users = user.get_users_for_list_with_id(list_id=list_id, max_id=max_id)
+        page = paginate_queryset(users, count=count, cursor=cursor)
+
+        response_serializer = ListUserSerializer(page.items, many=True, context={"request": request})
+
+        return CursorPaginatedResponse(response_serializer.data, page=page)
+
+
 class ListNameCheck(APIView):
     """
     The API to check if a listName is both valid and not taken.
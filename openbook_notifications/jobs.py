@@ -0,0 +1,29 @@
+from django_rq import job
+
+from openbook_common.utils.model_loaders import get_user_model, get_follow_notification_model
+from openbook_notifications.push_notifications import senders
+
+
+@job('high')
+def send_follow_notifications(following_user_id, followed_users_ids):
+    """
+    Creates the notifications of the users followed at once and sends their push notifications
+    """
+    User = get_user_model()
+    following_user = User.objects.filter(pk=following_user_id).first()
+
+    if not following_user:
+        return
+
+    # The users who were unfollowed since are left out
+    followed_users_ids = list(following_user.follows.filter(followed_user_id__in=followed_users_ids).values_list(
+        'followed_user_id', flat=True))
+
+    FollowNotification = get_follow_notification_model()
+    FollowNotification.bulk_create_follow_notifications(follower_id=following_user_id, owners_ids=followed_users_ids)
+
+    followed_users = User.objects.filter(pk__in=followed_users_ids).select_related(
+        'notifications_settings').prefetch_related('devices')
+
+    for followed_user in followed_users:
+        senders.send_follow_push_notification(followed_user=followed_user, following_user=following_user)
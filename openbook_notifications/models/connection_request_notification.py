@@ -20,6 +20,14 @@ class ConnectionRequestNotification(models.Model):
                                          owner_id=owner_id)
         return connection_request_notification
 
+    @classmethod
+    def bulk_create_connection_request_notifications(cls, connection_requester_id, owners_ids):
+        owners_ids = list(owners_ids)
+        Notification.bulk_create_notifications_with_content_objects(
+            type=Notification.CONNECTION_REQUEST, owners_ids=owners_ids,
+            content_objects=[cls(connection_requester_id=connection_requester_id) for owner_id in owners_ids],
+            connection_requester_id=connection_requester_id)
+
     @classmethod
     def delete_connection_request_notification_for_users_with_ids(cls, user_a_id, user_b_id):
         notification_query = Q(connection_requester_id=user_a_id, notification__owner_id=user_b_id)
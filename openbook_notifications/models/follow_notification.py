@@ -19,6 +19,17 @@ class FollowNotification(models.Model):
                                          owner_id=owner_id)
         return follow_notification
 
+    @classmethod
+    def bulk_create_follow_notifications(cls, follower_id, owners_ids):
+        owners_ids = list(owners_ids)
+        Notification.bulk_create_notifications_with_content_objects(
+            type=Notification.FOLLOW, owners_ids=owners_ids,
+            content_objects=[cls(follower_id=follower_id) for owner_id in owners_ids], follower_id=follower_id)
+
     @classmethod
     def delete_follow_notification(cls, follower_id, owner_id):
         cls.objects.filter(follower_id=follower_id, notification__owner_id=owner_id).delete()
+
+    @classmethod
+    def delete_follow_notifications(cls, follower_id, owners_ids):
+        cls.objects.filter(follower_id=follower_id, notification__owner_id__in=owners_ids).delete()
@@ -1,6 +1,7 @@
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction, connection
+from django.db.models import Max
 from django.utils import timezone
 
 from openbook_auth.models import User
@@ -38,6 +39,42 @@ class Notification(models.Model):
     def create_notification(cls, owner_id, type, content_object):
         return cls.objects.create(notification_type=type, content_object=content_object, owner_id=owner_id)
 
+    @classmethod
+    def bulk_create_notifications(cls, type, owners_content_objects):
+        """
+        Creates a notification of the given type for each of the (owner_id, content_object) pairs at once
+        """
+        created = timezone.now()
+        return cls.objects.bulk_create([
+            cls(notification_type=type, content_object=content_object, owner_id=owner_id, created=created)
+            for owner_id, content_object in owners_content_objects
+        ])
+
+    @classmethod
+    def bulk_create_notifications_with_content_objects(cls, type, owners_ids, content_objects, **lookup):
+        """
+        Inserts the unsaved content objects at once, then a notification of the given type for each of them, owned by
+        the owner at the same position in owners_ids. The lookup must match the new content objects, they are fetched
+        back with it when bulk_create doesn't set their ids.
+        """
+        if not content_objects:
+            return []
+
+        # The type argument shadows the builtin
+        Model = content_objects[0].__class__
+
+        with transaction.atomic():
+            if connection.features.can_return_ids_from_bulk_insert:
+                content_objects = Model.objects.bulk_create(content_objects)
+            else:
+                # Read first, the rows other transactions commit afterwards stay out of this one's snapshot
+                last_id = Model.objects.aggregate(last_id=Max('pk'))['last_id'] or 0
+                Model.objects.bulk_create(content_objects)
+                new_content_objects = Model.objects.filter(pk__gt=last_id, **lookup).order_by('pk')
+                content_objects = list(new_content_objects[:len(content_objects)])
+
+            return cls.bulk_create_notifications(type=type, owners_content_objects=zip(owners_ids, content_objects))
+
     def save(self, *args, **kwargs):
         ''' On save, update timestamps '''
         if not self.id and not self.created:
@@ -5,6 +5,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from openbook_common.responses import CursorPaginatedResponse
+from openbook_common.utils.pagination import paginate_queryset
 from openbook_notifications.serializers import GetNotificationsSerializer, GetNotificationsNotificationSerializer, \
     DeleteNotificationSerializer, ReadNotificationSerializer, ReadNotificationsSerializer
 
@@ -21,15 +23,17 @@ class Notifications(APIView):
 
         count = data.get('count', 10)
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
 
         user = request.user
 
-        notifications = user.get_notifications(max_id=max_id).order_by('-created')[:count]
+        page = paginate_queryset(user.get_notifications(max_id=max_id), count=count, cursor=cursor,
+                                 sort_field='created')
 
-        response_serializer = GetNotificationsNotificationSerializer(notifications, many=True,
+        response_serializer = GetNotificationsNotificationSerializer(page.items, many=True,
                                                                      context={"request": request})
 
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(response_serializer.data, page=page)
 
     def delete(self, request):
         user = request.user
@@ -0,0 +1,20 @@
+# Generated by Django 2.2 on 2026-10-19 10:43
+
+from django.db import migrations
+import openbook_common.utils.image_renditions
+import openbook_posts.helpers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openbook_posts', '0030_post_is_closed'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='postimage',
+            name='image',
+            field=openbook_common.utils.image_renditions.RenditionedImageField(height_field='height', null=True, upload_to=openbook_posts.helpers.upload_to_post_image_directory, verbose_name='image', width_field='width'),
+        ),
+    ]
@@ -1,16 +1,21 @@
 # Create your models here.
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import timedelta
 
+from django.contrib.contenttypes.fields import GenericRelation
+from django.core.files.images import get_image_dimensions
 from django.core.files.storage import default_storage
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 from django.db.models import Count
 
 # Create your views here.
-from pilkit.processors import ResizeToFit
+from pilkit.processors import ResizeToFit, ResizeToFill
 from rest_framework.exceptions import ValidationError
 
 from django.conf import settings
@@ -18,9 +23,11 @@ from openbook.storage_backends import S3PrivateMediaStorage
 from openbook_auth.models import User
 
 from openbook_common.models import Emoji
+from openbook_common.utils.image_renditions import RenditionedImageField, ImageRenditionSpec
+from openbook_common.utils.media_garbage import bury_media_keys
 from openbook_common.utils.model_loaders import get_emoji_model, \
     get_circle_model, get_community_model
-from imagekit.models import ProcessedImageField
+from openbook_common.utils.resource_versions import bump_users_resources_versions
 
 from openbook_posts.helpers import upload_to_post_image_directory, upload_to_post_video_directory
 
@@ -88,6 +95,73 @@ class Post(models.Model):
 
         return post
 
+    @classmethod
+    def bulk_create_posts(cls, creator, circles_ids, posts_data, stored_images_names=None):
+        """
+        Creates the posts of the given dicts of text, image and created with a few queries in all rather than a few
+        per post. The post_save receivers don't run, their work is done once for all the posts.
+
+        The images are stored before the rows are inserted and buried when the inserts fail. The names of the stored
+        images are appended to stored_images_names when given, so a caller whose transaction rolls back the
+        tombstones along with the inserts can bury them once out of it.
+        """
+        posts = []
+        posts_images = []
+
+        for post_data in posts_data:
+            text = post_data.get('text')
+            image = post_data.get('image')
+
+            if not text and not image:
+                raise ValidationError(_('A post requires text or an image/video.'))
+
+            post = Post(creator=creator, text=text, created=post_data.get('created') or timezone.now())
+            posts.append(post)
+
+            if image:
+                posts_images.append((post, image))
+
+        if stored_images_names is None:
+            stored_images_names = []
+
+        stored_images = PostImage.store_images(posts_images=posts_images, stored_names=stored_images_names)
+
+        image_field = PostImage._meta.get_field('image')
+
+        try:
+            with transaction.atomic():
+                cls._insert_posts(posts=posts, circles_ids=circles_ids, stored_images=stored_images)
+        except Exception:
+            bury_media_keys(field=image_field, keys=stored_images_names)
+            raise
+
+        images_posts_ids = [post.pk for post, name, width, height in stored_images]
+
+        for post_image in PostImage.objects.filter(post_id__in=images_posts_ids):
+            image_field.enqueue_renditions(post_image)
+
+        bump_users_resources_versions([creator.pk])
+
+        return posts
+
+    @classmethod
+    def _insert_posts(cls, posts, circles_ids, stored_images):
+        Post.objects.bulk_create(posts, batch_size=settings.POSTS_BULK_CREATE_BATCH_SIZE)
+
+        # bulk_create doesn't set the primary keys on MySQL
+        posts_ids = dict(Post.objects.filter(uuid__in=[post.uuid for post in posts]).values_list('uuid', 'id'))
+
+        for post in posts:
+            post.pk = posts_ids[post.uuid]
+
+        PostCircle = Post.circles.through
+        PostCircle.objects.bulk_create([PostCircle(post_id=post.pk, circle_id=circle_id) for post in posts
+                                        for circle_id in circles_ids], batch_size=settings.POSTS_BULK_CREATE_BATCH_SIZE)
+
+        PostImage.objects.bulk_create([PostImage(post_id=post.pk, image=name, width=width, height=height)
+                                       for post, name, width, height in stored_images],
+                                      batch_size=settings.POSTS_BULK_CREATE_BATCH_SIZE)
+
     @classmethod
     def get_public_emoji_counts_for_post_with_id(cls, post_id, emoji_id=None, reactor_id=None):
         Emoji = get_emoji_model()
@@ -222,14 +296,58 @@ post_image_storage = S3PrivateMediaStorage() if settings.IS_PRODUCTION else defa
 
 class PostImage(models.Model):
     post = models.OneToOneField(Post, on_delete=models.CASCADE, related_name='image')
-    image = ProcessedImageField(verbose_name=_('image'), storage=post_image_storage,
-                                upload_to=upload_to_post_image_directory,
-                                width_field='width',
-                                height_field='height',
-                                blank=False, null=True, format='JPEG', options={'quality': 50},
-                                processors=[ResizeToFit(width=1024, upscale=False)])
+    image = RenditionedImageField(verbose_name=_('image'), storage=post_image_storage,
+                                  upload_to=upload_to_post_image_directory,
+                                  width_field='width',
+                                  height_field='height',
+                                  blank=False, null=True,
+                                  renditions=[
+                                      ImageRenditionSpec(name='thumbnail', processors=[ResizeToFill(300, 300)]),
+                                      ImageRenditionSpec(name='feed',
+                                                         processors=[ResizeToFit(width=1024, upscale=False)]),
+                                      ImageRenditionSpec(name='full',
+                                                         processors=[ResizeToFit(width=2048, upscale=False)]),
+                                  ], primary_rendition='feed')
     width = models.PositiveIntegerField(editable=False, null=False, blank=False)
     height = models.PositiveIntegerField(editable=False, null=False, blank=False)
+    image_renditions = GenericRelation('openbook_common.ImageRendition')
+
+    @classmethod
+    def store_images(cls, posts_images, stored_names=None):
+        """
+        Saves the images of the (post, image) pairs to the storage in parallel,
+        returns (post, name, width, height) tuples to create the PostImages with.
+        The name of every saved image is appended to stored_names when given. When a save fails, the images saved
+        already are buried and the error raised.
+        """
+        if stored_names is None:
+            stored_names = []
+
+        if not posts_images:
+            return []
+
+        image_field = cls._meta.get_field('image')
+
+        def store_image(post_image):
+            post, image = post_image
+            width, height = get_image_dimensions(image)
+            name = image_field.generate_filename(cls(post=post), image.name)
+            name = image_field.storage.save(name, image, max_length=image_field.max_length)
+            stored_names.append(name)
+            return post, name, width, height
+
+        max_workers = min(settings.POST_IMAGES_STORE_MAX_WORKERS, len(posts_images))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(store_image, post_image) for post_image in posts_images]
+            # Every save is over before burying, none can store an image afterwards
+            wait(futures)
+
+        try:
+            return [future.result() for future in futures]
+        except Exception:
+            bury_media_keys(field=image_field, keys=stored_names)
+            raise
 
 
 class PostVideo(models.Model):
@@ -301,3 +419,20 @@ class PostMute(models.Model):
     @classmethod
     def create_post_mute(cls, post_id, muter_id):
         return cls.objects.create(post_id=post_id, muter_id=muter_id)
+
+
+@receiver(post_save, sender=Post, dispatch_uid='bump_created_post_versions')
+def bump_created_post_versions(sender, instance=None, created=False, **kwargs):
+    """"
+    Invalidate the ETags of the post creator, whose posts count changed
+    """
+    if created:
+        bump_users_resources_versions([instance.creator_id])
+
+
+@receiver(post_delete, sender=Post, dispatch_uid='bump_deleted_post_versions')
+def bump_deleted_post_versions(sender, instance=None, **kwargs):
+    """"
+    Invalidate the ETags of the post creator, whose posts count changed
+    """
+    bump_users_resources_versions([instance.creator_id])
@@ -17,6 +17,7 @@ import random
 from openbook_common.tests.helpers import make_authentication_headers_for_user, make_fake_post_text, \
     make_fake_post_comment_text, make_user, make_circle, make_emoji, make_emoji_group, make_reactions_emoji_group, \
     make_community, make_private_community
+from openbook_common.utils.media_garbage import delete_buried_media
 from openbook_communities.models import Community
 from openbook_notifications.models import PostCommentNotification, PostReactionNotification, Notification
 from openbook_posts.models import Post, PostComment, PostReaction
@@ -394,6 +395,7 @@ class PostItemAPITests(APITestCase):
         file = post.image.image.file
 
         user.delete_post_with_id(post.id)
+        delete_buried_media()
 
         self.assertFalse(access(file.name, F_OK))
 
@@ -413,6 +415,7 @@ class PostItemAPITests(APITestCase):
         file = post.video.video.file
 
         user.delete_post_with_id(post.id)
+        delete_buried_media()
 
         self.assertFalse(access(file.name, F_OK))
 
@@ -3,6 +3,8 @@ import tempfile
 
 from PIL import Image
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from faker import Faker
 from rest_framework import status
@@ -17,6 +19,7 @@ import logging
 import json
 
 from openbook_circles.models import Circle
+from openbook_common.jobs import process_image_renditions
 from openbook_common.tests.helpers import make_user, make_users, make_fake_post_text, \
     make_authentication_headers_for_user, make_circle, make_community
 from openbook_lists.models import List
@@ -249,6 +252,79 @@ class PostsAPITests(APITestCase):
 
         self.assertTrue(hasattr(created_post, 'image'))
 
+    def test_create_image_post_swaps_in_renditions(self):
+        """
+        should replace the uploaded image with its renditions once processed and return them along the post
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        image = Image.new('RGB', (2000, 1000))
+        tmp_file = tempfile.NamedTemporaryFile(suffix='.jpg')
+        image.save(tmp_file)
+        tmp_file.seek(0)
+
+        url = self._get_url()
+
+        response = self.client.put(url, {'image': tmp_file}, **headers, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        post_image = user.posts.get().image
+        uploaded_image_name = post_image.image.name
+
+        process_image_renditions(model_label='openbook_posts.PostImage', instance_id=post_image.pk,
+                                 field_name='image', source_name=uploaded_image_name)
+
+        post_image.refresh_from_db()
+
+        self.assertNotEqual(post_image.image.name, uploaded_image_name)
+        self.assertEqual((post_image.width, post_image.height), (1024, 512))
+
+        renditions = {rendition.name: rendition for rendition in post_image.image_renditions.all()}
+
+        self.assertEqual(set(renditions.keys()), {'thumbnail', 'feed', 'full'})
+        self.assertEqual((renditions['thumbnail'].width, renditions['thumbnail'].height), (300, 300))
+        self.assertEqual((renditions['full'].width, renditions['full'].height), (2000, 1000))
+        self.assertEqual(renditions['feed'].key, post_image.image.name)
+
+        response = self.client.get(url, **headers)
+
+        response_post_image = json.loads(response.content)[0]['image']
+
+        self.assertEqual(response_post_image['width'], 1024)
+        self.assertEqual(set(response_post_image['renditions'].keys()), {'thumbnail', 'feed', 'full'})
+        self.assertEqual(response_post_image['renditions']['thumbnail']['width'], 300)
+
+    def test_stale_image_renditions_are_discarded(self):
+        """
+        should not swap in the renditions of an image replaced while they were processed
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        image = Image.new('RGB', (100, 100))
+        tmp_file = tempfile.NamedTemporaryFile(suffix='.jpg')
+        image.save(tmp_file)
+        tmp_file.seek(0)
+
+        url = self._get_url()
+
+        response = self.client.put(url, {'image': tmp_file}, **headers, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        post_image = user.posts.get().image
+        uploaded_image_name = post_image.image.name
+
+        process_image_renditions(model_label='openbook_posts.PostImage', instance_id=post_image.pk,
+                                 field_name='image', source_name='%s-replaced' % uploaded_image_name)
+
+        post_image.refresh_from_db()
+
+        self.assertEqual(post_image.image.name, uploaded_image_name)
+        self.assertFalse(post_image.image_renditions.exists())
+
     def test_create_video_post(self):
         """
         should be able to create a video post and return 201
@@ -656,6 +732,146 @@ class PostsAPITests(APITestCase):
             self.assertIn(response_post_id, all_posts_ids)
             self.assertTrue(response_post_id > min_id)
 
+    def test_get_all_posts_with_cursor(self):
+        """
+        should be able to page forwards and backwards through all posts with the returned cursors
+        """
+        user = make_user()
+
+        amount_of_own_posts = 7
+
+        posts_ids = []
+        for i in range(amount_of_own_posts):
+            post = user.create_public_post(text=make_fake_post_text())
+            posts_ids.append(post.pk)
+
+        user_to_follow = make_user()
+        user.follow_user(user_to_follow)
+
+        amount_of_followed_user_posts = 3
+
+        for i in range(amount_of_followed_user_posts):
+            post = user_to_follow.create_public_post(text=make_fake_post_text())
+            posts_ids.append(post.pk)
+
+        headers = make_authentication_headers_for_user(user)
+
+        url = self._get_url()
+
+        count = 4
+        retrieved_posts_ids = []
+        pages_cursors = []
+        cursor = None
+
+        while True:
+            params = {'count': count}
+            if cursor:
+                params['cursor'] = cursor
+
+            response = self.client.get(url, params, **headers)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            pages_cursors.append(response.get('X-Previous-Cursor'))
+            retrieved_posts_ids.extend([response_post.get('id') for response_post in json.loads(response.content)])
+
+            cursor = response.get('X-Next-Cursor')
+
+            if not cursor:
+                break
+
+        self.assertEqual(retrieved_posts_ids, sorted(posts_ids, reverse=True))
+
+        response = self.client.get(url, {
+            'count': count,
+            'cursor': pages_cursors[-1]
+        }, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_posts_ids = [response_post.get('id') for response_post in json.loads(response.content)]
+
+        self.assertEqual(response_posts_ids, retrieved_posts_ids[count:count * 2])
+
+    def test_cant_get_posts_with_invalid_cursor(self):
+        """
+        should not be able to retrieve posts with a tampered cursor and return 400
+        """
+        user = make_user()
+
+        headers = make_authentication_headers_for_user(user)
+
+        url = self._get_url()
+
+        response = self.client.get(url, {
+            'cursor': 'WzEwLDEwLGZhbHNlXQ:1gWuMb:tampered'
+        }, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_all_posts_with_fields(self):
+        """
+        should only retrieve the requested fields of the posts and the id
+        """
+        user = make_user()
+
+        user.create_public_post(text=make_fake_post_text())
+
+        headers = make_authentication_headers_for_user(user)
+
+        url = self._get_url()
+
+        response = self.client.get(url, {
+            'fields': 'text,created'
+        }, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_posts = json.loads(response.content)
+
+        self.assertEqual(len(response_posts), 1)
+        self.assertEqual(set(response_posts[0].keys()), {'id', 'text', 'created'})
+
+    def test_get_all_posts_with_excluded_fields_skips_their_queries(self):
+        """
+        should not retrieve the excluded fields of the posts nor run their queries
+        """
+        user = make_user()
+
+        amount_of_posts = 5
+
+        for i in range(amount_of_posts):
+            user.create_public_post(text=make_fake_post_text())
+
+        headers = make_authentication_headers_for_user(user)
+
+        url = self._get_url()
+
+        with CaptureQueriesContext(connection) as all_fields_queries:
+            response = self.client.get(url, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        excluded_fields = ['reactions_emoji_counts', 'comments_count', 'circles', 'is_muted']
+
+        with CaptureQueriesContext(connection) as sparse_fields_queries:
+            response = self.client.get(url, {
+                'exclude': ','.join(excluded_fields)
+            }, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_posts = json.loads(response.content)
+
+        self.assertEqual(len(response_posts), amount_of_posts)
+
+        for response_post in response_posts:
+            for excluded_field in excluded_fields:
+                self.assertNotIn(excluded_field, response_post)
+            self.assertIn('text', response_post)
+
+        self.assertLess(len(sparse_fields_queries), len(all_fields_queries))
+
     def test_get_all_public_posts_for_unconnected_user(self):
         """
         should be able to retrieve all the public posts of an unconnected user
@@ -4,10 +4,13 @@ from django.conf import settings
 from openbook_auth.models import UserProfile, User
 from openbook_circles.models import Circle
 from openbook_common.models import Emoji, EmojiGroup, Badge
+from openbook_common.serializers import SparseFieldsetsSerializerMixin
+from openbook_common.serializers_fields.image import ImageRenditionsField, MediaUrlField
 from openbook_common.serializers_fields.post import PostCreatorField, ReactionsEmojiCountField, ReactionField, \
     CommentsCountField, CirclesField, IsMutedField
 from openbook_common.serializers_fields.post_comment import PostCommenterField
 from openbook_common.validators import emoji_id_exists, emoji_group_id_exists
+from openbook_common.serializers_fields.request import CursorField
 from openbook_communities.models import CommunityMembership, Community
 from openbook_communities.serializers_fields import CommunityMembershipsField
 from openbook_posts.models import PostComment, PostReaction, PostVideo, PostImage, Post
@@ -230,6 +233,9 @@ class GetPostReactionsSerializer(serializers.Serializer):
     max_id = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
     count = serializers.IntegerField(
         required=False,
         max_value=20
@@ -267,7 +273,8 @@ class PostReactionEmojiGroupSerializer(serializers.ModelSerializer):
     emojis = serializers.SerializerMethodField()
 
     def get_emojis(self, obj):
-        emojis = obj.emojis.all().order_by('order')
+        # Sorted in python so the emojis prefetched by the reference cache are reused
+        emojis = sorted(obj.emojis.all(), key=lambda emoji: (emoji.order, emoji.pk))
 
         request = self.context['request']
         return PostReactionEmojiSerializer(emojis, many=True, context={'request': request}).data
@@ -338,18 +345,22 @@ class PostCreatorSerializer(serializers.ModelSerializer):
 
 
 class PostImageSerializer(serializers.ModelSerializer):
-    image = serializers.ImageField(read_only=True)
+    image = MediaUrlField()
+    renditions = ImageRenditionsField(image_field_name='image')
 
     class Meta:
         model = PostImage
         fields = (
             'image',
             'width',
-            'height'
+            'height',
+            'renditions'
         )
 
 
 class PostVideoSerializer(serializers.ModelSerializer):
+    video = MediaUrlField()
+
     class Meta:
         model = PostVideo
         fields = (
@@ -397,7 +408,7 @@ class PostCircleSerializer(serializers.ModelSerializer):
         )
 
 
-class GetPostPostSerializer(serializers.ModelSerializer):
+class GetPostPostSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     image = PostImageSerializer(many=False)
     video = PostVideoSerializer(many=False)
     creator = PostCreatorField(post_creator_serializer=PostCreatorSerializer,
@@ -7,7 +7,11 @@ from django.utils.translation import ugettext_lazy as _
 from itertools import chain
 import operator
 
-from openbook_common.utils.model_loaders import get_emoji_group_model, get_post_model
+from openbook_common.responses import CursorPaginatedResponse
+from openbook_common.utils.model_loaders import get_post_model
+from openbook_common.utils.pagination import paginate_queryset
+from openbook_common.utils.reference_cache import emoji_groups_reference_cache
+from openbook_common.utils.resource_versions import versioned_etag, EMOJI_GROUPS_RESOURCE
 from openbook_posts.views.post.serializers import GetPostCommentsSerializer, PostCommentSerializer, \
     CommentPostSerializer, DeletePostCommentSerializer, DeletePostSerializer, DeletePostReactionSerializer, \
     ReactToPostSerializer, PostReactionSerializer, GetPostReactionsSerializer, PostEmojiCountSerializer, \
@@ -326,19 +330,18 @@ class PostReactions(APIView):
         post_uuid = data.get('post_uuid')
         emoji_id = data.get('emoji_id')
         max_id = data.get('max_id')
+        cursor = data.get('cursor')
         count = data.get('count', 10)
 
         user = request.user
         post_id = get_post_id_for_post_uuid(post_uuid)
 
-        post_reactions = user.get_reactions_for_post_with_id(post_id=post_id, max_id=max_id,
-                                                             emoji_id=emoji_id).order_by(
-            '-created')[
-                         :count]
+        post_reactions = user.get_reactions_for_post_with_id(post_id=post_id, max_id=max_id, emoji_id=emoji_id)
+        page = paginate_queryset(post_reactions, count=count, cursor=cursor, sort_field='created')
 
-        post_reactions_serializer = PostReactionSerializer(post_reactions, many=True, context={"request": request})
+        post_reactions_serializer = PostReactionSerializer(page.items, many=True, context={"request": request})
 
-        return Response(post_reactions_serializer.data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(post_reactions_serializer.data, page=page)
 
     def put(self, request, post_uuid):
         request_data = self._get_request_data(request, post_uuid)
@@ -431,9 +434,10 @@ class PostReactionItem(APIView):
 class PostReactionEmojiGroups(APIView):
     permission_classes = (IsAuthenticated,)
 
+    @versioned_etag(lambda request: [EMOJI_GROUPS_RESOURCE])
     def get(self, request):
-        EmojiGroup = get_emoji_group_model()
-        emoji_groups = EmojiGroup.objects.filter(is_reaction_group=True).all().order_by('order')
+        emoji_groups = [emoji_group for emoji_group in emoji_groups_reference_cache.all() if
+                        emoji_group.is_reaction_group]
         serializer = PostReactionEmojiGroupSerializer(emoji_groups, many=True, context={'request': request})
 
         return Response(serializer.data, status=status.HTTP_200_OK)
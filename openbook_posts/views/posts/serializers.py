@@ -1,14 +1,17 @@
 from rest_framework import serializers
 
 from django.conf import settings
+from django.utils.translation import ugettext_lazy as _
 from openbook_auth.models import User, UserProfile
 from openbook_auth.validators import user_username_exists, username_characters_validator
 from openbook_circles.models import Circle
 from openbook_circles.validators import circle_id_exists
 from openbook_common.models import Emoji, Badge
+from openbook_common.serializers import SparseFieldsetsSerializerMixin
+from openbook_common.serializers_fields.image import ImageRenditionsField, MediaUrlField
 from openbook_common.serializers_fields.post import ReactionField, CommentsCountField, ReactionsEmojiCountField, \
     CirclesField, PostCreatorField, IsMutedField, IsEncircledField
-from openbook_common.serializers_fields.request import RestrictedImageFileSizeField
+from openbook_common.serializers_fields.request import RestrictedImageFileSizeField, CursorField
 from openbook_communities.models import Community, CommunityMembership
 from openbook_communities.serializers_fields import CommunityMembershipsField
 from openbook_lists.validators import list_id_exists
@@ -30,6 +33,9 @@ class GetPostsSerializer(serializers.Serializer):
     min_id = serializers.IntegerField(
         required=False,
     )
+    cursor = CursorField(
+        required=False,
+    )
     count = serializers.IntegerField(
         required=False,
         max_value=20
@@ -50,11 +56,17 @@ class CreatePostSerializer(serializers.Serializer):
     image = RestrictedImageFileSizeField(allow_empty_file=False, required=False,
                                          max_upload_size=settings.POST_IMAGE_MAX_SIZE)
     video = serializers.FileField(allow_empty_file=False, required=False)
+    video_upload_uuid = serializers.UUIDField(required=False)
     circle_id = serializers.ListField(
         required=False,
         child=serializers.IntegerField(validators=[circle_id_exists]),
     )
 
+    def validate(self, data):
+        if data.get('video') and data.get('video_upload_uuid'):
+            raise serializers.ValidationError(_('A post video can either be sent or uploaded beforehand, not both.'))
+        return data
+
 
 class PostCreatorProfileBadgeSerializer(serializers.ModelSerializer):
     class Meta:
@@ -90,18 +102,22 @@ class PostCreatorSerializer(serializers.ModelSerializer):
 
 
 class PostImageSerializer(serializers.ModelSerializer):
-    image = serializers.ImageField(read_only=True, required=False, allow_empty_file=True)
+    image = MediaUrlField()
+    renditions = ImageRenditionsField(image_field_name='image')
 
     class Meta:
         model = PostImage
         fields = (
             'image',
             'width',
-            'height'
+            'height',
+            'renditions'
         )
 
 
 class PostVideoSerializer(serializers.ModelSerializer):
+    video = MediaUrlField()
+
     class Meta:
         model = PostVideo
         fields = (
@@ -183,7 +199,7 @@ class PostCommunitySerializer(serializers.ModelSerializer):
         )
 
 
-class AuthenticatedUserPostSerializer(serializers.ModelSerializer):
+class AuthenticatedUserPostSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     image = PostImageSerializer(many=False)
     video = PostVideoSerializer(many=False)
     creator = PostCreatorField(post_creator_serializer=PostCreatorSerializer,
@@ -220,7 +236,7 @@ class AuthenticatedUserPostSerializer(serializers.ModelSerializer):
         )
 
 
-class UnauthenticatedUserPostSerializer(serializers.ModelSerializer):
+class UnauthenticatedUserPostSerializer(SparseFieldsetsSerializerMixin, serializers.ModelSerializer):
     image = PostImageSerializer(many=False)
     video = PostVideoSerializer(many=False)
     creator = PostCreatorField(post_creator_serializer=PostCreatorSerializer,
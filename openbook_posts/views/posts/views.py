@@ -6,9 +6,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from openbook_common.responses import CursorPaginatedResponse
 from openbook_common.utils.helpers import normalize_list_value_in_request_data
+from openbook_common.utils.media_urls import get_posts_media_urls
 from openbook_common.utils.model_loaders import get_post_model
+from openbook_common.utils.pagination import paginate_queryset
 from openbook_posts.permissions import IsGetOrIsAuthenticated
+from openbook_uploads.models import Upload
 from openbook_posts.views.posts.serializers import CreatePostSerializer, AuthenticatedUserPostSerializer, \
     GetPostsSerializer, UnauthenticatedUserPostSerializer
 
@@ -31,14 +35,30 @@ class Posts(APIView):
         text = data.get('text')
         image = data.get('image')
         video = data.get('video') if settings.FEATURE_VIDEO_POSTS_ENABLED else None
+        video_upload_uuid = data.get('video_upload_uuid') if settings.FEATURE_VIDEO_POSTS_ENABLED else None
         circles_ids = data.get('circle_id')
         user = request.user
 
         with transaction.atomic():
-            if circles_ids:
-                post = user.create_encircled_post(text=text, circles_ids=circles_ids, image=image, video=video)
-            else:
-                post = user.create_public_post(text=text, image=image, video=video)
+            video_upload = None
+
+            if video_upload_uuid:
+                video_upload = user.get_finalized_upload_with_uuid(upload_uuid=video_upload_uuid,
+                                                                   type=Upload.POST_VIDEO)
+                video = video_upload.open_file()
+
+            try:
+                if circles_ids:
+                    post = user.create_encircled_post(text=text, circles_ids=circles_ids, image=image, video=video)
+                else:
+                    post = user.create_public_post(text=text, image=image, video=video)
+            finally:
+                if video_upload:
+                    video.close()
+
+            if video_upload:
+                # The video was copied to the post, the upload served its purpose
+                video_upload.delete()
 
         post_serializer = AuthenticatedUserPostSerializer(post, context={"request": request})
 
@@ -64,6 +84,11 @@ class Posts(APIView):
         min_id = data.get('min_id')
         count = data.get('count', 10)
         username = data.get('username')
+        cursor = data.get('cursor')
+
+        if cursor:
+            max_id = cursor.max_id
+            min_id = cursor.min_id
 
         user = request.user
 
@@ -88,11 +113,14 @@ class Posts(APIView):
                 count=count
             )
 
-        posts = posts.order_by('-id')[:count]
+        page = paginate_queryset(posts, count=count, cursor=cursor)
 
-        post_serializer_data = AuthenticatedUserPostSerializer(posts, many=True, context={"request": request}).data
+        post_serializer_data = AuthenticatedUserPostSerializer(page.items, many=True, context={
+            "request": request,
+            "media_urls": get_posts_media_urls(page.items)
+        }).data
 
-        return Response(post_serializer_data, status=status.HTTP_200_OK)
+        return CursorPaginatedResponse(post_serializer_data, page=page)
 
     def get_posts_for_unauthenticated_user(self, request):
         query_params = request.query_params.dict()
@@ -123,6 +151,9 @@ class TrendingPosts(APIView):
     def get(self, request):
         user = request.user
 
-        posts = user.get_trending_posts()[:30]
-        posts_serializer = AuthenticatedUserPostSerializer(posts, many=True, context={"request": request})
+        posts = list(user.get_trending_posts()[:30])
+        posts_serializer = AuthenticatedUserPostSerializer(posts, many=True, context={
+            "request": request,
+            "media_urls": get_posts_media_urls(posts)
+        })
         return Response(posts_serializer.data, status=status.HTTP_200_OK)
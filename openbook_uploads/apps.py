@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class OpenbookUploadsConfig(AppConfig):
+    name = 'openbook_uploads'
@@ -0,0 +1,20 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from openbook_common.utils.model_loaders import get_upload_model
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Deletes the resumable uploads older than UPLOAD_EXPIRY along with their received chunks'
+
+    def handle(self, *args, **options):
+        Upload = get_upload_model()
+
+        with transaction.atomic():
+            deleted_count, deleted_per_model = Upload.delete_expired_uploads()
+
+        logger.info('Deleted %d expired uploads' % deleted_count)
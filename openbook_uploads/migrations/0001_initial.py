@@ -0,0 +1,32 @@
+# Generated by Django 2.2 on 2026-10-19 10:59
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Upload',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('type', models.CharField(choices=[('PV', 'Post video'), ('IA', 'Import archive')], max_length=2)),
+                ('filename', models.CharField(max_length=255, verbose_name='filename')),
+                ('size', models.BigIntegerField(verbose_name='size')),
+                ('received_size', models.BigIntegerField(default=0, verbose_name='received size')),
+                ('is_finalized', models.BooleanField(default=False, verbose_name='is finalized')),
+                ('created', models.DateTimeField(db_index=True, editable=False)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='uploads', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
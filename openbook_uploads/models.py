@@ -0,0 +1,151 @@
+import os
+import shutil
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import models, transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+from rest_framework.exceptions import ValidationError
+
+from openbook_auth.models import User
+
+
+class Upload(models.Model):
+    """
+    A file uploaded a chunk at a time, which can be resumed from its received size after a failed chunk
+    """
+    POST_VIDEO = 'PV'
+    IMPORT_ARCHIVE = 'IA'
+
+    UPLOAD_TYPES = (
+        (POST_VIDEO, 'Post video'),
+        (IMPORT_ARCHIVE, 'Import archive'),
+    )
+
+    creator = models.ForeignKey(User, on_delete=models.CASCADE, related_name='uploads', null=False)
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    type = models.CharField(max_length=2, choices=UPLOAD_TYPES, null=False, blank=False)
+    filename = models.CharField(_('filename'), max_length=settings.UPLOAD_FILENAME_MAX_LENGTH, blank=False,
+                                null=False)
+    size = models.BigIntegerField(_('size'), null=False)
+    received_size = models.BigIntegerField(_('received size'), null=False, default=0)
+    is_finalized = models.BooleanField(_('is finalized'), default=False)
+    created = models.DateTimeField(editable=False, db_index=True)
+
+    @classmethod
+    def create_upload(cls, creator, type, filename, size):
+        if size > cls.get_max_size_for_type(type):
+            raise ValidationError(
+                _('The file is too big.'),
+            )
+
+        return cls.objects.create(creator=creator, type=type, filename=filename, size=size)
+
+    @classmethod
+    def create_upload_from_file(cls, creator, type, file):
+        """
+        Creates a finalized upload out of a file sent at once
+        """
+        upload = cls.create_upload(creator=creator, type=type, filename=os.path.basename(file.name),
+                                   size=file.size)
+
+        os.makedirs(settings.UPLOADS_DIRECTORY, exist_ok=True)
+
+        file.seek(0)
+        with open(upload.get_path(), 'wb') as upload_file:
+            shutil.copyfileobj(file, upload_file)
+
+        upload.received_size = upload.size
+        upload.is_finalized = True
+        upload.save()
+
+        return upload
+
+    @classmethod
+    def get_max_size_for_type(cls, type):
+        if type == cls.POST_VIDEO:
+            return settings.POST_VIDEO_UPLOAD_MAX_SIZE
+        return settings.IMPORT_ARCHIVE_UPLOAD_MAX_SIZE
+
+    @classmethod
+    def delete_expired_uploads(cls):
+        expired_uploads = cls.objects.filter(created__lt=timezone.now() - timedelta(seconds=settings.UPLOAD_EXPIRY))
+        return expired_uploads.delete()
+
+    def get_path(self):
+        return os.path.join(settings.UPLOADS_DIRECTORY, '%s.part' % self.uuid)
+
+    def append_chunk(self, offset, chunk_file, chunk_size):
+        """
+        Appends the chunk when it starts where the received part ends. Must be called with the upload row locked.
+        """
+        if self.is_finalized:
+            raise ValidationError(
+                _('The upload was already finalized.'),
+            )
+
+        if offset != self.received_size:
+            raise ValidationError(
+                _('The chunk must start at byte %(received_size)d.') % {'received_size': self.received_size},
+            )
+
+        if self.received_size + chunk_size > self.size:
+            raise ValidationError(
+                _('The chunk goes past the size of the upload.'),
+            )
+
+        os.makedirs(settings.UPLOADS_DIRECTORY, exist_ok=True)
+        path = self.get_path()
+
+        with open(path, 'r+b' if os.path.exists(path) else 'wb') as file:
+            # Drop whatever a failed chunk wrote past the received part
+            file.truncate(self.received_size)
+            file.seek(self.received_size)
+            shutil.copyfileobj(chunk_file, file)
+
+        self.received_size += chunk_size
+        self.save()
+
+    def finalize(self):
+        if self.is_finalized:
+            raise ValidationError(
+                _('The upload was already finalized.'),
+            )
+
+        if self.received_size != self.size:
+            raise ValidationError(
+                _('The upload is missing %(missing_size)d bytes.') % {
+                    'missing_size': self.size - self.received_size},
+            )
+
+        self.is_finalized = True
+        self.save()
+
+    def open_file(self):
+        return File(open(self.get_path(), 'rb'), name=self.filename)
+
+    def save(self, *args, **kwargs):
+        if not self.id:
+            self.created = timezone.now()
+        return super(Upload, self).save(*args, **kwargs)
+
+
+@receiver(post_delete, sender=Upload, dispatch_uid='delete_upload_file')
+def delete_upload_file(sender, instance=None, **kwargs):
+    """"
+    Delete the received part of the upload
+    """
+    path = instance.get_path()
+
+    def remove_upload_file():
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    transaction.on_commit(remove_upload_file)
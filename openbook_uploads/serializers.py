@@ -0,0 +1,64 @@
+import re
+
+from django.conf import settings
+from django.utils.translation import ugettext_lazy as _
+from rest_framework import serializers
+
+from openbook_uploads.models import Upload
+
+CONTENT_RANGE_REGEX = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+
+class CreateUploadSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=Upload.UPLOAD_TYPES)
+    filename = serializers.CharField(max_length=settings.UPLOAD_FILENAME_MAX_LENGTH, allow_blank=False)
+    size = serializers.IntegerField(min_value=1)
+
+
+class GetUploadSerializer(serializers.Serializer):
+    upload_uuid = serializers.UUIDField()
+
+
+class DeleteUploadSerializer(serializers.Serializer):
+    upload_uuid = serializers.UUIDField()
+
+
+class FinalizeUploadSerializer(serializers.Serializer):
+    upload_uuid = serializers.UUIDField()
+
+
+class AppendUploadChunkSerializer(serializers.Serializer):
+    upload_uuid = serializers.UUIDField()
+    content_range = serializers.CharField()
+
+    def validate_content_range(self, content_range):
+        """
+        Returns the first and last byte of the chunk out of a "bytes first-last/size" header
+        """
+        match = CONTENT_RANGE_REGEX.match(content_range)
+
+        if not match:
+            raise serializers.ValidationError(_('The Content-Range header must be bytes first-last/size.'))
+
+        first_byte, last_byte, size = (int(group) for group in match.groups())
+
+        if last_byte < first_byte or last_byte >= size:
+            raise serializers.ValidationError(_('The Content-Range header is not a valid range.'))
+
+        if last_byte - first_byte + 1 > settings.UPLOAD_CHUNK_MAX_SIZE:
+            raise serializers.ValidationError(_('The chunk is too big.'))
+
+        return first_byte, last_byte
+
+
+class GetUploadsUploadSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Upload
+        fields = (
+            'uuid',
+            'type',
+            'filename',
+            'size',
+            'received_size',
+            'is_finalized',
+        )
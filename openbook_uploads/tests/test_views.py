@@ -0,0 +1,223 @@
+import json
+import tempfile
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openbook_common.tests.helpers import make_user, make_authentication_headers_for_user
+from openbook_posts.models import Post
+from openbook_uploads.models import Upload
+
+
+@override_settings(UPLOADS_DIRECTORY=tempfile.mkdtemp())
+class UploadsAPITests(APITestCase):
+    """
+    UploadsAPI
+    """
+
+    def test_can_create_upload(self):
+        """
+        should be able to create an upload and return 201
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        response = self.client.put(self._get_url(), {
+            'type': Upload.POST_VIDEO,
+            'filename': 'video.mp4',
+            'size': 10
+        }, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response_upload = json.loads(response.content)
+
+        self.assertEqual(response_upload['received_size'], 0)
+        self.assertTrue(user.uploads.filter(uuid=response_upload['uuid'], size=10).exists())
+
+    def test_cant_create_upload_over_max_size(self):
+        """
+        should not be able to create an upload bigger than the max size of its type and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+
+        with self.settings(POST_VIDEO_UPLOAD_MAX_SIZE=5):
+            response = self.client.put(self._get_url(), {
+                'type': Upload.POST_VIDEO,
+                'filename': 'video.mp4',
+                'size': 10
+            }, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(user.uploads.exists())
+
+    def _get_url(self):
+        return reverse('resumable-uploads')
+
+
+@override_settings(UPLOADS_DIRECTORY=tempfile.mkdtemp())
+class UploadItemAPITests(APITestCase):
+    """
+    UploadItemAPI
+    """
+
+    def test_can_upload_in_chunks(self):
+        """
+        should be able to upload a file a chunk at a time and finalize it
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+        upload = user.create_upload(type=Upload.POST_VIDEO, filename='video.mp4', size=10)
+
+        url = self._get_url(upload=upload)
+
+        first_response = self.client.put(url, b'01234', content_type='application/octet-stream',
+                                         HTTP_CONTENT_RANGE='bytes 0-4/10', **headers)
+        second_response = self.client.put(url, b'56789', content_type='application/octet-stream',
+                                          HTTP_CONTENT_RANGE='bytes 5-9/10', **headers)
+
+        self.assertEqual(first_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(second_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(second_response.content)['received_size'], 10)
+
+        response = self.client.post(self._get_finalize_url(upload=upload), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        upload.refresh_from_db()
+
+        self.assertTrue(upload.is_finalized)
+
+        with upload.open_file() as upload_file:
+            self.assertEqual(upload_file.read(), b'0123456789')
+
+    def test_can_resume_upload_from_received_size(self):
+        """
+        should reject a chunk not starting at the received size and return it to resume from
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+        upload = user.create_upload(type=Upload.POST_VIDEO, filename='video.mp4', size=10)
+
+        url = self._get_url(upload=upload)
+
+        self.client.put(url, b'01234', content_type='application/octet-stream',
+                        HTTP_CONTENT_RANGE='bytes 0-4/10', **headers)
+
+        response = self.client.put(url, b'789', content_type='application/octet-stream',
+                                   HTTP_CONTENT_RANGE='bytes 7-9/10', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(url, **headers)
+
+        self.assertEqual(json.loads(response.content)['received_size'], 5)
+
+    def test_cant_upload_chunk_not_matching_content_range(self):
+        """
+        should not be able to upload a chunk whose size differs from its Content-Range and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+        upload = user.create_upload(type=Upload.POST_VIDEO, filename='video.mp4', size=10)
+
+        response = self.client.put(self._get_url(upload=upload), b'012', content_type='application/octet-stream',
+                                   HTTP_CONTENT_RANGE='bytes 0-4/10', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        upload.refresh_from_db()
+
+        self.assertEqual(upload.received_size, 0)
+
+    def test_cant_finalize_incomplete_upload(self):
+        """
+        should not be able to finalize an upload missing chunks and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+        upload = user.create_upload(type=Upload.POST_VIDEO, filename='video.mp4', size=10)
+
+        self.client.put(self._get_url(upload=upload), b'01234', content_type='application/octet-stream',
+                        HTTP_CONTENT_RANGE='bytes 0-4/10', **headers)
+
+        response = self.client.post(self._get_finalize_url(upload=upload), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        upload.refresh_from_db()
+
+        self.assertFalse(upload.is_finalized)
+
+    def test_cant_upload_to_foreign_upload(self):
+        """
+        should not be able to upload to the upload of another user and return 404
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+        upload = make_user().create_upload(type=Upload.POST_VIDEO, filename='video.mp4', size=10)
+
+        response = self.client.put(self._get_url(upload=upload), b'01234', content_type='application/octet-stream',
+                                   HTTP_CONTENT_RANGE='bytes 0-4/10', **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_can_create_post_with_uploaded_video(self):
+        """
+        should be able to create a video post out of a finalized upload and delete the upload
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+        upload = user.create_upload(type=Upload.POST_VIDEO, filename='video.mp4', size=10)
+
+        self.client.put(self._get_url(upload=upload), b'0123456789', content_type='application/octet-stream',
+                        HTTP_CONTENT_RANGE='bytes 0-9/10', **headers)
+        self.client.post(self._get_finalize_url(upload=upload), **headers)
+
+        response = self.client.put(reverse('posts'), {'video_upload_uuid': str(upload.uuid)}, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        post = Post.objects.get(pk=json.loads(response.content)['id'])
+
+        self.assertEqual(post.video.video.read(), b'0123456789')
+        self.assertFalse(Upload.objects.filter(pk=upload.pk).exists())
+
+    def test_cant_create_post_with_unfinalized_upload(self):
+        """
+        should not be able to create a video post out of an upload not finalized and return 400
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+        upload = user.create_upload(type=Upload.POST_VIDEO, filename='video.mp4', size=10)
+
+        response = self.client.put(reverse('posts'), {'video_upload_uuid': str(upload.uuid)}, **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(user.posts.exists())
+
+    def test_can_delete_upload(self):
+        """
+        should be able to delete an upload and return 200
+        """
+        user = make_user()
+        headers = make_authentication_headers_for_user(user)
+        upload = user.create_upload(type=Upload.POST_VIDEO, filename='video.mp4', size=10)
+
+        response = self.client.delete(self._get_url(upload=upload), **headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(Upload.objects.filter(pk=upload.pk).exists())
+
+    def _get_url(self, upload):
+        return reverse('resumable-upload', kwargs={
+            'upload_uuid': upload.uuid
+        })
+
+    def _get_finalize_url(self, upload):
+        return reverse('finalize-resumable-upload', kwargs={
+            'upload_uuid': upload.uuid
+        })
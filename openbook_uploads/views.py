@@ -0,0 +1,133 @@
+import tempfile
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.translation import ugettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from openbook_uploads.serializers import CreateUploadSerializer, GetUploadsUploadSerializer, GetUploadSerializer, \
+    DeleteUploadSerializer, AppendUploadChunkSerializer, FinalizeUploadSerializer
+
+UPLOAD_CHUNK_READ_SIZE = 64 * 1024
+
+
+class Uploads(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def put(self, request):
+        serializer = CreateUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+
+        type = data.get('type')
+        filename = data.get('filename')
+        size = data.get('size')
+
+        user = request.user
+
+        with transaction.atomic():
+            upload = user.create_upload(type=type, filename=filename, size=size)
+
+        response_serializer = GetUploadsUploadSerializer(upload, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
+
+class UploadItem(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request, upload_uuid):
+        serializer = GetUploadSerializer(data={'upload_uuid': upload_uuid})
+        serializer.is_valid(raise_exception=True)
+
+        user = request.user
+
+        upload = user.get_upload_with_uuid(upload_uuid=upload_uuid)
+
+        response_serializer = GetUploadsUploadSerializer(upload, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+    def put(self, request, upload_uuid):
+        """
+        Appends the request body to the upload, its Content-Range header must start where the received part ends
+        """
+        serializer = AppendUploadChunkSerializer(data={
+            'upload_uuid': upload_uuid,
+            'content_range': request.META.get('HTTP_CONTENT_RANGE')
+        })
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+
+        first_byte, last_byte = data.get('content_range')
+        chunk_size = last_byte - first_byte + 1
+
+        user = request.user
+
+        with self._read_chunk(request=request, chunk_size=chunk_size) as chunk_file:
+            with transaction.atomic():
+                upload = user.append_chunk_to_upload_with_uuid(upload_uuid=upload_uuid, offset=first_byte,
+                                                               chunk_file=chunk_file, chunk_size=chunk_size)
+
+        response_serializer = GetUploadsUploadSerializer(upload, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+    def delete(self, request, upload_uuid):
+        serializer = DeleteUploadSerializer(data={'upload_uuid': upload_uuid})
+        serializer.is_valid(raise_exception=True)
+
+        user = request.user
+
+        with transaction.atomic():
+            user.delete_upload_with_uuid(upload_uuid=upload_uuid)
+
+        return Response(status=status.HTTP_200_OK)
+
+    def _read_chunk(self, request, chunk_size):
+        """
+        Reads the body into a temporary file before any row gets locked, so a slow client doesn't hold the lock
+        """
+        chunk_file = tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+        stream = request.stream
+        read_size = 0
+
+        while stream is not None and read_size <= chunk_size:
+            data = stream.read(UPLOAD_CHUNK_READ_SIZE)
+            if not data:
+                break
+            chunk_file.write(data)
+            read_size += len(data)
+
+        if read_size != chunk_size:
+            chunk_file.close()
+            raise ValidationError(
+                _('The body does not match the Content-Range header.'),
+            )
+
+        chunk_file.seek(0)
+
+        return chunk_file
+
+
+class FinalizeUpload(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    def post(self, request, upload_uuid):
+        serializer = FinalizeUploadSerializer(data={'upload_uuid': upload_uuid})
+        serializer.is_valid(raise_exception=True)
+
+        user = request.user
+
+        with transaction.atomic():
+            upload = user.finalize_upload_with_uuid(upload_uuid=upload_uuid)
+
+        response_serializer = GetUploadsUploadSerializer(upload, context={"request": request})
+
+        return Response(response_serializer.data, status=status.HTTP_200_OK)